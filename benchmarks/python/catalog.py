@@ -0,0 +1,123 @@
+from datetime import date
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session
+
+from infrastructure.repositories.price_repository import SqlAlchemyPriceRepository
+
+from infrastructure.database.base import Base
+# Registers every table on Base.metadata
+from infrastructure.database import models  # noqa: F401
+
+# (name, MIC, currency, provider exchange code); the codes match the synthetic
+# replay archive so sync benchmarks resolve every ticker.
+EXCHANGES = [
+    ("NASDAQ", "XNAS", "USD", "NMS"),
+    ("NASDAQ Global Market", "XNGS", "USD", "NGM"),
+    ("New York Stock Exchange", "XNYS", "USD", "NYQ"),
+    ("London Stock Exchange", "XLON", "GBP", "LSE"),
+    ("Japan Exchange Group", "XJPX", "JPY", "JPX"),
+    ("Frankfurt Stock Exchange", "XFRA", "EUR", "FRA"),
+]
+
+# One in DUAL_LISTING_EVERY assets also trades on a second exchange.
+DUAL_LISTING_EVERY = 10
+
+def ensure_database(url: str) -> None:
+    """Creates the benchmark database if it does not exist yet."""
+    target = make_url(url)
+    admin = create_engine(target.set(database="postgres"), isolation_level="AUTOCOMMIT")
+    try:
+        with admin.connect() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": target.database}
+            ).scalar()
+            if not exists:
+                conn.execute(text(f'CREATE DATABASE "{target.database}"'))
+    finally:
+        admin.dispose()
+
+def reset_schema(engine: Engine) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+def seed_catalog(engine: Engine, assets: int) -> int:
+    """
+    Fills the catalog with `assets` assets and their listings, generated inside
+    Postgres so a million rows take seconds rather than an ORM round trip each.
+    Returns the number of listings.
+    """
+    with engine.begin() as conn:
+        for name, mic, currency, code in EXCHANGES:
+            conn.execute(
+                text("INSERT INTO exchanges (name, mic_code, currency, is_active) VALUES (:name, :mic, :currency, true)"),
+                {"name": name, "mic": mic, "currency": currency}
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO provider_exchange_mappings (provider, kind, code, mic_code) "
+                    "VALUES ('yfinance', 'EXCHANGE_CODE', :code, :mic)"
+                ),
+                {"code": code, "mic": mic}
+            )
+        conn.execute(
+            text(
+                "INSERT INTO assets (name, asset_class, isin, is_active) "
+                "SELECT 'Bench Asset ' || g, 'EQUITY', 'BN' || lpad(g::text, 10, '0'), true "
+                "FROM generate_series(1, :n) AS g"
+            ),
+            {"n": assets}
+        )
+        conn.execute(
+            text(
+                "INSERT INTO listings (asset_id, exchange_id, ticker, currency, is_active, synced_at) "
+                "SELECT a.id, 1 + a.id % :exchanges, 'BN' || a.id, 'USD', true, now() FROM assets a"
+            ),
+            {"exchanges": len(EXCHANGES)}
+        )
+        conn.execute(
+            text(
+                "INSERT INTO listings (asset_id, exchange_id, ticker, currency, is_active, synced_at) "
+                "SELECT a.id, 1 + (a.id + 1) % :exchanges, 'BN' || a.id, 'USD', true, now() "
+                "FROM assets a WHERE a.id % :every = 0"
+            ),
+            {"exchanges": len(EXCHANGES), "every": DUAL_LISTING_EVERY}
+        )
+        listings = conn.execute(text("SELECT count(*) FROM listings")).scalar()
+    # Fresh statistics, or the planner benchmarks a table it thinks is empty
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM ANALYZE"))
+    return listings
+
+def seed_prices(engine: Engine, listings: int, start: date, end: date) -> int:
+    """
+    Gives the first `listings` listings a weekday close for every day from start
+    to end, as random walks generated inside Postgres. Returns the number of bars.
+    """
+    with Session(engine) as session:
+        SqlAlchemyPriceRepository(session).ensure_partitions(start, end)
+    with engine.begin() as conn:
+        bars = conn.execute(
+            text(
+                "INSERT INTO listing_prices (listing_id, date, open, high, low, close, adj_close, volume) "
+                "SELECT listing_id, day, close, close, close, close, close, 1000 FROM ("
+                "  SELECT l.id AS listing_id, g.day::date AS day, "
+                "  100 * exp(sum(ln(1 + (random() - 0.5) / 50)) OVER (PARTITION BY l.id ORDER BY g.day)) AS close "
+                "  FROM (SELECT id FROM listings ORDER BY id LIMIT :listings) l "
+                "  CROSS JOIN generate_series(CAST(:start AS date), CAST(:end AS date), interval '1 day') AS g(day) "
+                "  WHERE extract(isodow FROM g.day) < 6"
+                ") walks"
+            ),
+            {"listings": listings, "start": start, "end": end}
+        ).rowcount
+        # Written around bulk_load, so the latest-price table is filled the way the migration seeds it
+        conn.execute(text(
+            "INSERT INTO listing_latest_prices (listing_id, date, close, adj_close) "
+            "SELECT DISTINCT ON (listing_id) listing_id, date, close, adj_close FROM listing_prices "
+            "ORDER BY listing_id, date DESC "
+            "ON CONFLICT (listing_id) DO UPDATE SET date = EXCLUDED.date, close = EXCLUDED.close, adj_close = EXCLUDED.adj_close"
+        ))
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM ANALYZE listing_prices"))
+    return bars
@@ -0,0 +1,117 @@
+import json
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    scale: int
+    iterations: int
+    # Operations per iteration, e.g. rows in a batch; ops_per_sec counts these
+    ops_per_iteration: int
+    min: float
+    median: float
+    p95: float
+    mean: float
+    ops_per_sec: float
+
+    @property
+    def key(self) -> Tuple[str, int]:
+        return (self.name, self.scale)
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+def measure(
+    name: str,
+    scale: int,
+    fn: Callable[[int], None],
+    iterations: int,
+    warmup: int = 1,
+    ops_per_iteration: int = 1
+) -> BenchmarkResult:
+    """
+    Times `fn(i)` for i in range(iterations) after `warmup` untimed calls.
+    The iteration index lets a benchmark vary its input (a different id, a fresh
+    batch) so repeated calls don't just measure a warm cache.
+    """
+    for i in range(warmup):
+        fn(-1 - i)
+    samples = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - started)
+    return BenchmarkResult(
+        name=name,
+        scale=scale,
+        iterations=iterations,
+        ops_per_iteration=ops_per_iteration,
+        min=min(samples),
+        median=statistics.median(samples),
+        p95=_percentile(samples, 0.95),
+        mean=statistics.fmean(samples),
+        ops_per_sec=iterations * ops_per_iteration / sum(samples) if sum(samples) else float("inf"),
+    )
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def write_results(path: str, results: List[BenchmarkResult], metadata: Dict) -> None:
+    document = {
+        "metadata": {
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            **metadata,
+        },
+        "results": [asdict(r) for r in results],
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    with open(path) as f:
+        return [BenchmarkResult(**r) for r in json.load(f)["results"]]
+
+def find_regressions(
+    baseline: List[BenchmarkResult],
+    current: List[BenchmarkResult],
+    max_regression: float
+) -> List[Tuple[BenchmarkResult, BenchmarkResult, float]]:
+    """
+    Benchmarks whose median got slower than the baseline by more than
+    `max_regression` (0.2 = 20%). Medians, not means: one GC pause or autovacuum
+    run should not fail a comparison.
+    """
+    previous = {r.key: r for r in baseline}
+    regressions = []
+    for result in current:
+        before = previous.get(result.key)
+        if before is None or before.median <= 0:
+            continue
+        change = result.median / before.median - 1
+        if change > max_regression:
+            regressions.append((before, result, change))
+    return regressions
+
+def format_table(results: List[BenchmarkResult]) -> str:
+    lines = [f"{'benchmark':<36} {'scale':>9} {'median ms':>10} {'p95 ms':>10} {'ops/s':>12}"]
+    for r in results:
+        lines.append(
+            f"{r.name:<36} {r.scale:>9} {r.median * 1000:>10.2f} {r.p95 * 1000:>10.2f} {r.ops_per_sec:>12.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,112 @@
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+# Benchmarks import the application like the scripts do
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../src/python"))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.database.base import get_db_url
+
+from catalog import ensure_database, reset_schema, seed_catalog, seed_prices
+from harness import find_regressions, format_table, load_results, write_results
+from suites import analytics_suite, api_suite, repository_suite, sync_suite
+
+logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger("benchmarks")
+logger.setLevel(logging.INFO)
+
+SUITES = ("repositories", "sync", "api", "analytics")
+
+# p95 read latency target from docs/TECHNICAL_REQUIREMENTS.md
+READ_P95_TARGET = 0.100
+# Analytics reads load years of bars per listing and get their own budget
+ANALYTICS_P95_TARGET = 1.0
+ANALYTICS_YEARS = 5
+
+def default_db_url() -> str:
+    # Never the application database: every scale starts by dropping all tables.
+    return str(make_url(get_db_url()).set(database=os.getenv("POSTGRES_BENCH_DB", "assetmanager_bench")))
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark repositories, sync and API reads against a seeded catalog.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="Catalog sizes (assets) to seed and benchmark")
+    parser.add_argument("--suites", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--sync-tickers", type=int, default=5_000, help="Tickers per end-to-end sync run")
+    parser.add_argument("--analytics-listings", type=int, default=500,
+                        help="Listings with price history, all read by each analytics request")
+    parser.add_argument("--db-url", default=default_db_url(), help="Database to benchmark in; it is wiped")
+    parser.add_argument("--output", default="benchmark-results.json", help="Where to write the JSON results")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="With --baseline, fail when a median is this much slower (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    ensure_database(args.db_url)
+    engine = create_engine(args.db_url)
+    sessions = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    results = []
+    for scale in args.scales:
+        started = time.monotonic()
+        reset_schema(engine)
+        listings = seed_catalog(engine, scale)
+        logger.info(f"Seeded {scale} assets and {listings} listings in {time.monotonic() - started:.1f}s")
+
+        # Reads first: the write benchmarks grow the catalog
+        if "api" in args.suites:
+            results.extend(api_suite(sessions, scale))
+        if "repositories" in args.suites:
+            results.extend(repository_suite(sessions, scale))
+        if "analytics" in args.suites:
+            end = date.today()
+            start = end - timedelta(days=365 * ANALYTICS_YEARS)
+            started = time.monotonic()
+            bars = seed_prices(engine, args.analytics_listings, start, end)
+            logger.info(f"Seeded {bars} bars in {time.monotonic() - started:.1f}s")
+            listing_ids = list(range(1, min(args.analytics_listings, listings) + 1))
+            results.extend(analytics_suite(sessions, scale, listing_ids, start, end))
+        if "sync" in args.suites:
+            results.extend(sync_suite(sessions, scale, args.sync_tickers))
+
+    with engine.connect() as conn:
+        postgres_version = conn.execute(text("SHOW server_version")).scalar()
+    engine.dispose()
+
+    write_results(args.output, results, {
+        "scales": args.scales,
+        "suites": args.suites,
+        "sync_tickers": args.sync_tickers,
+        "analytics_listings": args.analytics_listings,
+        "postgres": postgres_version,
+    })
+    print(format_table(results))
+    print(f"\nResults written to {args.output}")
+
+    slow_reads = [
+        r for r in results
+        if r.name.startswith("api.")
+        and r.p95 > (ANALYTICS_P95_TARGET if r.name.startswith("api.analytics.") else READ_P95_TARGET)
+    ]
+    for r in slow_reads:
+        print(f"p95 target missed: {r.name} at {r.scale} took {r.p95 * 1000:.1f}ms")
+
+    if args.baseline:
+        regressions = find_regressions(load_results(args.baseline), results, args.max_regression)
+        for before, after, change in regressions:
+            print(f"REGRESSION {after.name} at {after.scale}: median "
+                  f"{before.median * 1000:.2f}ms -> {after.median * 1000:.2f}ms (+{change:.0%})")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.max_regression:.0%} against {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
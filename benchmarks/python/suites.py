@@ -0,0 +1,213 @@
+import os
+import random
+import tempfile
+from datetime import date
+from typing import List
+
+from sqlalchemy.orm import sessionmaker
+
+from core.domain.asset import Asset
+from core.domain.enums import AssetClass
+from core.domain.listing import Listing
+from core.services.asset_sync_service import AssetSyncService, DEFAULT_SYNC_BATCH_SIZE
+from infrastructure.repositories.asset_repository import SqlAlchemyAssetRepository
+from infrastructure.repositories.exchange_repository import SqlAlchemyExchangeRepository
+from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
+from infrastructure.services.replay_market_data import ReplayMarketDataProvider, write_synthetic_archive
+
+from catalog import EXCHANGES
+from harness import BenchmarkResult, measure
+
+# Calls per point-lookup benchmark; enough samples for a stable p95
+LOOKUPS = 200
+BATCH = 500
+BATCH_GET_IDS = 2000
+BATCH_GET_REQUESTS = 20
+# Each analytics request reads hundreds of thousands of bars
+ANALYTICS_REQUESTS = 5
+
+def _full_scan_iterations(scale: int) -> int:
+    # Reading the whole catalog is the slow path under test; a few runs suffice at 1M
+    return 3 if scale >= 100_000 else 10
+
+def repository_suite(sessions: sessionmaker, scale: int) -> List[BenchmarkResult]:
+    rng = random.Random(scale)
+    results = []
+    session = sessions()
+    try:
+        assets = SqlAlchemyAssetRepository(session)
+        listings = SqlAlchemyListingRepository(session)
+
+        def upsert_existing(i):
+            n = rng.randint(1, scale)
+            assets.upsert(Asset(name=f"Bench Asset {n} (renamed {i})", asset_class=AssetClass.EQUITY, isin=f"BN{n:010d}"))
+        results.append(measure("asset.upsert.update", scale, upsert_existing, LOOKUPS))
+
+        def upsert_new(i):
+            assets.upsert(Asset(name=f"New Asset {i}", asset_class=AssetClass.EQUITY, isin=f"NW{scale + i + 10:010d}"))
+        results.append(measure("asset.upsert.insert", scale, upsert_new, LOOKUPS, warmup=0))
+
+        # Batches stay within the seeded IDs, so listings always find their asset
+        batch = min(BATCH, scale)
+
+        def upsert_many(i):
+            start = rng.randint(1, scale - batch + 1)
+            assets.upsert_many([
+                Asset(name=f"Bench Asset {n}", asset_class=AssetClass.EQUITY, isin=f"BN{n:010d}")
+                for n in range(start, start + batch)
+            ])
+        results.append(measure("asset.upsert_many", scale, upsert_many, 20, ops_per_iteration=batch))
+
+        def listing_upsert_many(i):
+            start = rng.randint(1, scale - batch + 1)
+            listings.upsert_many([
+                Listing(asset_id=n, exchange_id=1 + n % len(EXCHANGES), ticker=f"BN{n}", currency="USD")
+                for n in range(start, start + batch)
+            ])
+        results.append(measure("listing.upsert_many", scale, listing_upsert_many, 20, ops_per_iteration=batch))
+
+        results.append(measure(
+            "listing.get_by_asset_id", scale, lambda i: listings.get_by_asset_id(rng.randint(1, scale)), LOOKUPS
+        ))
+        results.append(measure(
+            "asset.list_all", scale, lambda i: assets.list_all(), _full_scan_iterations(scale),
+            ops_per_iteration=scale
+        ))
+        # Pages start at random depths; keyset pages should cost the same anywhere
+        results.append(measure(
+            "asset.list_page", scale, lambda i: assets.list_page(rng.randint(0, scale), 100), LOOKUPS,
+            ops_per_iteration=100
+        ))
+    finally:
+        session.close()
+    return results
+
+def sync_suite(sessions: sessionmaker, scale: int, tickers: int) -> List[BenchmarkResult]:
+    """
+    End-to-end `sync_assets` over a synthetic replay archive (no network, no
+    injected latency), against a catalog already holding `scale` assets. The
+    first run inserts, the second finds everything unchanged.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = os.path.join(tmp, "sync.jsonl.gz")
+        write_synthetic_archive(archive, tickers, seed=scale)
+        provider = ReplayMarketDataProvider(archive)
+        universe = provider.replay.tickers()
+
+        for name, incremental in (("sync.full", False), ("sync.incremental_unchanged", True)):
+            session = sessions()
+            try:
+                service = AssetSyncService(
+                    SqlAlchemyAssetRepository(session),
+                    SqlAlchemyExchangeRepository(session),
+                    SqlAlchemyListingRepository(session),
+                    provider
+                )
+                results.append(measure(
+                    name, scale,
+                    lambda i: service.sync_assets(universe, batch_size=DEFAULT_SYNC_BATCH_SIZE, incremental=incremental),
+                    iterations=1, warmup=0, ops_per_iteration=len(universe)
+                ))
+            finally:
+                session.close()
+    return results
+
+def analytics_suite(sessions: sessionmaker, scale: int, listing_ids: List[int], start: date, end: date) -> List[BenchmarkResult]:
+    """Analytics reads over many listings' full history; each request loads every bar in range."""
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+    from infrastructure.database.session import get_session
+
+    def override_get_session():
+        session = sessions()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    query = "&".join(f"listing_ids={i}" for i in listing_ids) + f"&start={start}&end={end}"
+    previous = app.dependency_overrides.get(get_session)
+    app.dependency_overrides[get_session] = override_get_session
+    results = []
+    try:
+        client = TestClient(app)
+
+        def get(path):
+            response = client.get(path)
+            response.raise_for_status()
+
+        for endpoint in ("correlation", "drawdowns"):
+            results.append(measure(
+                f"api.analytics.{endpoint}", scale, lambda i: get(f"/analytics/{endpoint}?{query}"), ANALYTICS_REQUESTS
+            ))
+    finally:
+        if previous is None:
+            app.dependency_overrides.pop(get_session, None)
+        else:
+            app.dependency_overrides[get_session] = previous
+    return results
+
+def api_suite(sessions: sessionmaker, scale: int) -> List[BenchmarkResult]:
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+    from api.pagination import encode_cursor
+    from infrastructure.database.session import get_session
+    from infrastructure.services.listing_resolve_cache import RESOLVE_CACHE
+
+    def override_get_session():
+        session = sessions()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    rng = random.Random(scale)
+    previous = app.dependency_overrides.get(get_session)
+    app.dependency_overrides[get_session] = override_get_session
+    results = []
+    try:
+        client = TestClient(app)
+
+        def get(path):
+            response = client.get(path)
+            response.raise_for_status()
+
+        results.append(measure("api.get_asset", scale, lambda i: get(f"/assets/{rng.randint(1, scale)}"), LOOKUPS))
+        results.append(measure(
+            "api.listings_by_asset", scale, lambda i: get(f"/listings/asset/{rng.randint(1, scale)}"), LOOKUPS
+        ))
+        results.append(measure("api.list_exchanges", scale, lambda i: get("/exchanges/"), LOOKUPS))
+        results.append(measure(
+            "api.list_assets_page", scale,
+            lambda i: get(f"/assets/?limit=100&cursor={encode_cursor(rng.randint(0, scale))}"), LOOKUPS
+        ))
+
+        def resolve(asset_id):
+            # Every asset's primary listing is ticker BN<id> on exchange 1 + id % len(EXCHANGES)
+            get(f"/listings/resolve?ticker=BN{asset_id}&mic={EXCHANGES[asset_id % len(EXCHANGES)][1]}")
+
+        def batch_get(ids):
+            response = client.post("/assets/batch-get", json={"ids": ids})
+            response.raise_for_status()
+
+        # Hydrating 2,000 positions: one batch instead of 2,000 GETs
+        results.append(measure(
+            "api.batch_get_assets", scale,
+            lambda i: batch_get([rng.randint(1, scale) for _ in range(BATCH_GET_IDS)]), BATCH_GET_REQUESTS,
+            ops_per_iteration=BATCH_GET_IDS
+        ))
+
+        RESOLVE_CACHE.clear()
+        results.append(measure("api.resolve_listing", scale, lambda i: resolve(rng.randint(1, scale)), LOOKUPS))
+        # A small hot set, as order flow repeats the same few tickers
+        hot = [rng.randint(1, scale) for _ in range(20)]
+        results.append(measure("api.resolve_listing_cached", scale, lambda i: resolve(hot[i % len(hot)]), LOOKUPS))
+    finally:
+        if previous is None:
+            app.dependency_overrides.pop(get_session, None)
+        else:
+            app.dependency_overrides[get_session] = previous
+    return results
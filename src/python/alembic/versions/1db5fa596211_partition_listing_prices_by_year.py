@@ -0,0 +1,82 @@
+"""partition listing prices by year
+
+Revision ID: 1db5fa596211
+Revises: 80747acf2642
+Create Date: 2026-10-18 01:36:28.410436
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1db5fa596211'
+down_revision: Union[str, Sequence[str], None] = '80747acf2642'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_listing_prices(**kwargs) -> None:
+    op.create_table(
+        'listing_prices',
+        sa.Column('listing_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('open', sa.Numeric(20, 6), nullable=False),
+        sa.Column('high', sa.Numeric(20, 6), nullable=False),
+        sa.Column('low', sa.Numeric(20, 6), nullable=False),
+        sa.Column('close', sa.Numeric(20, 6), nullable=False),
+        sa.Column('adj_close', sa.Numeric(20, 6), nullable=True),
+        sa.Column('volume', sa.BigInteger(), nullable=True),
+        sa.CheckConstraint('low <= high', name='check_price_low_high'),
+        sa.CheckConstraint('low >= 0', name='check_price_non_negative'),
+        sa.CheckConstraint('volume IS NULL OR volume >= 0', name='check_price_volume'),
+        sa.ForeignKeyConstraint(['listing_id'], ['listings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('listing_id', 'date'),
+        **kwargs
+    )
+
+
+def _set_aside_listing_prices(name: str) -> None:
+    # The primary key index name is schema-wide; free it for the new table
+    op.rename_table('listing_prices', name)
+    op.execute(f"ALTER TABLE {name} RENAME CONSTRAINT listing_prices_pkey TO {name}_pkey")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _set_aside_listing_prices('listing_prices_unpartitioned')
+    _create_listing_prices(postgresql_partition_by='RANGE (date)')
+    op.execute("CREATE TABLE listing_prices_default PARTITION OF listing_prices DEFAULT")
+    # A partition per year with data, through next year
+    op.execute("""
+        DO $$
+        DECLARE
+            y int;
+        BEGIN
+            FOR y IN SELECT generate_series(
+                COALESCE((SELECT min(date_part('year', date))::int FROM listing_prices_unpartitioned),
+                         date_part('year', current_date)::int),
+                GREATEST((SELECT max(date_part('year', date))::int FROM listing_prices_unpartitioned),
+                         date_part('year', current_date)::int + 1)
+            ) LOOP
+                EXECUTE format(
+                    'CREATE TABLE listing_prices_y%s PARTITION OF listing_prices FOR VALUES FROM (%L) TO (%L)',
+                    y, make_date(y, 1, 1), make_date(y + 1, 1, 1)
+                );
+            END LOOP;
+        END $$
+    """)
+    op.create_index('ix_listing_prices_date_brin', 'listing_prices', ['date'], postgresql_using='brin')
+    op.execute("INSERT INTO listing_prices SELECT * FROM listing_prices_unpartitioned")
+    op.drop_table('listing_prices_unpartitioned')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Detached partitions are not attached anymore and are left as they are
+    _set_aside_listing_prices('listing_prices_partitioned')
+    _create_listing_prices()
+    op.execute("INSERT INTO listing_prices SELECT * FROM listing_prices_partitioned")
+    op.drop_table('listing_prices_partitioned')
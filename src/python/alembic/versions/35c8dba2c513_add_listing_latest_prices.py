@@ -0,0 +1,43 @@
+"""add listing latest prices
+
+Revision ID: 35c8dba2c513
+Revises: 865060337ff0
+Create Date: 2026-10-18 01:52:47.139840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '35c8dba2c513'
+down_revision: Union[str, Sequence[str], None] = '865060337ff0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'listing_latest_prices',
+        sa.Column('listing_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('close', sa.Numeric(20, 6), nullable=False),
+        sa.Column('adj_close', sa.Numeric(20, 6), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['listing_id'], ['listings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('listing_id')
+    )
+    # Seed from the history already loaded; bulk loads keep it current from here on
+    op.execute(
+        "INSERT INTO listing_latest_prices (listing_id, date, close, adj_close) "
+        "SELECT DISTINCT ON (listing_id) listing_id, date, close, adj_close FROM listing_prices "
+        "ORDER BY listing_id, date DESC"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('listing_latest_prices')
@@ -0,0 +1,39 @@
+"""add asset search indexes
+
+Revision ID: 37f508193ee2
+Revises: 35c8dba2c513
+Create Date: 2026-10-18 02:02:33.251147
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '37f508193ee2'
+down_revision: Union[str, Sequence[str], None] = '35c8dba2c513'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Part of Postgres' contrib modules, included in the official images
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_assets_name_trgm', 'assets', ['name'], postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_listings_ticker_trgm', 'listings', ['ticker'], postgresql_using='gin', postgresql_ops={'ticker': 'gin_trgm_ops'})
+    op.create_index('ix_assets_asset_class_id', 'assets', ['asset_class', 'id'])
+    op.create_index('ix_listings_asset_id', 'listings', ['asset_id'])
+    op.create_index('ix_listings_exchange_id', 'listings', ['exchange_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_listings_exchange_id', table_name='listings')
+    op.drop_index('ix_listings_asset_id', table_name='listings')
+    op.drop_index('ix_assets_asset_class_id', table_name='assets')
+    op.drop_index('ix_listings_ticker_trgm', table_name='listings')
+    op.drop_index('ix_assets_name_trgm', table_name='assets')
+    # The extension stays installed, since other objects in the database may use it
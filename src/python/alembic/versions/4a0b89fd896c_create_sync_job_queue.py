@@ -0,0 +1,66 @@
+"""create sync job queue
+
+Revision ID: 4a0b89fd896c
+Revises: c67e8b1898fd
+Create Date: 2026-10-18 11:03:27.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a0b89fd896c'
+down_revision: Union[str, Sequence[str], None] = 'c67e8b1898fd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+syncjobstatus_enum = sa.Enum('PENDING', 'RUNNING', 'SUCCEEDED', 'FAILED', name='syncjobstatus')
+syncitemstatus_enum = sa.Enum('PENDING', 'SYNCED', 'SKIPPED', 'FAILED', name='syncitemstatus')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'sync_jobs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('status', syncjobstatus_enum, nullable=False),
+        sa.Column('incremental', sa.Boolean(), nullable=False),
+        sa.Column('fresh_within_minutes', sa.Integer(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('worker_id', sa.String(length=255), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('summary', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint('attempts >= 0', name='check_sync_job_attempts'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_sync_jobs_status_id', 'sync_jobs', ['status', 'id'])
+
+    op.create_table(
+        'sync_job_items',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('ticker', sa.String(length=20), nullable=False),
+        sa.Column('status', syncitemstatus_enum, nullable=False),
+        sa.Column('message', sa.Text(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.CheckConstraint('length(ticker) > 0', name='check_sync_item_ticker_length'),
+        sa.ForeignKeyConstraint(['job_id'], ['sync_jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('job_id', 'ticker', name='uq_sync_job_item_ticker'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('sync_job_items')
+    op.drop_index('ix_sync_jobs_status_id', table_name='sync_jobs')
+    op.drop_table('sync_jobs')
+    syncitemstatus_enum.drop(op.get_bind(), checkfirst=True)
+    syncjobstatus_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,43 @@
+"""create listing prices
+
+Revision ID: 80747acf2642
+Revises: eb7bb2a27248
+Create Date: 2026-10-18 01:32:51.791263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '80747acf2642'
+down_revision: Union[str, Sequence[str], None] = 'eb7bb2a27248'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'listing_prices',
+        sa.Column('listing_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('open', sa.Numeric(20, 6), nullable=False),
+        sa.Column('high', sa.Numeric(20, 6), nullable=False),
+        sa.Column('low', sa.Numeric(20, 6), nullable=False),
+        sa.Column('close', sa.Numeric(20, 6), nullable=False),
+        sa.Column('adj_close', sa.Numeric(20, 6), nullable=True),
+        sa.Column('volume', sa.BigInteger(), nullable=True),
+        sa.CheckConstraint('low <= high', name='check_price_low_high'),
+        sa.CheckConstraint('low >= 0', name='check_price_non_negative'),
+        sa.CheckConstraint('volume IS NULL OR volume >= 0', name='check_price_volume'),
+        sa.ForeignKeyConstraint(['listing_id'], ['listings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('listing_id', 'date')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('listing_prices')
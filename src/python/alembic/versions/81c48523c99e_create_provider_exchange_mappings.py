@@ -0,0 +1,59 @@
+"""create provider exchange mappings
+
+Revision ID: 81c48523c99e
+Revises: 4a0b89fd896c
+Create Date: 2026-10-18 01:18:06.702627
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '81c48523c99e'
+down_revision: Union[str, Sequence[str], None] = '4a0b89fd896c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+
+exchangecodekind_enum = sa.Enum('EXCHANGE_CODE', 'TICKER_SUFFIX', name='exchangecodekind')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    mappings = op.create_table(
+        'provider_exchange_mappings',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('provider', sa.String(length=50), nullable=False),
+        sa.Column('kind', exchangecodekind_enum, nullable=False),
+        sa.Column('code', sa.String(length=20), nullable=False),
+        sa.Column('mic_code', sa.String(length=20), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.CheckConstraint('length(code) > 0', name='check_mapping_code_length'),
+        sa.CheckConstraint('length(mic_code) > 0', name='check_mapping_mic_code_length'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('provider', 'kind', 'code', name='uq_provider_exchange_mapping'),
+    )
+
+    # The codes previously hard-coded in the sync service, so resolution keeps
+    # working before the seed script has run.
+    op.bulk_insert(mappings, [
+        {'provider': 'yfinance', 'kind': 'EXCHANGE_CODE', 'code': code, 'mic_code': mic}
+        for code, mic in [
+            ('NMS', 'XNAS'),
+            ('NGM', 'XNAS'),
+            ('NCM', 'XNAS'),
+            ('NYQ', 'XNYS'),
+            ('LSE', 'XLON'),
+        ]
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('provider_exchange_mappings')
+    exchangecodekind_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,49 @@
+"""create portfolios and holdings
+
+Revision ID: 865060337ff0
+Revises: 1db5fa596211
+Create Date: 2026-10-18 01:47:45.307511
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '865060337ff0'
+down_revision: Union[str, Sequence[str], None] = '1db5fa596211'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'portfolios',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.CheckConstraint('length(name) > 0', name='check_portfolio_name_length'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'portfolio_holdings',
+        sa.Column('portfolio_id', sa.Integer(), nullable=False),
+        sa.Column('listing_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Numeric(28, 10), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.CheckConstraint('quantity <> 0', name='check_holding_quantity'),
+        sa.ForeignKeyConstraint(['portfolio_id'], ['portfolios.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['listing_id'], ['listings.id']),
+        sa.PrimaryKeyConstraint('portfolio_id', 'listing_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('portfolio_holdings')
+    op.drop_table('portfolios')
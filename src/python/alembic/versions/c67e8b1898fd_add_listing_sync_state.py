@@ -0,0 +1,33 @@
+"""add listing sync state
+
+Revision ID: c67e8b1898fd
+Revises: e90ea3ad86de
+Create Date: 2026-10-18 09:12:44.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c67e8b1898fd'
+down_revision: Union[str, Sequence[str], None] = 'e90ea3ad86de'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # content_hash lets incremental syncs skip rows whose market data did not change.
+    # synced_at is deliberately not indexed: touching it on unchanged rows then
+    # stays a HOT update and causes no index churn.
+    op.add_column('listings', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('listings', sa.Column('synced_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('listings', 'synced_at')
+    op.drop_column('listings', 'content_hash')
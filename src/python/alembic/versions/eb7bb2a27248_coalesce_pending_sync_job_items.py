@@ -0,0 +1,44 @@
+"""coalesce pending sync job items
+
+Revision ID: eb7bb2a27248
+Revises: 81c48523c99e
+Create Date: 2026-10-18 01:26:34.186189
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'eb7bb2a27248'
+down_revision: Union[str, Sequence[str], None] = '81c48523c99e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Failed jobs used to leave their unprocessed items pending; those would now
+    # hold their tickers' single-flight slot forever.
+    op.execute(
+        "UPDATE sync_job_items SET status = 'FAILED', message = sync_jobs.error "
+        "FROM sync_jobs WHERE sync_jobs.id = sync_job_items.job_id "
+        "AND sync_jobs.status = 'FAILED' AND sync_job_items.status = 'PENDING'"
+    )
+    # Keep the oldest pending item per ticker; the job that would run it first.
+    op.execute(
+        "UPDATE sync_job_items SET status = 'SKIPPED', message = 'Coalesced into an earlier job' "
+        "WHERE status = 'PENDING' AND id NOT IN "
+        "(SELECT min(id) FROM sync_job_items WHERE status = 'PENDING' GROUP BY ticker)"
+    )
+    op.create_index(
+        'uq_sync_job_items_pending_ticker', 'sync_job_items', ['ticker'], unique=True,
+        postgresql_where=sa.text("status = 'PENDING'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_sync_job_items_pending_ticker', table_name='sync_job_items')
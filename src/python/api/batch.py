@@ -0,0 +1,18 @@
+from typing import Callable, List, TypeVar
+
+# One array parameter carries the IDs, so the cap is about response size
+MAX_BATCH_IDS = 5000
+
+T = TypeVar("T")
+
+def batch_get(fetch: Callable[[List[int]], List[T]], ids: List[int]) -> dict:
+    """
+    Fetches the given IDs with one call to fetch. Items come back in request
+    order with duplicates dropped; IDs that were not found are listed in missing.
+    """
+    requested = list(dict.fromkeys(ids))
+    found = {item.id: item for item in fetch(requested)}
+    return {
+        "items": [found[i] for i in requested if i in found],
+        "missing": [i for i in requested if i not in found],
+    }
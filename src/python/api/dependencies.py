@@ -8,6 +8,12 @@ from core.repositories.exchange_repository import ExchangeRepository
 from infrastructure.repositories.exchange_repository import SqlAlchemyExchangeRepository
 from core.repositories.listing_repository import ListingRepository
 from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
+from core.repositories.portfolio_repository import PortfolioRepository
+from infrastructure.repositories.portfolio_repository import SqlAlchemyPortfolioRepository
+from core.repositories.price_repository import PriceRepository
+from infrastructure.repositories.price_repository import SqlAlchemyPriceRepository
+from core.repositories.sync_job_repository import SyncJobRepository
+from infrastructure.repositories.sync_job_repository import SqlAlchemySyncJobRepository
 
 def get_asset_repository(session: Session = Depends(get_session)) -> AssetRepository:
     return SqlAlchemyAssetRepository(session)
@@ -17,3 +23,12 @@ def get_exchange_repository(session: Session = Depends(get_session)) -> Exchange
 
 def get_listing_repository(session: Session = Depends(get_session)) -> ListingRepository:
     return SqlAlchemyListingRepository(session)
+
+def get_sync_job_repository(session: Session = Depends(get_session)) -> SyncJobRepository:
+    return SqlAlchemySyncJobRepository(session)
+
+def get_price_repository(session: Session = Depends(get_session)) -> PriceRepository:
+    return SqlAlchemyPriceRepository(session)
+
+def get_portfolio_repository(session: Session = Depends(get_session)) -> PortfolioRepository:
+    return SqlAlchemyPortfolioRepository(session)
@@ -1,18 +1,62 @@
-from fastapi import FastAPI
+import asyncio
+import contextlib
+import time
 
-from api.routers import assets, exchanges, listings, admin
+from fastapi import FastAPI, Request, Response
+
+from api.routers import assets, exchanges, listings, admin, analytics, exports, portfolios
+from api.sync_jobs import run_sync_jobs, sync_jobs_in_api_enabled
+from core.services.metrics import CONTENT_TYPE, HTTP_REQUEST_SECONDS, REGISTRY
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Queued syncs normally run in scripts/sync_worker.py; SYNC_JOBS_IN_API=1
+    # also works the queue from this process's event loop.
+    sync_task = asyncio.create_task(run_sync_jobs()) if sync_jobs_in_api_enabled() else None
+    yield
+    if sync_task is not None:
+        sync_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sync_task
 
 app = FastAPI(
     title="Asset Manager API",
     description="API for managing financial assets",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.include_router(assets.router)
 app.include_router(exchanges.router)
 app.include_router(listings.router)
+app.include_router(analytics.router)
+app.include_router(portfolios.router)
+app.include_router(exports.router)
 app.include_router(admin.router, prefix="/admin", tags=["Admin"])
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by route template ('/assets/{asset_id}'), not the raw path, so
+        # the number of series stays bounded by the number of routes.
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=getattr(route, "path", "<unmatched>"),
+            status=str(status)
+        )
+
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
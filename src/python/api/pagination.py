@@ -0,0 +1,53 @@
+import base64
+import json
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException, Query
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+T = TypeVar("T")
+
+class PageParams:
+    """Query parameters of a keyset-paginated list endpoint."""
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Items per page"),
+        cursor: Optional[str] = Query(None, description="next_cursor of the previous page")
+    ):
+        self.limit = limit
+        self.after_id, self.after_score = decode_cursor(cursor) if cursor else (None, None)
+
+def encode_cursor(last_id: int, score: Optional[float] = None) -> str:
+    # Opaque to clients, so the key can change without breaking them
+    key = {"after": last_id} if score is None else {"after": last_id, "score": score}
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[int, Optional[float]]:
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        after, score = key["after"], key.get("score")
+    except (ValueError, TypeError, KeyError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(after, int) or isinstance(after, bool):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if score is not None and (not isinstance(score, (int, float)) or isinstance(score, bool)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return after, score
+
+def paginate(
+    fetch: Callable[[int], List[T]],
+    params: PageParams,
+    cursor_for: Callable[[T], str] = lambda item: encode_cursor(item.id)
+) -> dict:
+    """
+    Fetches one page by calling fetch with a row limit. One extra row is asked
+    for to tell whether another page follows, so the last page has no cursor.
+    """
+    items = fetch(params.limit + 1)
+    if len(items) <= params.limit:
+        return {"items": items, "next_cursor": None}
+    items = items[:params.limit]
+    return {"items": items, "next_cursor": cursor_for(items[-1])}
@@ -1,59 +1,85 @@
-from typing import List
-from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException
-from sqlalchemy.orm import Session
-from pydantic import BaseModel
-
-from infrastructure.database.session import get_session
-from infrastructure.repositories.asset_repository import SqlAlchemyAssetRepository
-from infrastructure.repositories.exchange_repository import SqlAlchemyExchangeRepository
-from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
-from infrastructure.services.market_data_service import YFinanceMarketDataProvider
-from core.services.asset_sync_service import AssetSyncService
+from collections import Counter
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field, constr
+
+from api.dependencies import get_sync_job_repository
+from api.schemas.sync_jobs import SyncJobResponse
+from core.domain.enums import SyncItemStatus
+from core.domain.sync_job import SyncJob
+from core.repositories.sync_job_repository import SyncJobRepository
 
 router = APIRouter()
 
 class SyncRequest(BaseModel):
-    tickers: List[str]
-
-def get_sync_service(session: Session = Depends(get_session)) -> AssetSyncService:
-    asset_repo = SqlAlchemyAssetRepository(session)
-    exchange_repo = SqlAlchemyExchangeRepository(session)
-    listing_repo = SqlAlchemyListingRepository(session)
-    market_data = YFinanceMarketDataProvider()
-    return AssetSyncService(asset_repo, exchange_repo, listing_repo, market_data)
-
-# Helper function to run sync in background with its own session management if needed,
-# but since BackgroundTasks runs in the same process, we need to be careful with session scope.
-# FastAPI dependency injection sessions are closed after the request.
-# So we should probably instantiate a fresh service/session inside the background task wrapper.
-
-def run_sync_task(tickers: List[str]):
-    # Create a new session for the background task
-    session_gen = get_session()
-    session = next(session_gen)
-    try:
-        asset_repo = SqlAlchemyAssetRepository(session)
-        exchange_repo = SqlAlchemyExchangeRepository(session)
-        listing_repo = SqlAlchemyListingRepository(session)
-        market_data = YFinanceMarketDataProvider()
-        service = AssetSyncService(asset_repo, exchange_repo, listing_repo, market_data)
-
-        service.sync_assets(tickers)
-    except Exception as e:
-        print(f"Background sync failed: {e}")
-    finally:
-        session.close()
+    # Bounded by sync_job_items.ticker, a String(20)
+    tickers: List[constr(min_length=1, max_length=20)]
+    incremental: bool = Field(False, description="Only write listings whose market data changed")
+    fresh_within_minutes: Optional[int] = Field(
+        None, ge=1, description="With incremental, skip tickers synced within this many minutes"
+    )
+
+# Syncs run in separate worker processes (scripts/sync_worker.py) that claim jobs
+# from the sync_jobs table. The API only enqueues, so a large sync neither steals
+# CPU from request handling nor disappears when the API restarts.
 
 @router.post("/sync", status_code=202)
 def trigger_sync(
     request: SyncRequest,
-    background_tasks: BackgroundTasks
+    repository: SyncJobRepository = Depends(get_sync_job_repository)
 ):
     """
-    Triggers an asynchronous sync of assets for the provided tickers.
+    Queues a sync of assets for the provided tickers and returns the job id.
+    Tickers already pending in another job with the same or stronger options
+    are not queued again: they are coalesced into that job, whose id is listed
+    in `coalesced_into`.
     """
     if not request.tickers:
         raise HTTPException(status_code=400, detail="No tickers provided")
 
-    background_tasks.add_task(run_sync_task, request.tickers)
-    return {"message": f"Sync triggered for {len(request.tickers)} tickers"}
+    result = repository.enqueue(SyncJob(
+        tickers=request.tickers,
+        incremental=request.incremental,
+        fresh_within_minutes=request.fresh_within_minutes
+    ))
+    scheduled = len(result.job.tickers) if result.job else 0
+    # Duplicates within the request count as coalesced too
+    coalesced = len(request.tickers) - scheduled
+    return {
+        "job_id": result.job.id if result.job else None,
+        "status": result.job.status if result.job else None,
+        "scheduled": scheduled,
+        "coalesced": coalesced,
+        "coalesced_into": sorted({job_id for job_id in result.coalesced.values() if job_id is not None}),
+        "message": f"Sync queued for {scheduled} tickers, {coalesced} already pending"
+    }
+
+@router.get("/sync/{job_id}", response_model=SyncJobResponse)
+def read_sync_job(
+    job_id: int,
+    repository: SyncJobRepository = Depends(get_sync_job_repository)
+):
+    """
+    Returns the status of a sync job with per-ticker progress.
+    """
+    job = repository.get_by_id(job_id, with_items=True)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Sync job not found")
+
+    counts = Counter(item.status for item in job.items)
+    return SyncJobResponse(
+        id=job.id,
+        status=job.status,
+        incremental=job.incremental,
+        fresh_within_minutes=job.fresh_within_minutes,
+        attempts=job.attempts,
+        worker_id=job.worker_id,
+        error=job.error,
+        summary=job.summary,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        heartbeat_at=job.heartbeat_at,
+        finished_at=job.finished_at,
+        progress={status: counts.get(status, 0) for status in SyncItemStatus},
+        items=[item.__dict__ for item in job.items]
+    )
@@ -0,0 +1,123 @@
+from datetime import date
+from typing import List, Optional
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from api.dependencies import get_listing_repository, get_price_repository
+from api.schemas.analytics import CorrelationResponse, DrawdownsResponse, ReturnsResponse, VolatilityResponse
+from core.domain.price_matrix import PriceMatrix
+from core.repositories.listing_repository import ListingRepository
+from core.repositories.price_repository import PriceRepository
+from core.services.price_analytics import (
+    correlation_matrix,
+    daily_returns,
+    drawdowns,
+    rolling_volatility,
+    summarize_returns,
+)
+
+MAX_LISTINGS_PER_REQUEST = 1000
+
+router = APIRouter(
+    prefix="/analytics",
+    tags=["analytics"],
+    responses={404: {"description": "Not found"}},
+)
+
+def load_prices(
+    listing_ids: List[int] = Query(..., description="Repeat per listing: ?listing_ids=1&listing_ids=2"),
+    start: date = Query(...),
+    end: Optional[date] = Query(None, description="Defaults to today"),
+    listing_repository: ListingRepository = Depends(get_listing_repository),
+    price_repository: PriceRepository = Depends(get_price_repository)
+) -> PriceMatrix:
+    end = end or date.today()
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    listing_ids = list(dict.fromkeys(listing_ids))
+    if len(listing_ids) > MAX_LISTINGS_PER_REQUEST:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_LISTINGS_PER_REQUEST} listings per request")
+    missing = set(listing_ids) - {listing.id for listing in listing_repository.get_by_ids(listing_ids)}
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Listings not found: {sorted(missing)}")
+    return price_repository.get_close_matrix(listing_ids, start, end)
+
+def _nullable(values: np.ndarray) -> list:
+    # NaN is not valid JSON; converting the whole array at once keeps this off the per-value path
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
+
+def _dates(dates: np.ndarray) -> list:
+    return dates.astype(object).tolist()
+
+def _date_at(dates: np.ndarray, row: int) -> Optional[date]:
+    return dates[row].astype(object) if row >= 0 else None
+
+@router.get("/returns", response_model=ReturnsResponse)
+def read_returns(prices: PriceMatrix = Depends(load_prices)):
+    returns = daily_returns(prices.closes)
+    summary = summarize_returns(prices.dates, prices.closes, returns)
+    total, annualized, volatility = (
+        _nullable(summary.total_return), _nullable(summary.annualized_return), _nullable(summary.annualized_volatility)
+    )
+    return {
+        "dates": _dates(prices.dates[1:]),
+        "series": [
+            {
+                "listing_id": listing_id,
+                "total_return": total[i],
+                "annualized_return": annualized[i],
+                "annualized_volatility": volatility[i],
+                "returns": column,
+            }
+            for i, (listing_id, column) in enumerate(zip(prices.listing_ids, _nullable(returns.T)))
+        ],
+    }
+
+@router.get("/volatility", response_model=VolatilityResponse)
+def read_volatility(
+    window: int = Query(21, ge=2, le=756, description="Rolling window in rows of the shared calendar"),
+    min_periods: Optional[int] = Query(
+        None, ge=2, description="Returns required in a window; defaults to 80% of it, so other venues' holidays don't blank it"
+    ),
+    prices: PriceMatrix = Depends(load_prices)
+):
+    volatility = rolling_volatility(
+        daily_returns(prices.closes), window, min_periods if min_periods is not None else max(2, window * 4 // 5)
+    )
+    return {
+        "window": window,
+        "dates": _dates(prices.dates[1:]),
+        "series": [
+            {"listing_id": listing_id, "volatility": column}
+            for listing_id, column in zip(prices.listing_ids, _nullable(volatility.T))
+        ],
+    }
+
+@router.get("/drawdowns", response_model=DrawdownsResponse)
+def read_drawdowns(prices: PriceMatrix = Depends(load_prices)):
+    result = drawdowns(prices.closes)
+    max_drawdown = _nullable(result.max_drawdown)
+    return {
+        "dates": _dates(prices.dates),
+        "series": [
+            {
+                "listing_id": listing_id,
+                "max_drawdown": max_drawdown[i],
+                "peak_date": _date_at(prices.dates, result.peak_rows[i]),
+                "trough_date": _date_at(prices.dates, result.trough_rows[i]),
+                "drawdown": column,
+            }
+            for i, (listing_id, column) in enumerate(zip(prices.listing_ids, _nullable(result.drawdown.T)))
+        ],
+    }
+
+@router.get("/correlation", response_model=CorrelationResponse)
+def read_correlation(
+    min_periods: int = Query(20, ge=2, description="Shared returns a pair needs before it gets a value"),
+    prices: PriceMatrix = Depends(load_prices)
+):
+    matrix = correlation_matrix(daily_returns(prices.closes), min_periods)
+    return {"listing_ids": prices.listing_ids, "matrix": _nullable(matrix)}
@@ -1,9 +1,14 @@
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from api.schemas.assets import AssetCreate, AssetResponse
-from core.domain.asset import Asset
+from api.batch import batch_get
+from api.pagination import PageParams, encode_cursor, paginate
+from api.schemas.batch import BatchGetRequest, BatchGetResponse
+from api.schemas.pagination import Page
+from api.schemas.assets import AssetCreate, AssetMatchResponse, AssetResponse
+from core.domain.asset import Asset, AssetFilter
+from core.domain.enums import AssetClass
 from core.repositories.asset_repository import AssetRepository
 from api.dependencies import get_asset_repository
 
@@ -28,6 +33,43 @@ def create_asset(
     created_asset = repository.create(domain_asset)
     return created_asset
 
+def asset_filters(
+    asset_class: Optional[AssetClass] = Query(None, description="Only assets of this class"),
+    is_active: Optional[bool] = Query(None, description="Only active or only inactive assets"),
+    mic_code: Optional[str] = Query(None, description="Only assets listed on this exchange"),
+    currency: Optional[str] = Query(None, description="Only assets with a listing in this currency")
+) -> AssetFilter:
+    return AssetFilter(asset_class=asset_class, is_active=is_active, mic_code=mic_code, currency=currency)
+
+# Declared before /{asset_id}, which would otherwise claim the path
+@router.get("/search", response_model=Page[AssetMatchResponse])
+def search_assets(
+    q: str = Query(..., min_length=2, max_length=100, description="Part of an asset name or ticker; typos are tolerated"),
+    filters: AssetFilter = Depends(asset_filters),
+    page: PageParams = Depends(),
+    repository: AssetRepository = Depends(get_asset_repository)
+):
+    after = None
+    if page.after_id is not None:
+        if page.after_score is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        after = (page.after_score, page.after_id)
+    result = paginate(
+        lambda limit: repository.search(q, limit, filters, after),
+        page,
+        cursor_for=lambda match: encode_cursor(match.asset.id, match.score)
+    )
+    result["items"] = [{**vars(match.asset), "score": match.score} for match in result["items"]]
+    return result
+
+@router.post("/batch-get", response_model=BatchGetResponse[AssetResponse])
+def batch_get_assets(
+    request: BatchGetRequest,
+    repository: AssetRepository = Depends(get_asset_repository)
+):
+    # One query for the lot instead of a request (and session) per ID
+    return batch_get(repository.get_by_ids, request.ids)
+
 @router.get("/{asset_id}", response_model=AssetResponse)
 def read_asset(
     asset_id: int,
@@ -38,9 +80,10 @@ def read_asset(
         raise HTTPException(status_code=404, detail="Asset not found")
     return asset
 
-@router.get("/", response_model=List[AssetResponse])
+@router.get("/", response_model=Page[AssetResponse])
 def list_assets(
+    filters: AssetFilter = Depends(asset_filters),
+    page: PageParams = Depends(),
     repository: AssetRepository = Depends(get_asset_repository)
 ):
-    assets = repository.list_all()
-    return assets
+    return paginate(lambda limit: repository.list_page(page.after_id, limit, filters), page)
@@ -1,7 +1,9 @@
-from typing import List
-
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from api.batch import batch_get
+from api.pagination import PageParams, paginate
+from api.schemas.batch import BatchGetRequest, BatchGetResponse
+from api.schemas.pagination import Page
 from api.schemas.exchanges import ExchangeCreate, ExchangeResponse
 from core.domain.exchange import Exchange
 from core.repositories.exchange_repository import ExchangeRepository
@@ -29,6 +31,13 @@ def create_exchange(
     created_exchange = repository.create(domain_exchange)
     return created_exchange
 
+@router.post("/batch-get", response_model=BatchGetResponse[ExchangeResponse])
+def batch_get_exchanges(
+    request: BatchGetRequest,
+    repository: ExchangeRepository = Depends(get_exchange_repository)
+):
+    return batch_get(repository.get_by_ids, request.ids)
+
 @router.get("/{exchange_id}", response_model=ExchangeResponse)
 def read_exchange(
     exchange_id: int,
@@ -39,9 +48,9 @@ def read_exchange(
         raise HTTPException(status_code=404, detail="Exchange not found")
     return exchange
 
-@router.get("/", response_model=List[ExchangeResponse])
+@router.get("/", response_model=Page[ExchangeResponse])
 def list_exchanges(
+    page: PageParams = Depends(),
     repository: ExchangeRepository = Depends(get_exchange_repository)
 ):
-    exchanges = repository.list_all()
-    return exchanges
+    return paginate(lambda limit: repository.list_page(page.after_id, limit), page)
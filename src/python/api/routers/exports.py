@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+from dataclasses import fields
+from enum import Enum
+from typing import Iterator, List
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from api.dependencies import get_listing_repository
+from core.domain.catalog_entry import CatalogEntry
+from core.repositories.listing_repository import ListingRepository
+
+# Rows per cursor fetch and per chunk written to the client. Starlette pulls
+# each chunk of a sync iterator through the threadpool, so chunks should not
+# be single rows.
+EXPORT_BATCH_SIZE = 5000
+
+_COLUMNS = [f.name for f in fields(CatalogEntry)]
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+router = APIRouter(
+    prefix="/exports",
+    tags=["exports"],
+)
+
+def _ndjson_chunks(batches: Iterator[List[CatalogEntry]]) -> Iterator[str]:
+    for batch in batches:
+        yield "".join(json.dumps(vars(entry), separators=(",", ":")) + "\n" for entry in batch)
+
+def _csv_chunks(batches: Iterator[List[CatalogEntry]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    # The header goes out before the query runs
+    writer.writerow(_COLUMNS)
+    yield buffer.getvalue()
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(vars(entry).values() for entry in batch)
+        yield buffer.getvalue()
+
+@router.get("/catalog")
+def export_catalog(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="ndjson: one JSON object per line; csv: with a header row"),
+    repository: ListingRepository = Depends(get_listing_repository)
+):
+    """
+    Streams every listing with its asset and exchange. Rows are written as
+    they are read from a server-side cursor, so memory stays flat and the
+    response starts before the whole catalog has been read.
+    """
+    # Lazy: nothing is queried until the response body is iterated, which
+    # happens while the request's session is still open.
+    batches = repository.stream_catalog(EXPORT_BATCH_SIZE)
+    if format == ExportFormat.CSV:
+        body, media_type = _csv_chunks(batches), "text/csv; charset=utf-8"
+    else:
+        body, media_type = _ndjson_chunks(batches), "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="catalog.{format.value}"'}
+    )
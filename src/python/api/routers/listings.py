@@ -1,8 +1,12 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from api.schemas.listings import ListingCreate, ListingResponse
+from api.batch import batch_get
+from api.pagination import PageParams, paginate
+from api.schemas.batch import BatchGetRequest, BatchGetResponse
+from api.schemas.pagination import Page
+from api.schemas.listings import ListingCreate, ListingResponse, ResolvedListingResponse
 from core.domain.listing import Listing
 from core.repositories.listing_repository import ListingRepository
 from api.dependencies import get_listing_repository
@@ -30,6 +34,44 @@ def create_listing(
     created_listing = repository.create(domain_listing)
     return created_listing
 
+# Declared before "/{listing_id}", which would otherwise claim the path
+@router.get("/resolve", response_model=ResolvedListingResponse)
+def resolve_listing(
+    ticker: str = Query(..., min_length=1, max_length=20, description="Exact ticker, as stored"),
+    mic: Optional[str] = Query(None, min_length=1, max_length=20, description="Exchange MIC; needed when the ticker trades on several"),
+    repository: ListingRepository = Depends(get_listing_repository)
+):
+    """
+    Answered from an in-process cache. Listing and asset writes made through
+    this process show up at once; writes by other processes (e.g. the sync
+    worker) can take up to 60 seconds, or 5 for a ticker that was not found.
+    """
+    matches = repository.resolve(ticker, mic)
+    if not matches:
+        raise HTTPException(status_code=404, detail="Listing not found")
+    if len(matches) > 1:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Ticker is listed on several exchanges, pass mic: {sorted(m.mic_code for m in matches)}"
+        )
+    resolved = matches[0]
+    return {
+        "listing_id": resolved.listing.id,
+        "ticker": resolved.listing.ticker,
+        "mic_code": resolved.mic_code,
+        "exchange_id": resolved.listing.exchange_id,
+        "currency": resolved.listing.currency,
+        "is_active": resolved.listing.is_active,
+        "asset": resolved.asset,
+    }
+
+@router.post("/batch-get", response_model=BatchGetResponse[ListingResponse])
+def batch_get_listings(
+    request: BatchGetRequest,
+    repository: ListingRepository = Depends(get_listing_repository)
+):
+    return batch_get(repository.get_by_ids, request.ids)
+
 @router.get("/{listing_id}", response_model=ListingResponse)
 def read_listing(
     listing_id: int,
@@ -40,12 +82,12 @@ def read_listing(
         raise HTTPException(status_code=404, detail="Listing not found")
     return listing
 
-@router.get("/", response_model=List[ListingResponse])
+@router.get("/", response_model=Page[ListingResponse])
 def list_listings(
+    page: PageParams = Depends(),
     repository: ListingRepository = Depends(get_listing_repository)
 ):
-    listings = repository.list_all()
-    return listings
+    return paginate(lambda limit: repository.list_page(page.after_id, limit), page)
 
 @router.get("/asset/{asset_id}", response_model=List[ListingResponse])
 def list_listings_by_asset(
@@ -0,0 +1,114 @@
+import math
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from api.dependencies import get_listing_repository, get_portfolio_repository
+from api.schemas.portfolios import (
+    HoldingResponse,
+    HoldingsReplace,
+    PortfolioCreate,
+    PortfolioResponse,
+    ValuationResponse,
+)
+from core.domain.portfolio import Holding, Portfolio
+from core.repositories.listing_repository import ListingRepository
+from core.repositories.portfolio_repository import PortfolioRepository
+from core.services.portfolio_valuation_service import PortfolioValuationService
+
+router = APIRouter(
+    prefix="/portfolios",
+    tags=["portfolios"],
+    responses={404: {"description": "Not found"}},
+)
+
+def _get_portfolio_or_404(repository: PortfolioRepository, portfolio_id: int) -> Portfolio:
+    portfolio = repository.get_by_id(portfolio_id)
+    if portfolio is None:
+        raise HTTPException(status_code=404, detail="Portfolio not found")
+    return portfolio
+
+def _nullable(value: float):
+    return None if math.isnan(value) else value
+
+@router.post("/", response_model=PortfolioResponse, status_code=status.HTTP_201_CREATED)
+def create_portfolio(
+    portfolio_in: PortfolioCreate,
+    repository: PortfolioRepository = Depends(get_portfolio_repository)
+):
+    return repository.create(Portfolio(name=portfolio_in.name, description=portfolio_in.description))
+
+@router.get("/", response_model=List[PortfolioResponse])
+def list_portfolios(repository: PortfolioRepository = Depends(get_portfolio_repository)):
+    return repository.list_all()
+
+@router.get("/{portfolio_id}", response_model=PortfolioResponse)
+def read_portfolio(
+    portfolio_id: int,
+    repository: PortfolioRepository = Depends(get_portfolio_repository)
+):
+    return _get_portfolio_or_404(repository, portfolio_id)
+
+@router.put("/{portfolio_id}/holdings", response_model=List[HoldingResponse])
+def replace_holdings(
+    portfolio_id: int,
+    request: HoldingsReplace,
+    repository: PortfolioRepository = Depends(get_portfolio_repository),
+    listing_repository: ListingRepository = Depends(get_listing_repository)
+):
+    _get_portfolio_or_404(repository, portfolio_id)
+    try:
+        holdings = [Holding(portfolio_id=portfolio_id, listing_id=h.listing_id, quantity=h.quantity) for h in request.holdings]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    listing_ids = [h.listing_id for h in holdings]
+    if len(set(listing_ids)) != len(listing_ids):
+        raise HTTPException(status_code=400, detail="Each listing can be held only once per portfolio")
+    missing = set(listing_ids) - {listing.id for listing in listing_repository.get_by_ids(listing_ids)}
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Listings not found: {sorted(missing)}")
+    return repository.replace_holdings(portfolio_id, holdings)
+
+@router.get("/{portfolio_id}/holdings", response_model=List[HoldingResponse])
+def read_holdings(
+    portfolio_id: int,
+    repository: PortfolioRepository = Depends(get_portfolio_repository)
+):
+    _get_portfolio_or_404(repository, portfolio_id)
+    return repository.get_holdings(portfolio_id)
+
+@router.get("/{portfolio_id}/valuation", response_model=ValuationResponse)
+def value_portfolio(
+    portfolio_id: int,
+    include_positions: bool = Query(True, description="False returns only totals and breakdowns"),
+    repository: PortfolioRepository = Depends(get_portfolio_repository)
+):
+    _get_portfolio_or_404(repository, portfolio_id)
+    valuation = PortfolioValuationService(repository).value(portfolio_id)
+    positions = valuation.positions
+    return {
+        "portfolio_id": portfolio_id,
+        "totals": valuation.totals,
+        "by_asset_class": [{**vars(b), "weight": _nullable(b.weight)} for b in valuation.by_asset_class],
+        "by_exchange": [{**vars(b), "weight": _nullable(b.weight)} for b in valuation.by_exchange],
+        "unpriced": valuation.unpriced,
+        "positions": [
+            {
+                "listing_id": listing_id,
+                "quantity": quantity,
+                "currency": currency,
+                "asset_class": asset_class,
+                "mic_code": mic_code,
+                "price": price,
+                "price_date": price_date,
+                "market_value": market_value,
+                "weight": _nullable(weight),
+            }
+            # Columns to lists once; per position this is only tuple unpacking
+            for listing_id, quantity, currency, asset_class, mic_code, price, price_date, market_value, weight in zip(
+                positions.listing_ids.tolist(), positions.quantities.tolist(), positions.currencies.tolist(),
+                positions.asset_classes.tolist(), positions.mic_codes.tolist(), positions.prices.tolist(),
+                positions.price_dates.astype(object).tolist(), valuation.market_values.tolist(), valuation.weights.tolist()
+            )
+        ] if include_positions else [],
+    }
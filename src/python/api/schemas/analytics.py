@@ -0,0 +1,43 @@
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+# Series are aligned with the response's `dates`; null where a listing has no
+# value that day (not trading yet, or too few observations in the window).
+
+class ReturnSeries(BaseModel):
+    listing_id: int
+    total_return: Optional[float] = None
+    annualized_return: Optional[float] = None
+    annualized_volatility: Optional[float] = None
+    returns: List[Optional[float]]
+
+class ReturnsResponse(BaseModel):
+    dates: List[date]
+    series: List[ReturnSeries]
+
+class VolatilitySeries(BaseModel):
+    listing_id: int
+    volatility: List[Optional[float]]
+
+class VolatilityResponse(BaseModel):
+    window: int
+    dates: List[date]
+    series: List[VolatilitySeries]
+
+class DrawdownSeries(BaseModel):
+    listing_id: int
+    max_drawdown: Optional[float] = None
+    peak_date: Optional[date] = None
+    trough_date: Optional[date] = None
+    drawdown: List[Optional[float]]
+
+class DrawdownsResponse(BaseModel):
+    dates: List[date]
+    series: List[DrawdownSeries]
+
+class CorrelationResponse(BaseModel):
+    listing_ids: List[int]
+    # matrix[i][j] correlates listing_ids[i] with listing_ids[j]
+    matrix: List[List[Optional[float]]]
@@ -22,3 +22,6 @@ class AssetResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+class AssetMatchResponse(AssetResponse):
+    score: float = Field(..., description="Closeness to the query, from 0 to 1; 1 for an exact ticker match")
@@ -0,0 +1,17 @@
+from typing import Generic, List, TypeVar
+
+from pydantic import BaseModel, Field, conint
+
+from api.batch import MAX_BATCH_IDS
+
+T = TypeVar("T")
+
+# IDs are Postgres integer columns
+MAX_ID = 2**31 - 1
+
+class BatchGetRequest(BaseModel):
+    ids: List[conint(ge=1, le=MAX_ID)] = Field(..., min_length=1, max_length=MAX_BATCH_IDS, description="IDs to fetch")
+
+class BatchGetResponse(BaseModel, Generic[T]):
+    items: List[T]
+    missing: List[int] = Field(..., description="Requested IDs that do not exist")
@@ -1,8 +1,11 @@
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from api.schemas.assets import AssetResponse
+
 class ListingCreate(BaseModel):
     asset_id: int
     exchange_id: int
@@ -17,8 +20,19 @@ class ListingResponse(BaseModel):
     ticker: str
     currency: str
     is_active: bool
+    last_price: Optional[Decimal] = None
+    last_price_date: Optional[date] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
+
+class ResolvedListingResponse(BaseModel):
+    listing_id: int
+    ticker: str
+    mic_code: str
+    exchange_id: int
+    currency: str
+    is_active: bool
+    asset: AssetResponse
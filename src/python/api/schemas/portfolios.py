@@ -0,0 +1,66 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from core.domain.enums import AssetClass
+
+MAX_HOLDINGS = 50_000
+
+class PortfolioCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255, description="The name of the portfolio")
+    description: Optional[str] = Field(None, description="Free-form notes")
+
+class PortfolioResponse(BaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class HoldingIn(BaseModel):
+    listing_id: int
+    # Bounded to the column's NUMERIC(28, 10)
+    quantity: Decimal = Field(..., max_digits=28, decimal_places=10, description="Units held; negative for a short position")
+
+class HoldingsReplace(BaseModel):
+    holdings: List[HoldingIn] = Field(..., max_length=MAX_HOLDINGS)
+
+class HoldingResponse(BaseModel):
+    listing_id: int
+    quantity: Decimal
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class PositionValueResponse(BaseModel):
+    listing_id: int
+    quantity: Decimal
+    currency: str
+    asset_class: AssetClass
+    mic_code: str
+    # Null when the listing has no prices yet
+    price: Optional[Decimal] = None
+    price_date: Optional[date] = None
+    market_value: Optional[Decimal] = None
+    weight: Optional[float] = None
+
+class ValueBreakdownResponse(BaseModel):
+    currency: str
+    key: str
+    market_value: Decimal
+    weight: Optional[float] = None
+
+class ValuationResponse(BaseModel):
+    portfolio_id: int
+    # Per currency: positions are never converted, so weights are within a currency
+    totals: Dict[str, Decimal]
+    by_asset_class: List[ValueBreakdownResponse]
+    by_exchange: List[ValueBreakdownResponse]
+    unpriced: List[int]
+    positions: List[PositionValueResponse]
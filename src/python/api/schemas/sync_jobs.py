@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from core.domain.enums import SyncItemStatus, SyncJobStatus
+
+class SyncJobItemResponse(BaseModel):
+    ticker: str
+    status: SyncItemStatus
+    message: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class SyncJobResponse(BaseModel):
+    id: int
+    status: SyncJobStatus
+    incremental: bool
+    fresh_within_minutes: Optional[int] = None
+    attempts: int
+    worker_id: Optional[str] = None
+    error: Optional[str] = None
+    summary: Optional[dict] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    progress: Dict[SyncItemStatus, int]
+    items: List[SyncJobItemResponse]
@@ -0,0 +1,61 @@
+import asyncio
+import logging
+import os
+import socket
+
+from infrastructure.database.session import get_session
+from infrastructure.repositories.asset_repository import SqlAlchemyAssetRepository
+from infrastructure.repositories.exchange_repository import SqlAlchemyExchangeRepository
+from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
+from infrastructure.repositories.sync_job_repository import SqlAlchemySyncJobRepository
+from infrastructure.services.market_data_service import YFinanceMarketDataProvider
+from infrastructure.services.cached_market_data_provider import CachingMarketDataProvider
+from core.services.asset_sync_service import AssetSyncService
+from core.services.market_data_adapter import SyncMarketDataProviderAdapter
+from core.services.sync_job_runner import HEARTBEAT_TIMEOUT, MAX_ATTEMPTS, AsyncSyncJobRunner
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 2.0
+
+def sync_jobs_in_api_enabled() -> bool:
+    return os.getenv("SYNC_JOBS_IN_API", "").lower() in ("1", "true", "yes")
+
+async def run_sync_jobs(poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+    """
+    Works the sync job queue on the API's event loop, alongside request handling.
+    Jobs are claimed from the same table as scripts/sync_worker.py, so this can
+    run next to dedicated workers. Runs until cancelled; a job interrupted by
+    shutdown is requeued once its heartbeat times out.
+    """
+    worker_id = f"{socket.gethostname()}-{os.getpid()}-api"
+    market_data = CachingMarketDataProvider(YFinanceMarketDataProvider())
+    async_market_data = SyncMarketDataProviderAdapter(market_data)
+    logger.info(f"Running sync jobs in the API process as {worker_id}")
+
+    while True:
+        session_gen = get_session()
+        session = next(session_gen)
+        try:
+            job_repo = SqlAlchemySyncJobRepository(session)
+            service = AssetSyncService(
+                SqlAlchemyAssetRepository(session),
+                SqlAlchemyExchangeRepository(session),
+                SqlAlchemyListingRepository(session),
+                market_data
+            )
+            runner = AsyncSyncJobRunner(job_repo, service, async_market_data, worker_id)
+
+            requeued = await asyncio.to_thread(job_repo.requeue_stale, HEARTBEAT_TIMEOUT, MAX_ATTEMPTS)
+            if requeued:
+                logger.warning(f"Recovered {requeued} sync jobs from unresponsive workers")
+
+            worked = await runner.arun_next()
+        except Exception as e:
+            logger.error(f"In-API sync loop failed: {e}", exc_info=True)
+            worked = False
+        finally:
+            session.close()
+
+        if not worked:
+            await asyncio.sleep(poll_interval)
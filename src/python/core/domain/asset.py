@@ -23,3 +23,18 @@ class Asset:
                 self.asset_class = AssetClass(self.asset_class.upper())
             except ValueError:
                 raise ValueError(f"Invalid asset class: {self.asset_class}")
+
+@dataclass
+class AssetFilter:
+    """Criteria for listing assets; a criterion left as None is not applied."""
+    asset_class: Optional[AssetClass] = None
+    is_active: Optional[bool] = None
+    # Assets with at least one listing on this exchange and/or in this currency
+    mic_code: Optional[str] = None
+    currency: Optional[str] = None
+
+@dataclass
+class AssetMatch:
+    asset: Asset
+    # From 0 to 1, higher is closer; 1 for an exact ticker match
+    score: float
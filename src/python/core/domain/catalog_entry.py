@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class CatalogEntry:
+    """One listing with its asset and exchange, flattened for export."""
+    listing_id: int
+    ticker: str
+    currency: str
+    listing_is_active: bool
+    asset_id: int
+    asset_name: str
+    asset_class: str
+    isin: Optional[str]
+    asset_is_active: bool
+    exchange_id: int
+    mic_code: str
+    exchange_name: str
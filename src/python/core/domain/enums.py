@@ -11,3 +11,21 @@ class AssetClass(str, Enum):
     DERIVATIVE = "DERIVATIVE"
     FOREX = "FOREX"
     OTHER = "OTHER"
+
+class SyncJobStatus(str, Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+class SyncItemStatus(str, Enum):
+    PENDING = "PENDING"
+    SYNCED = "SYNCED"
+    SKIPPED = "SKIPPED"
+    FAILED = "FAILED"
+
+class ExchangeCodeKind(str, Enum):
+    # Exchange code reported by the provider, e.g. yfinance 'NMS'
+    EXCHANGE_CODE = "EXCHANGE_CODE"
+    # Venue suffix of the ticker symbol, e.g. '.L' in 'AZN.L'
+    TICKER_SUFFIX = "TICKER_SUFFIX"
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from core.domain.enums import ExchangeCodeKind
+
+@dataclass
+class ExchangeMapping:
+    """Maps a provider's exchange code, or a ticker suffix, to a MIC."""
+    provider: str
+    kind: ExchangeCodeKind
+    code: str
+    mic_code: str
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        if not self.provider:
+            raise ValueError("Provider cannot be empty")
+        if not self.code:
+            raise ValueError("Code cannot be empty")
+        if not self.mic_code:
+            raise ValueError("MIC code cannot be empty")
+        if isinstance(self.kind, str):
+            try:
+                self.kind = ExchangeCodeKind(self.kind.upper())
+            except ValueError:
+                raise ValueError(f"Invalid exchange code kind: {self.kind}")
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Optional
 
 @dataclass
@@ -10,8 +11,13 @@ class Listing:
     currency: str
     id: Optional[int] = None
     is_active: bool = True
+    content_hash: Optional[str] = None
+    synced_at: Optional[datetime] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Newest close and its date; only filled in by reads
+    last_price: Optional[Decimal] = None
+    last_price_date: Optional[date] = None
 
     def __post_init__(self):
         if not self.ticker:
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+
+@dataclass
+class Portfolio:
+    name: str
+    id: Optional[int] = None
+    description: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        if not self.name:
+            raise ValueError("Name cannot be empty")
+
+@dataclass
+class Holding:
+    portfolio_id: int
+    listing_id: int
+    # Negative for a short position
+    quantity: Decimal
+    updated_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        if not self.listing_id:
+            raise ValueError("Listing ID must be provided")
+        if not Decimal(self.quantity).is_finite() or self.quantity == 0:
+            raise ValueError("Quantity must be a non-zero number")
+
+@dataclass
+class PositionArrays:
+    """
+    A portfolio's holdings as aligned columns, one element per position, with
+    what valuation needs from the listing, asset and latest price alongside.
+    """
+    listing_ids: np.ndarray  # int64
+    quantities: np.ndarray  # object, Decimal
+    prices: np.ndarray  # object, Decimal; None for a listing without prices
+    price_dates: np.ndarray  # datetime64[D], NaT without prices
+    currencies: np.ndarray  # str
+    asset_classes: np.ndarray  # str, AssetClass values
+    mic_codes: np.ndarray  # str
+
+    def __post_init__(self):
+        if len({len(column) for column in vars(self).values()}) > 1:
+            raise ValueError("Position columns must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.listing_ids)
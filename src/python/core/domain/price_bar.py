@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+@dataclass
+class PriceBar:
+    listing_id: int
+    date: date
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    adj_close: Optional[Decimal] = None
+    volume: Optional[int] = None
+
+    def __post_init__(self):
+        if not self.listing_id:
+            raise ValueError("Listing ID must be provided")
+        if self.low > self.high:
+            raise ValueError("Low cannot be above high")
+        if min(self.open, self.high, self.low, self.close) < 0:
+            raise ValueError("Prices cannot be negative")
+        if self.volume is not None and self.volume < 0:
+            raise ValueError("Volume cannot be negative")
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+@dataclass
+class PriceMatrix:
+    """
+    Closing prices (adjusted where known) of several listings on one shared
+    calendar: a row per date on which any of them traded, a column per listing,
+    NaN where a listing has no bar that day.
+    """
+    listing_ids: List[int]
+    dates: np.ndarray  # datetime64[D], ascending
+    closes: np.ndarray  # float64, shape (len(dates), len(listing_ids))
+
+    def __post_init__(self):
+        if self.closes.shape != (len(self.dates), len(self.listing_ids)):
+            raise ValueError("Closes must have one row per date and one column per listing")
+
+    @classmethod
+    def from_observations(
+        cls,
+        listing_ids: List[int],
+        observed_listing_ids: np.ndarray,
+        observed_dates: np.ndarray,
+        observed_closes: np.ndarray
+    ) -> "PriceMatrix":
+        """Scatters (listing, date, close) observations, in any order, into the matrix."""
+        dates, rows = np.unique(observed_dates.astype("datetime64[D]"), return_inverse=True)
+        order = np.argsort(listing_ids)
+        columns = order[np.searchsorted(np.asarray(listing_ids)[order], observed_listing_ids)]
+        closes = np.full((len(dates), len(listing_ids)), np.nan)
+        closes[rows, columns] = observed_closes
+        return cls(listing_ids=list(listing_ids), dates=dates, closes=closes)
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from core.domain.asset import Asset
+from core.domain.listing import Listing
+
+@dataclass(frozen=True)
+class ResolvedListing:
+    """A listing found by ticker and exchange, with its asset."""
+    listing: Listing
+    asset: Asset
+    mic_code: str
@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from core.domain.enums import SyncItemStatus, SyncJobStatus
+
+@dataclass
+class SyncJobItem:
+    ticker: str
+    status: SyncItemStatus = SyncItemStatus.PENDING
+    message: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+@dataclass
+class SyncJob:
+    tickers: List[str]
+    id: Optional[int] = None
+    status: SyncJobStatus = SyncJobStatus.PENDING
+    incremental: bool = False
+    fresh_within_minutes: Optional[int] = None
+    attempts: int = 0
+    worker_id: Optional[str] = None
+    error: Optional[str] = None
+    summary: Optional[dict] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    items: List[SyncJobItem] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.tickers:
+            raise ValueError("A sync job needs at least one ticker")
+
+@dataclass
+class SyncEnqueueResult:
+    # None when every ticker was already pending in another job
+    job: Optional[SyncJob]
+    # Tickers attached to work already queued or running, with the id of the job
+    # that will sync them (None if that job finished in the meantime)
+    coalesced: Dict[str, Optional[int]] = field(default_factory=dict)
@@ -1,6 +1,10 @@
+import hashlib
+import json
 from abc import ABC, abstractmethod
+from datetime import date
+from decimal import Decimal
 from typing import Dict, Optional, List
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 @dataclass
 class MarketDataAsset:
@@ -11,13 +15,51 @@ class MarketDataAsset:
     isin: Optional[str] = None
     exchange_mic: Optional[str] = None
 
+    def content_hash(self) -> str:
+        """Stable digest of the payload, compared against storage to skip unchanged rows."""
+        payload = json.dumps(asdict(self), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 @dataclass
 class MarketDataExchange:
     name: str
     mic_code: str
     currency: str
 
+@dataclass
+class MarketDataBar:
+    date: date
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    adj_close: Optional[Decimal] = None
+    volume: Optional[int] = None
+
+class ProviderThrottledError(Exception):
+    """
+    The provider rate limited or timed out the request, and kept doing so after
+    retries. Unlike a `None` result, this says nothing about whether the ticker
+    exists, so callers must report it as a failure rather than as missing data.
+    """
+
+class PartialFetchError(Exception):
+    """
+    Raised by `get_assets_bulk` when some tickers could not be fetched at all.
+    `results` holds the tickers that were (with `None` for genuinely missing ones),
+    `errors` the reason for each one that wasn't.
+    """
+
+    def __init__(self, results: Dict[str, Optional[MarketDataAsset]], errors: Dict[str, str]):
+        super().__init__(f"{len(errors)} of {len(results) + len(errors)} tickers could not be fetched")
+        self.results = results
+        self.errors = errors
+
 class MarketDataProvider(ABC):
+    # Key of the provider's rows in provider_exchange_mappings. Providers without
+    # one only resolve exchanges reported as MICs.
+    name: Optional[str] = None
+
     @abstractmethod
     def get_asset_details(self, ticker: str) -> Optional[MarketDataAsset]:
         """Fetch details for a single asset by ticker."""
@@ -30,5 +72,29 @@ class MarketDataProvider(ABC):
 
     @abstractmethod
     def get_assets_bulk(self, tickers: List[str]) -> Dict[str, Optional[MarketDataAsset]]:
+        """Fetch details for multiple assets. Raises PartialFetchError if some could not be fetched."""
+        pass
+
+class PriceHistoryProvider(ABC):
+    """Daily OHLCV history, for providers that can download it in batches."""
+
+    @abstractmethod
+    def get_price_history(self, tickers: List[str], start: date, end: date) -> Dict[str, List[MarketDataBar]]:
+        """Fetch daily bars from start to end inclusive for several tickers; tickers without data map to []."""
+        pass
+
+class AsyncMarketDataProvider(ABC):
+    """
+    Non-blocking sibling of MarketDataProvider, for sync engines that run inside an
+    event loop. Blocking providers are exposed through SyncMarketDataProviderAdapter.
+    """
+
+    @abstractmethod
+    async def aget_asset_details(self, ticker: str) -> Optional[MarketDataAsset]:
+        """Fetch details for a single asset by ticker."""
+        pass
+
+    @abstractmethod
+    async def aget_assets_bulk(self, tickers: List[str]) -> Dict[str, Optional[MarketDataAsset]]:
         """Fetch details for multiple assets."""
         pass
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from core.domain.asset import Asset
+from core.domain.asset import Asset, AssetFilter, AssetMatch
 
 class AssetRepository(ABC):
     @abstractmethod
@@ -14,12 +14,38 @@ class AssetRepository(ABC):
         """Retrieves an asset by its ID."""
         pass
 
+    @abstractmethod
+    def get_by_ids(self, asset_ids: List[int]) -> List[Asset]:
+        """Retrieves the assets with the given IDs in one query; unknown IDs are skipped."""
+        pass
+
     @abstractmethod
     def list_all(self) -> List[Asset]:
         """Lists all assets."""
         pass
 
+    @abstractmethod
+    def list_page(self, after_id: Optional[int], limit: int, filters: Optional[AssetFilter] = None) -> List[Asset]:
+        """Lists up to limit assets matching filters in ID order, starting after after_id (from the first when None)."""
+        pass
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        limit: int,
+        filters: Optional[AssetFilter] = None,
+        after: Optional[Tuple[float, int]] = None
+    ) -> List[AssetMatch]:
+        """Ranks assets by how closely their name or one of their tickers matches query, best first; after is the (score, id) of the previous page's last match."""
+        pass
+
     @abstractmethod
     def upsert(self, asset: Asset) -> Asset:
         """Upserts an asset based on unique constraints (e.g. ISIN) or name."""
         pass
+
+    @abstractmethod
+    def upsert_many(self, assets: List[Asset]) -> List[Asset]:
+        """Upserts a batch of assets in one transaction. Results are aligned with the input order."""
+        pass
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from core.domain.exchange import Exchange
+from core.domain.exchange_mapping import ExchangeMapping
 
 class ExchangeRepository(ABC):
     @abstractmethod
@@ -14,11 +15,21 @@ class ExchangeRepository(ABC):
         """Retrieves an exchange by its ID."""
         pass
 
+    @abstractmethod
+    def get_by_ids(self, exchange_ids: List[int]) -> List[Exchange]:
+        """Retrieves the exchanges with the given IDs in one query; unknown IDs are skipped."""
+        pass
+
     @abstractmethod
     def list_all(self) -> List[Exchange]:
         """Lists all exchanges."""
         pass
 
+    @abstractmethod
+    def list_page(self, after_id: Optional[int], limit: int) -> List[Exchange]:
+        """Lists up to limit exchanges in ID order, starting after after_id (from the first when None)."""
+        pass
+
     @abstractmethod
     def upsert(self, exchange: Exchange) -> Exchange:
         """Upserts an exchange based on unique constraints (MIC code)."""
@@ -28,3 +39,13 @@ class ExchangeRepository(ABC):
     def get_by_mic_code(self, mic_code: str) -> Optional[Exchange]:
         """Retrieves an exchange by its MIC code."""
         pass
+
+    @abstractmethod
+    def list_mappings(self, provider: str) -> List[ExchangeMapping]:
+        """Lists the exchange code and ticker suffix mappings of a market data provider."""
+        pass
+
+    @abstractmethod
+    def upsert_mapping(self, mapping: ExchangeMapping) -> ExchangeMapping:
+        """Upserts a mapping based on unique constraints (provider, kind, code)."""
+        pass
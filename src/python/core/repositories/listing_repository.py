@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
+from core.domain.catalog_entry import CatalogEntry
 from core.domain.listing import Listing
+from core.domain.resolved_listing import ResolvedListing
 
 class ListingRepository(ABC):
     @abstractmethod
@@ -14,11 +16,26 @@ class ListingRepository(ABC):
         """Retrieves a listing by its ID."""
         pass
 
+    @abstractmethod
+    def get_by_ids(self, listing_ids: List[int]) -> List[Listing]:
+        """Retrieves the listings with the given IDs in one query; unknown IDs are skipped."""
+        pass
+
+    @abstractmethod
+    def resolve(self, ticker: str, mic_code: Optional[str] = None) -> List[ResolvedListing]:
+        """Finds the listings with this exact ticker, on the given exchange or on any when mic_code is None."""
+        pass
+
     @abstractmethod
     def list_all(self) -> List[Listing]:
         """Lists all listings."""
         pass
 
+    @abstractmethod
+    def list_page(self, after_id: Optional[int], limit: int) -> List[Listing]:
+        """Lists up to limit listings in ID order, starting after after_id (from the first when None)."""
+        pass
+
     @abstractmethod
     def get_by_asset_id(self, asset_id: int) -> List[Listing]:
         """Retrieves listings for a specific asset."""
@@ -28,3 +45,23 @@ class ListingRepository(ABC):
     def upsert(self, listing: Listing) -> Listing:
         """Upserts a listing based on unique constraints (ticker + exchange)."""
         pass
+
+    @abstractmethod
+    def upsert_many(self, listings: List[Listing]) -> List[Listing]:
+        """Upserts a batch of listings in one transaction. Results are aligned with the input order."""
+        pass
+
+    @abstractmethod
+    def get_by_tickers(self, tickers: List[str]) -> List[Listing]:
+        """Retrieves all listings for the given tickers, across exchanges."""
+        pass
+
+    @abstractmethod
+    def mark_synced(self, listing_ids: List[int]) -> None:
+        """Records that listings were confirmed unchanged by a sync, without rewriting them."""
+        pass
+
+    @abstractmethod
+    def stream_catalog(self, batch_size: int) -> Iterator[List[CatalogEntry]]:
+        """Yields every listing with its asset and exchange in listing ID order, batch_size entries at a time, without loading them all."""
+        pass
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from core.domain.portfolio import Holding, Portfolio, PositionArrays
+
+class PortfolioRepository(ABC):
+    @abstractmethod
+    def create(self, portfolio: Portfolio) -> Portfolio:
+        """Creates a new portfolio."""
+        pass
+
+    @abstractmethod
+    def get_by_id(self, portfolio_id: int) -> Optional[Portfolio]:
+        """Retrieves a portfolio by its ID."""
+        pass
+
+    @abstractmethod
+    def list_all(self) -> List[Portfolio]:
+        """Lists all portfolios."""
+        pass
+
+    @abstractmethod
+    def replace_holdings(self, portfolio_id: int, holdings: List[Holding]) -> List[Holding]:
+        """Replaces all of a portfolio's holdings in one transaction."""
+        pass
+
+    @abstractmethod
+    def get_holdings(self, portfolio_id: int) -> List[Holding]:
+        """Retrieves a portfolio's holdings, ordered by listing ID."""
+        pass
+
+    @abstractmethod
+    def load_positions(self, portfolio_id: int) -> PositionArrays:
+        """Loads a portfolio's holdings with listing, asset class and latest close as aligned arrays, in one query."""
+        pass
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterable, List
+
+from core.domain.price_bar import PriceBar
+from core.domain.price_matrix import PriceMatrix
+
+class PriceRepository(ABC):
+    @abstractmethod
+    def bulk_load(self, bars: Iterable[PriceBar]) -> int:
+        """Inserts or updates daily bars keyed by (listing_id, date) in one transaction, advancing each listing's latest price; returns rows written."""
+        pass
+
+    @abstractmethod
+    def get_range(self, listing_id: int, start: date, end: date) -> List[PriceBar]:
+        """Retrieves a listing's bars from start to end inclusive, oldest first."""
+        pass
+
+    @abstractmethod
+    def get_close_matrix(self, listing_ids: List[int], start: date, end: date) -> PriceMatrix:
+        """Loads the listings' closes from start to end inclusive as one date x listing matrix, in a single query."""
+        pass
+
+    @abstractmethod
+    def ensure_partitions(self, start: date, end: date) -> List[str]:
+        """Creates the missing storage partitions covering start to end, re-attaching detached ones; returns their names."""
+        pass
+
+    @abstractmethod
+    def detach_partitions_before(self, cutoff: date) -> List[str]:
+        """Detaches partitions that only hold bars before cutoff, keeping them as standalone tables; returns their names."""
+        pass
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Dict, Optional
+
+from core.domain.sync_job import SyncEnqueueResult, SyncJob, SyncJobItem
+
+class SyncJobRepository(ABC):
+    @abstractmethod
+    def enqueue(self, job: SyncJob) -> SyncEnqueueResult:
+        """Persists a pending job for the tickers not already pending in a job with the same or stronger options; the rest are coalesced."""
+        pass
+
+    @abstractmethod
+    def get_by_id(self, job_id: int, with_items: bool = False) -> Optional[SyncJob]:
+        """Retrieves a job, optionally with its per-ticker items."""
+        pass
+
+    @abstractmethod
+    def claim_next(self, worker_id: str) -> Optional[SyncJob]:
+        """Atomically moves the oldest pending job to running and returns it, or None if the queue is empty."""
+        pass
+
+    @abstractmethod
+    def record_progress(self, job_id: int, items: Dict[str, SyncJobItem]) -> None:
+        """Updates per-ticker item statuses and refreshes the job heartbeat."""
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: int, summary: dict) -> None:
+        """Marks a running job as succeeded."""
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: int, error: str) -> None:
+        """Marks a running job as failed."""
+        pass
+
+    @abstractmethod
+    def requeue_stale(self, heartbeat_timeout: timedelta, max_attempts: int) -> int:
+        """Returns running jobs whose worker stopped heartbeating to the queue, or fails them after max_attempts."""
+        pass
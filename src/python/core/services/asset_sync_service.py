@@ -1,17 +1,29 @@
 import logging
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 
 from core.domain.asset import Asset
 from core.domain.exchange import Exchange
+from core.domain.exchange_mapping import ExchangeMapping
 from core.domain.listing import Listing
 from core.domain.enums import AssetClass
 from core.repositories.asset_repository import AssetRepository
 from core.repositories.exchange_repository import ExchangeRepository
 from core.repositories.listing_repository import ListingRepository
-from core.interfaces.market_data import MarketDataProvider, MarketDataAsset
+from core.interfaces.market_data import MarketDataProvider, MarketDataAsset, PartialFetchError
+from core.services.exchange_index import ExchangeIndex, invalidate_exchange_indexes
+from core.services.metrics import SYNC_STAGE_SECONDS, record_sync_summary
+from core.services.sync_summary import SyncSummary
 
 logger = logging.getLogger(__name__)
 
+# Rows per upsert transaction in batched mode. Large enough to amortise round
+# trips and fsyncs, small enough that a failed chunk is cheap to replay row by row.
+DEFAULT_SYNC_BATCH_SIZE = 500
+
+# Validated market data with the domain rows it maps to, ready to be written.
+PreparedAsset = Tuple[MarketDataAsset, Asset, Exchange]
+
 class AssetSyncService:
     def __init__(
         self,
@@ -24,6 +36,7 @@ class AssetSyncService:
         self.exchange_repo = exchange_repository
         self.listing_repo = listing_repository
         self.market_data = market_data_provider
+        self._exchanges: Optional[ExchangeIndex] = None
 
     def seed_exchanges(self, exchanges_data: List[dict]) -> None:
         """
@@ -38,90 +51,331 @@ class AssetSyncService:
                 currency=ex_data['currency']
             )
             self.exchange_repo.upsert(exchange)
+        invalidate_exchange_indexes()
         logger.info("Exchange seeding complete")
 
-    def sync_assets(self, tickers: List[str]) -> None:
+    def seed_exchange_mappings(self, provider: str, mappings_data: List[dict]) -> None:
+        """
+        Seeds how a provider's exchange codes and ticker suffixes map to MICs.
+        mappings_data: List of dicts with keys 'kind', 'code', 'mic_code'
+        """
+        logger.info(f"Seeding {len(mappings_data)} {provider} exchange mappings")
+        for mapping_data in mappings_data:
+            mapping = ExchangeMapping(
+                provider=provider,
+                kind=mapping_data['kind'],
+                code=mapping_data['code'],
+                mic_code=mapping_data['mic_code']
+            )
+            self.exchange_repo.upsert_mapping(mapping)
+        invalidate_exchange_indexes()
+        logger.info("Exchange mapping seeding complete")
+
+    def sync_assets(
+        self,
+        tickers: List[str],
+        batch_size: Optional[int] = None,
+        incremental: bool = False,
+        fresh_within: Optional[timedelta] = None
+    ) -> SyncSummary:
         """
         Syncs assets and listings for the given list of tickers.
+        With `batch_size` set, rows are written in chunked multi-row upserts, one
+        transaction per chunk, instead of two round trips and commits per ticker.
+        With `incremental`, tickers synced within `fresh_within` are not fetched at
+        all, and fetched tickers whose content hash matches storage are not rewritten.
         """
         logger.info(f"Syncing {len(tickers)} assets...")
+        summary = SyncSummary(requested=len(tickers))
+
+        existing = None
+        if incremental:
+            tickers, existing = self.load_sync_state(tickers, fresh_within, summary)
 
         # Fetch bulk data
-        market_data_map = self.market_data.get_assets_bulk(tickers)
+        market_data_map = self.fetch_market_data(tickers, summary)
+
+        self._write(market_data_map, batch_size, summary, existing)
+
+        record_sync_summary(summary)
+        summary.log_unknown_exchanges(logger)
+        logger.info(
+            f"Asset sync complete: {summary.synced} synced, "
+            f"{len(summary.skipped)} skipped, {len(summary.failed)} failed"
+        )
+        return summary
+
+    def fetch_market_data(self, tickers: List[str], summary: SyncSummary) -> Dict[str, Optional[MarketDataAsset]]:
+        """
+        Fetches tickers from the provider. Tickers the provider could not serve
+        (e.g. still throttled after retries) are marked failed, not skipped.
+        """
+        if not tickers:
+            return {}
+        try:
+            return self.market_data.get_assets_bulk(tickers)
+        except PartialFetchError as e:
+            logger.warning(f"Failed to fetch {len(e.errors)} of {len(tickers)} tickers")
+            for ticker, error in e.errors.items():
+                summary.failed[ticker] = f"Fetch failed: {error}"
+            return e.results
+
+    def load_sync_state(
+        self,
+        tickers: List[str],
+        fresh_within: Optional[timedelta],
+        summary: SyncSummary
+    ) -> Tuple[List[str], Dict[str, List[Listing]]]:
+        """
+        Prepares an incremental sync, for this service and for the pipelined and
+        async engines. Returns the tickers still worth fetching and the listings
+        already stored for them, keyed by ticker, to pass back as `existing`.
+        """
+        existing: Dict[str, List[Listing]] = {}
+        for listing in self.listing_repo.get_by_tickers(tickers):
+            existing.setdefault(listing.ticker, []).append(listing)
+
+        if not fresh_within:
+            return list(tickers), existing
+
+        cutoff = datetime.now(timezone.utc) - fresh_within
+        stale = []
+        for ticker in tickers:
+            listings = existing.get(ticker)
+            if listings and all(l.synced_at and l.synced_at >= cutoff for l in listings):
+                summary.fresh += 1
+            else:
+                stale.append(ticker)
+        return stale, existing
+
+    def persist_market_data(
+        self,
+        market_data_map: Dict[str, Optional[MarketDataAsset]],
+        batch_size: int = DEFAULT_SYNC_BATCH_SIZE,
+        existing: Optional[Dict[str, List[Listing]]] = None
+    ) -> SyncSummary:
+        """
+        Writes already-fetched market data through the batched path.
+        AsyncAssetSyncService fetches on the event loop and writes each batch here,
+        so it shares the same validation and upsert logic. `requested` is left to
+        the caller.
+        Passing `existing` from `load_sync_state` makes the write incremental.
+        """
+        summary = SyncSummary()
+        self._write(market_data_map, batch_size, summary, existing)
+        return summary
+
+    def _write(
+        self,
+        market_data_map: Dict[str, Optional[MarketDataAsset]],
+        batch_size: Optional[int],
+        summary: SyncSummary,
+        existing: Optional[Dict[str, List[Listing]]]
+    ) -> None:
+        summary.fetched += sum(1 for data in market_data_map.values() if data)
+
+        if existing is not None:
+            market_data_map = self._drop_unchanged(market_data_map, existing, summary)
+
+        if batch_size:
+            self._sync_batched(market_data_map, batch_size, summary)
+        else:
+            self._sync_rows(market_data_map, summary)
+
+        if existing is not None:
+            for ticker, data in market_data_map.items():
+                if not data or ticker in summary.failed or ticker in summary.skipped:
+                    continue
+                if ticker in existing:
+                    summary.updated += 1
+                else:
+                    summary.inserted += 1
+
+    def _drop_unchanged(
+        self,
+        market_data_map: Dict[str, Optional[MarketDataAsset]],
+        existing: Dict[str, List[Listing]],
+        summary: SyncSummary
+    ) -> Dict[str, Optional[MarketDataAsset]]:
+        changed, unchanged_ids = self.split_unchanged(market_data_map, existing, summary)
+        # Unchanged rows only get their sync timestamp touched, in one statement,
+        # so the staleness window keeps working without rewriting the row.
+        self.listing_repo.mark_synced(unchanged_ids)
+        return changed
 
+    def split_unchanged(
+        self,
+        market_data_map: Dict[str, Optional[MarketDataAsset]],
+        existing: Dict[str, List[Listing]],
+        summary: SyncSummary
+    ) -> Tuple[Dict[str, Optional[MarketDataAsset]], List[int]]:
+        """
+        Separates fetched data that differs from storage from data that doesn't.
+        Returns the changed entries and the ids of listings whose stored content
+        hash already matches, which the caller passes to `mark_synced`.
+        """
+        changed: Dict[str, Optional[MarketDataAsset]] = {}
+        unchanged_ids: List[int] = []
+        for ticker, data in market_data_map.items():
+            digest = data.content_hash() if data else None
+            stored = [l for l in existing.get(ticker, []) if digest and l.content_hash == digest]
+            if stored:
+                unchanged_ids.extend(l.id for l in stored)
+                summary.unchanged += 1
+            else:
+                changed[ticker] = data
+        return changed, unchanged_ids
+
+    def _sync_rows(self, market_data_map: Dict[str, Optional[MarketDataAsset]], summary: SyncSummary) -> None:
         for ticker, data in market_data_map.items():
             if not data:
                 logger.warning(f"No data found for ticker {ticker}")
+                summary.skipped[ticker] = "No market data"
                 continue
 
             try:
-                self._process_asset_data(data)
+                if self._process_asset_data(data):
+                    summary.synced += 1
+                else:
+                    summary.skip_unknown_exchange(ticker, data.exchange_mic)
             except Exception as e:
                 logger.error(f"Failed to process asset {ticker}: {e}", exc_info=True)
+                summary.failed[ticker] = str(e)
+
+    def _sync_batched(
+        self,
+        market_data_map: Dict[str, Optional[MarketDataAsset]],
+        batch_size: int,
+        summary: SyncSummary
+    ) -> None:
+        prepared = self.prepare_market_data(market_data_map, summary)
+        for start in range(0, len(prepared), batch_size):
+            self.persist_prepared(prepared[start:start + batch_size], summary)
 
-        logger.info("Asset sync complete")
+    def prepare_market_data(
+        self,
+        market_data_map: Dict[str, Optional[MarketDataAsset]],
+        summary: SyncSummary
+    ) -> List[PreparedAsset]:
+        """
+        Validates fetched data and maps it to domain rows without writing anything.
+        Tickers without data, with invalid data or on unknown exchanges are reported
+        in `summary` and left out, so a bad row never aborts the batch it would land in.
+        """
+        prepared: List[PreparedAsset] = []
+        for ticker, data in market_data_map.items():
+            if not data:
+                logger.warning(f"No data found for ticker {ticker}")
+                summary.skipped[ticker] = "No market data"
+                continue
 
-    def _process_asset_data(self, data: MarketDataAsset) -> None:
+            try:
+                row = self._prepare_asset_data(data)
+            except ValueError as e:
+                logger.warning(f"Invalid market data for {ticker}: {e}")
+                summary.failed[ticker] = str(e)
+                continue
+
+            if row is None:
+                summary.skip_unknown_exchange(ticker, data.exchange_mic)
+                continue
+
+            prepared.append((data,) + row)
+        return prepared
+
+    def persist_prepared(self, batch: List[PreparedAsset], summary: SyncSummary) -> None:
+        """Writes one batch from `prepare_market_data` in a single multi-row upsert."""
+        try:
+            with SYNC_STAGE_SECONDS.time(stage="asset_upsert"):
+                saved_assets = self.asset_repo.upsert_many([asset for _, asset, _ in batch])
+            listings = [
+                Listing(
+                    asset_id=saved_asset.id,
+                    exchange_id=exchange.id,
+                    ticker=data.ticker,
+                    currency=data.currency,
+                    content_hash=data.content_hash()
+                )
+                for (data, _, exchange), saved_asset in zip(batch, saved_assets)
+            ]
+            with SYNC_STAGE_SECONDS.time(stage="listing_upsert"):
+                self.listing_repo.upsert_many(listings)
+            summary.synced += len(batch)
+            logger.info(f"Synced batch of {len(batch)} assets")
+        except Exception as e:
+            # One row violating a DB constraint aborts the whole statement. Replay
+            # the chunk row by row so only the offending tickers are reported.
+            logger.warning(f"Batch upsert of {len(batch)} assets failed ({e}); retrying row by row")
+            for data, asset, exchange in batch:
+                try:
+                    self._persist_asset_data(data, asset, exchange)
+                    summary.synced += 1
+                except Exception as row_error:
+                    logger.error(f"Failed to process asset {data.ticker}: {row_error}", exc_info=True)
+                    summary.failed[data.ticker] = str(row_error)
+
+    def load_exchanges(self) -> ExchangeIndex:
+        """Loads (or reloads, if stale) the exchange index used to resolve listings."""
+        if self._exchanges is None or self._exchanges.is_stale:
+            self._exchanges = ExchangeIndex.load(self.exchange_repo, self.market_data.name)
+        return self._exchanges
+
+    def _process_asset_data(self, data: MarketDataAsset) -> bool:
+        prepared = self._prepare_asset_data(data)
+        if prepared is None:
+            return False
+
+        asset, exchange = prepared
+        self._persist_asset_data(data, asset, exchange)
+        return True
+
+    def _prepare_asset_data(self, data: MarketDataAsset) -> Optional[Tuple[Asset, Exchange]]:
         # 1. Resolve Exchange
-        # We need to map the market data exchange to our DB exchange.
-        # YFinance gives us exchange codes like 'NMS' (Nasdaq), 'NYQ' (NYSE).
-        # We need a mapping strategy. For now, we'll try to look up by MIC or fallback to a default if unknown.
-        # Since we don't have a robust mapping table yet, we might skip or create a placeholder if we want.
-        # BETTER APPROACH: We assume the caller knows which Exchange (MIC) these tickers belong to if they are passed in context,
-        # but here we just have a list of tickers.
-        # YFinance `exchange` field is tricky.
-
-        # Simplification for this task:
-        # If we can't find the exchange by MIC (assuming data.exchange_mic IS a mic or we have a map),
-        # we might default to 'XNYS' or 'XNAS' for US stocks if ambiguous, or skip.
-
-        # Let's try to map some common YF codes to MIC
-        yf_to_mic = {
-            'NMS': 'XNAS', # NASDAQ Global Select
-            'NGM': 'XNAS', # NASDAQ Global Market
-            'NCM': 'XNAS', # NASDAQ Capital Market
-            'NYQ': 'XNYS', # NYSE
-            'LSE': 'XLON', # London Stock Exchange
-            # Add more as needed
-        }
-
-        mic_code = yf_to_mic.get(data.exchange_mic, data.exchange_mic) # Fallback to itself if not found
-
-        exchange = self.exchange_repo.get_by_mic_code(mic_code)
+        # YFinance `exchange` field is a provider code ('NMS', 'NYQ'), not a MIC. The
+        # index maps it through provider_exchange_mappings, then tries it as a MIC,
+        # then the ticker's venue suffix ('AZN.L' -> XLON).
+        with SYNC_STAGE_SECONDS.time(stage="resolve_exchange"):
+            exchange = self.load_exchanges().resolve(data.exchange_mic, data.ticker)
 
         if not exchange:
             # If exchange doesn't exist, we can't create a Listing linked to it.
             # We could auto-create the exchange, but that risks creating garbage exchanges.
-            # For now, log and skip.
-            logger.warning(f"Exchange {data.exchange_mic} (mapped to {mic_code}) not found in DB. Skipping {data.ticker}")
-            return
+            # For now, skip; the caller reports unknown codes in aggregate.
+            return None
 
-        # 2. Upsert Asset
-        # Map string asset class to Enum
-        try:
-            # Ensure asset_class matches Enum string values
-            # The MarketDataAsset already tries to map to Enum value string
-            asset_class_enum = AssetClass(data.asset_class)
-        except ValueError:
-            logger.warning(f"Invalid asset class {data.asset_class} for {data.ticker}. Defaulting to STOCK.")
-            asset_class_enum = AssetClass.STOCK
-
-        asset = Asset(
-            name=data.name,
-            asset_class=asset_class_enum,
-            isin=data.isin
-        )
+        # 2. Map to the domain Asset
+        with SYNC_STAGE_SECONDS.time(stage="map"):
+            # Map string asset class to Enum
+            try:
+                # Ensure asset_class matches Enum string values
+                # The MarketDataAsset already tries to map to Enum value string
+                asset_class_enum = AssetClass(data.asset_class)
+            except ValueError:
+                logger.warning(f"Invalid asset class {data.asset_class} for {data.ticker}. Defaulting to EQUITY.")
+                asset_class_enum = AssetClass.EQUITY
+
+            asset = Asset(
+                name=data.name,
+                asset_class=asset_class_enum,
+                isin=data.isin
+            )
+
+        return asset, exchange
 
+    def _persist_asset_data(self, data: MarketDataAsset, asset: Asset, exchange: Exchange) -> None:
         # Check if ISIN exists to decide upsert logic in repo (handled by repo upsert)
-        saved_asset = self.asset_repo.upsert(asset)
+        with SYNC_STAGE_SECONDS.time(stage="asset_upsert"):
+            saved_asset = self.asset_repo.upsert(asset)
 
         # 3. Upsert Listing
         listing = Listing(
             asset_id=saved_asset.id,
             exchange_id=exchange.id,
             ticker=data.ticker,
-            currency=data.currency
+            currency=data.currency,
+            content_hash=data.content_hash()
         )
 
-        self.listing_repo.upsert(listing)
+        with SYNC_STAGE_SECONDS.time(stage="listing_upsert"):
+            self.listing_repo.upsert(listing)
         logger.info(f"Successfully synced {data.ticker} ({saved_asset.name}) on {exchange.mic_code}")
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+from core.domain.listing import Listing
+from core.interfaces.market_data import AsyncMarketDataProvider, MarketDataAsset
+from core.services.asset_sync_service import AssetSyncService, DEFAULT_SYNC_BATCH_SIZE
+from core.services.metrics import record_sync_summary
+from core.services.sync_summary import SyncSummary
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 16
+
+class AsyncAssetSyncService:
+    """
+    Event-loop sync engine.
+    Fetches run concurrently (bounded by a semaphore) and feed a queue; a single
+    writer drains it in batches through AssetSyncService's batched write path.
+    Batches are persisted while later fetches are still in flight, so network
+    waits and DB writes overlap instead of running back to back.
+    """
+
+    def __init__(
+        self,
+        sync_service: AssetSyncService,
+        market_data_provider: AsyncMarketDataProvider,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        batch_size: int = DEFAULT_SYNC_BATCH_SIZE,
+        incremental: bool = False,
+        fresh_within: Optional[timedelta] = None
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.sync_service = sync_service
+        self.market_data = market_data_provider
+        self.max_in_flight = max_in_flight
+        self.batch_size = batch_size
+        self.incremental = incremental
+        self.fresh_within = fresh_within
+
+    async def sync_assets(self, tickers: List[str]) -> SyncSummary:
+        unique_tickers = list(dict.fromkeys(tickers))
+        logger.info(f"Syncing {len(unique_tickers)} assets (async, {self.max_in_flight} in flight)...")
+        summary = SyncSummary(requested=len(unique_tickers))
+
+        existing: Optional[Dict[str, List[Listing]]] = None
+        if self.incremental:
+            unique_tickers, existing = await asyncio.to_thread(
+                self.sync_service.load_sync_state, unique_tickers, self.fresh_within, summary
+            )
+
+        # Bounded so a slow DB pushes back on fetching instead of buffering the universe.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.batch_size * 2)
+        writer = asyncio.create_task(self._write(queue, summary, existing))
+        try:
+            await self._fetch_all(unique_tickers, queue, summary)
+        finally:
+            await queue.put(None)
+            await writer
+
+        record_sync_summary(summary)
+        summary.log_unknown_exchanges(logger)
+        logger.info(
+            f"Async asset sync complete: {summary.synced} synced, "
+            f"{len(summary.skipped)} skipped, {len(summary.failed)} failed"
+        )
+        return summary
+
+    async def _fetch_all(self, tickers: List[str], queue: asyncio.Queue, summary: SyncSummary) -> None:
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        tasks = set()
+        for ticker in tickers:
+            # Acquire before spawning so the number of live tasks, not just
+            # requests, stays bounded for very large universes.
+            await semaphore.acquire()
+            task = asyncio.create_task(self._fetch_one(ticker, semaphore, queue, summary))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def _fetch_one(
+        self,
+        ticker: str,
+        semaphore: asyncio.Semaphore,
+        queue: asyncio.Queue,
+        summary: SyncSummary
+    ) -> None:
+        # The slot is held until the result is queued, so a backed-up writer
+        # also stops new fetches from starting.
+        try:
+            try:
+                data = await self.market_data.aget_asset_details(ticker)
+            except Exception as e:
+                logger.error(f"Failed to fetch {ticker}: {e}")
+                summary.failed[ticker] = f"Fetch failed: {e}"
+                return
+            await queue.put((ticker, data))
+        finally:
+            semaphore.release()
+
+    async def _write(
+        self,
+        queue: asyncio.Queue,
+        summary: SyncSummary,
+        existing: Optional[Dict[str, List[Listing]]]
+    ) -> None:
+        batch: Dict[str, Optional[MarketDataAsset]] = {}
+        while True:
+            item: Optional[Tuple[str, Optional[MarketDataAsset]]] = await queue.get()
+            if item is None:
+                break
+            ticker, data = item
+            batch[ticker] = data
+            if len(batch) >= self.batch_size:
+                await self._flush(batch, summary, existing)
+                batch = {}
+        if batch:
+            await self._flush(batch, summary, existing)
+
+    async def _flush(
+        self,
+        batch: Dict[str, Optional[MarketDataAsset]],
+        summary: SyncSummary,
+        existing: Optional[Dict[str, List[Listing]]]
+    ) -> None:
+        # The repositories use a blocking SQLAlchemy session. Only this writer
+        # touches it, one batch at a time, so handing it to a worker thread is safe.
+        try:
+            result = await asyncio.to_thread(
+                self.sync_service.persist_market_data, batch, self.batch_size, existing
+            )
+        except Exception as e:
+            logger.error(f"Failed to persist batch of {len(batch)} assets: {e}", exc_info=True)
+            for ticker in batch:
+                summary.failed[ticker] = str(e)
+            return
+        summary.merge(result)
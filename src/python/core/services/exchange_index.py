@@ -0,0 +1,74 @@
+import itertools
+from typing import Dict, Iterable, List, Optional
+
+from core.domain.enums import ExchangeCodeKind
+from core.domain.exchange import Exchange
+from core.domain.exchange_mapping import ExchangeMapping
+from core.repositories.exchange_repository import ExchangeRepository
+
+# Process-wide version of the exchanges table. Bumped whenever exchanges are
+# written so every index built before the write knows to reload.
+_generations = itertools.count(1)
+_current_generation = next(_generations)
+
+def invalidate_exchange_indexes() -> None:
+    global _current_generation
+    _current_generation = next(_generations)
+
+class ExchangeIndex:
+    """
+    In-memory view of the exchanges table and of one provider's exchange mappings.
+    Both rarely hold more than a few hundred rows, so loading them once per sync is
+    far cheaper than a SELECT per ticker, and every lookup is a dict hit.
+    """
+
+    def __init__(self, exchanges: List[Exchange], mappings: Iterable[ExchangeMapping] = ()):
+        self.generation = _current_generation
+        self.by_mic: Dict[str, Exchange] = {e.mic_code: e for e in exchanges}
+        self.by_provider_code: Dict[str, Exchange] = {}
+        self.by_suffix: Dict[str, Exchange] = {}
+        for mapping in mappings:
+            exchange = self.by_mic.get(mapping.mic_code)
+            if exchange is None:
+                # Mapped to a venue that isn't seeded yet: resolving it would only
+                # produce a listing we can't store, so treat it as a miss.
+                continue
+            if mapping.kind == ExchangeCodeKind.TICKER_SUFFIX:
+                self.by_suffix[mapping.code.upper()] = exchange
+            else:
+                self.by_provider_code[mapping.code] = exchange
+        # Longest first, so '.IL' wins over '.L'. Matching costs one lookup per
+        # distinct suffix length, a handful at most, however many suffixes exist.
+        self._suffix_lengths = sorted({len(s) for s in self.by_suffix}, reverse=True)
+
+    @classmethod
+    def load(cls, exchange_repository: ExchangeRepository, provider: Optional[str] = None) -> "ExchangeIndex":
+        mappings = exchange_repository.list_mappings(provider) if provider else []
+        return cls(exchange_repository.list_all(), mappings)
+
+    @property
+    def is_stale(self) -> bool:
+        return self.generation != _current_generation
+
+    def resolve(self, exchange_code: Optional[str], ticker: Optional[str] = None) -> Optional[Exchange]:
+        """
+        Resolves a provider exchange code, falling back to treating it as a MIC and
+        then to the ticker's venue suffix.
+        """
+        if exchange_code:
+            exchange = self.by_provider_code.get(exchange_code) or self.by_mic.get(exchange_code)
+            if exchange:
+                return exchange
+        if ticker:
+            return self.resolve_suffix(ticker)
+        return None
+
+    def resolve_suffix(self, ticker: str) -> Optional[Exchange]:
+        symbol = ticker.upper()
+        for length in self._suffix_lengths:
+            # The suffix must leave a symbol in front of it
+            if length < len(symbol):
+                exchange = self.by_suffix.get(symbol[-length:])
+                if exchange:
+                    return exchange
+        return None
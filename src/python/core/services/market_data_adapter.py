@@ -0,0 +1,20 @@
+import asyncio
+from typing import Dict, List, Optional
+
+from core.interfaces.market_data import AsyncMarketDataProvider, MarketDataAsset, MarketDataProvider
+
+class SyncMarketDataProviderAdapter(AsyncMarketDataProvider):
+    """
+    Exposes a blocking MarketDataProvider through the async interface.
+    Each call runs on the default executor so the event loop keeps serving requests
+    while the provider waits on the network; callers bound how many run at once.
+    """
+
+    def __init__(self, provider: MarketDataProvider):
+        self.provider = provider
+
+    async def aget_asset_details(self, ticker: str) -> Optional[MarketDataAsset]:
+        return await asyncio.to_thread(self.provider.get_asset_details, ticker)
+
+    async def aget_assets_bulk(self, tickers: List[str]) -> Dict[str, Optional[MarketDataAsset]]:
+        return await asyncio.to_thread(self.provider.get_assets_bulk, tickers)
@@ -0,0 +1,226 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from core.services.sync_summary import SyncSummary
+
+# Prometheus' default buckets. 0.1s sits on a bucket boundary, so the API's
+# p95 < 100ms read target can be checked straight from the histogram.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], registry: "MetricsRegistry"):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        registry.register(self)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), registry: "MetricsRegistry" = None):
+        super().__init__(name, documentation, labelnames, registry or REGISTRY)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), registry: "MetricsRegistry" = None):
+        super().__init__(name, documentation, labelnames, registry or REGISTRY)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: "MetricsRegistry" = None
+    ):
+        super().__init__(name, documentation, labelnames, registry or REGISTRY)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (the last slot is +Inf), sum, count
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0, 0])
+            series[0][index] += 1
+            series[1][0] += value
+            series[1][1] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return int(series[1][1]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        names = self.labelnames + ("le",)
+        with self._lock:
+            for key, (counts, (total, count)) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += bucket_count
+                    labels = _format_labels(names, key + (_format_value(bound),))
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {int(count)}")
+        return lines
+
+class MetricsRegistry:
+    """
+    Process-local collection of metrics, rendered in the Prometheus text format.
+    Deliberately tiny: counters and histograms are all the sync pipeline and the
+    API need, and it keeps the service free of a client library dependency.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+REGISTRY = MetricsRegistry()
+
+SYNC_STAGE_SECONDS = Histogram(
+    "sync_stage_duration_seconds",
+    "Time spent in each sync stage: provider fetch (per ticker), mapping and "
+    "exchange resolution (per ticker), asset and listing upserts (per call).",
+    ["stage"]
+)
+SYNC_TICKERS = Counter(
+    "sync_tickers_total",
+    "Tickers processed by syncs, by outcome.",
+    ["outcome"]
+)
+PROVIDER_THROTTLED = Counter(
+    "provider_throttled_total",
+    "Provider calls that were rate limited or timed out, before retries.",
+    ["provider"]
+)
+PROVIDER_CONCURRENCY_LIMIT = Gauge(
+    "provider_concurrency_limit",
+    "Current adaptive limit on concurrent provider calls.",
+    ["provider"]
+)
+PROVIDER_CIRCUIT_OPEN = Gauge(
+    "provider_circuit_open",
+    "1 while the provider circuit breaker is open and calls fail fast.",
+    ["provider"]
+)
+LISTING_RESOLVE_CACHE = Counter(
+    "listing_resolve_cache_total",
+    "Ticker resolution cache lookups, by result (hit or miss).",
+    ["result"]
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"]
+)
+
+def record_sync_summary(summary: SyncSummary) -> None:
+    """Adds a finished sync's outcomes to `sync_tickers_total`."""
+    outcomes = {
+        "synced": summary.synced,
+        "fresh": summary.fresh,
+        "unchanged": summary.unchanged,
+        "skipped": len(summary.skipped),
+        "failed": len(summary.failed),
+    }
+    for outcome, count in outcomes.items():
+        if count:
+            SYNC_TICKERS.inc(count, outcome=outcome)
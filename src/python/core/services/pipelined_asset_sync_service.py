@@ -0,0 +1,265 @@
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from core.domain.listing import Listing
+from core.interfaces.market_data import MarketDataProvider, MarketDataAsset, PartialFetchError
+from core.services.asset_sync_service import AssetSyncService, DEFAULT_SYNC_BATCH_SIZE, PreparedAsset
+from core.services.metrics import record_sync_summary
+from core.services.sync_summary import SyncSummary
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_FETCH_CHUNK_SIZE = 50
+
+# How long a blocked stage waits before re-checking whether the pipeline was aborted.
+_POLL_SECONDS = 0.1
+
+@dataclass
+class _Chunk:
+    tickers: List[str]
+    existing: Optional[Dict[str, List[Listing]]] = None
+    market_data: Dict[str, Optional[MarketDataAsset]] = field(default_factory=dict)
+    prepared: List[PreparedAsset] = field(default_factory=list)
+    unchanged_ids: List[int] = field(default_factory=list)
+
+class _Aborted(Exception):
+    pass
+
+class PipelinedAssetSyncService:
+    """
+    Streaming sync engine: read tickers -> fetch -> map -> persist, with each stage
+    on its own thread(s) and connected to the next by a bounded queue.
+
+    Tickers are consumed lazily in small chunks, so the first batch is written as
+    soon as it has been fetched and memory stays flat however long the input is;
+    when the writer falls behind, the full queues stop fetching. Every batch
+    commits on its own, so a crash keeps everything written before it.
+
+    The stages share the sync service's session, so every repository call goes
+    through one lock; fetching and mapping run outside it.
+    """
+
+    def __init__(
+        self,
+        sync_service: AssetSyncService,
+        market_data_provider: MarketDataProvider,
+        fetch_workers: int = DEFAULT_FETCH_WORKERS,
+        fetch_chunk_size: int = DEFAULT_FETCH_CHUNK_SIZE,
+        batch_size: int = DEFAULT_SYNC_BATCH_SIZE,
+        incremental: bool = False,
+        fresh_within: Optional[timedelta] = None
+    ):
+        if fetch_workers < 1:
+            raise ValueError("fetch_workers must be at least 1")
+        if fetch_chunk_size < 1:
+            raise ValueError("fetch_chunk_size must be at least 1")
+        self.sync_service = sync_service
+        self.market_data = market_data_provider
+        self.fetch_workers = fetch_workers
+        self.fetch_chunk_size = fetch_chunk_size
+        self.batch_size = batch_size
+        self.incremental = incremental
+        self.fresh_within = fresh_within
+
+    def sync_assets(self, tickers: Iterable[str]) -> SyncSummary:
+        """
+        Syncs the given tickers, which may be any iterable, including a generator
+        over a file. Duplicates are only dropped within a chunk; a ticker repeated
+        further apart is fetched and upserted twice, which is harmless.
+        """
+        # Each stage counts into its own summary; they are merged once all stages stop.
+        summaries = {stage: SyncSummary() for stage in ("read", "fetch", "map", "write")}
+        self._db_lock = threading.Lock()
+        self._abort = threading.Event()
+        self._errors: List[BaseException] = []
+
+        # Room for two chunks per fetch worker on each hop: enough to keep every
+        # stage busy, few enough that in-flight data stays a few batches at most.
+        depth = self.fetch_workers * 2
+        to_fetch: queue.Queue = queue.Queue(maxsize=depth)
+        to_map: queue.Queue = queue.Queue(maxsize=depth)
+        to_write: queue.Queue = queue.Queue(maxsize=depth)
+
+        # Load exchanges before the stages start so mapping normally finds them cached.
+        self.sync_service.load_exchanges()
+
+        threads = [
+            threading.Thread(
+                target=self._run_stage, name="sync-read",
+                args=(self._read, iter(tickers), to_fetch, summaries["read"])
+            ),
+            threading.Thread(
+                target=self._run_stage, name="sync-map",
+                args=(self._map, to_map, to_write, summaries["map"])
+            ),
+        ] + [
+            threading.Thread(
+                target=self._run_stage, name=f"sync-fetch-{i}",
+                args=(self._fetch, to_fetch, to_map, summaries["fetch"])
+            )
+            for i in range(self.fetch_workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            self._write(to_write, summaries["write"])
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            for thread in threads:
+                thread.join()
+
+        summary = SyncSummary()
+        for stage_summary in summaries.values():
+            summary.merge(stage_summary)
+        # Recorded even when aborting: those tickers were written.
+        record_sync_summary(summary)
+        if self._errors:
+            logger.error(
+                f"Pipelined asset sync aborted after {summary.synced} synced: {self._errors[0]}"
+            )
+            raise self._errors[0]
+
+        summary.log_unknown_exchanges(logger)
+        logger.info(
+            f"Pipelined asset sync complete: {summary.synced} synced, "
+            f"{len(summary.skipped)} skipped, {len(summary.failed)} failed"
+        )
+        return summary
+
+    def _run_stage(self, stage, *args) -> None:
+        try:
+            stage(*args)
+        except _Aborted:
+            pass
+        except BaseException as e:
+            self._fail(e)
+
+    def _fail(self, error: BaseException) -> None:
+        if not isinstance(error, _Aborted):
+            self._errors.append(error)
+        self._abort.set()
+
+    def _put(self, q: queue.Queue, item) -> None:
+        while True:
+            if self._abort.is_set():
+                raise _Aborted()
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, q: queue.Queue):
+        while True:
+            if self._abort.is_set():
+                raise _Aborted()
+            try:
+                return q.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+    def _chunks(self, tickers: Iterator[str]) -> Iterator[List[str]]:
+        chunk: Dict[str, None] = {}
+        for ticker in tickers:
+            chunk[ticker] = None
+            if len(chunk) >= self.fetch_chunk_size:
+                yield list(chunk)
+                chunk = {}
+        if chunk:
+            yield list(chunk)
+
+    def _read(self, tickers: Iterator[str], out: queue.Queue, summary: SyncSummary) -> None:
+        for tickers_chunk in self._chunks(tickers):
+            summary.requested += len(tickers_chunk)
+            chunk = _Chunk(tickers_chunk)
+            if self.incremental:
+                # Freshness is checked per chunk, right before fetching, so
+                # only the chunk's own listings are ever held in memory.
+                with self._db_lock:
+                    chunk.tickers, chunk.existing = self.sync_service.load_sync_state(
+                        tickers_chunk, self.fresh_within, summary
+                    )
+            if chunk.tickers:
+                self._put(out, chunk)
+        for _ in range(self.fetch_workers):
+            self._put(out, None)
+
+    def _fetch(self, inbox: queue.Queue, out: queue.Queue, summary: SyncSummary) -> None:
+        while True:
+            chunk: Optional[_Chunk] = self._get(inbox)
+            if chunk is None:
+                self._put(out, None)
+                return
+            try:
+                chunk.market_data = self.market_data.get_assets_bulk(chunk.tickers)
+            except PartialFetchError as e:
+                logger.warning(f"Failed to fetch {len(e.errors)} of {len(chunk.tickers)} tickers")
+                for ticker, error in e.errors.items():
+                    summary.failed[ticker] = f"Fetch failed: {error}"
+                chunk.market_data = e.results
+            except Exception as e:
+                logger.error(f"Failed to fetch {len(chunk.tickers)} tickers: {e}")
+                for ticker in chunk.tickers:
+                    summary.failed[ticker] = f"Fetch failed: {e}"
+                continue
+            self._put(out, chunk)
+
+    def _map(self, inbox: queue.Queue, out: queue.Queue, summary: SyncSummary) -> None:
+        running_fetchers = self.fetch_workers
+        while running_fetchers:
+            chunk: Optional[_Chunk] = self._get(inbox)
+            if chunk is None:
+                running_fetchers -= 1
+                continue
+
+            summary.fetched += sum(1 for data in chunk.market_data.values() if data)
+            market_data = chunk.market_data
+            if chunk.existing is not None:
+                market_data, chunk.unchanged_ids = self.sync_service.split_unchanged(
+                    market_data, chunk.existing, summary
+                )
+            # A no-op unless exchanges were reseeded mid-run, but a reload reads the DB.
+            with self._db_lock:
+                self.sync_service.load_exchanges()
+            chunk.prepared = self.sync_service.prepare_market_data(market_data, summary)
+            chunk.market_data = {}
+            self._put(out, chunk)
+        self._put(out, None)
+
+    def _write(self, inbox: queue.Queue, summary: SyncSummary) -> None:
+        batch: List[PreparedAsset] = []
+        is_update: Dict[str, bool] = {}
+        while True:
+            chunk: Optional[_Chunk] = self._get(inbox)
+            if chunk is None:
+                break
+            if chunk.unchanged_ids:
+                with self._db_lock:
+                    self.sync_service.listing_repo.mark_synced(chunk.unchanged_ids)
+            for row in chunk.prepared:
+                batch.append(row)
+                if chunk.existing is not None:
+                    is_update[row[0].ticker] = row[0].ticker in chunk.existing
+                if len(batch) >= self.batch_size:
+                    self._flush(batch, is_update, summary)
+                    batch, is_update = [], {}
+        if batch:
+            self._flush(batch, is_update, summary)
+
+    def _flush(self, batch: List[PreparedAsset], is_update: Dict[str, bool], summary: SyncSummary) -> None:
+        with self._db_lock:
+            self.sync_service.persist_prepared(batch, summary)
+        for ticker, updated in is_update.items():
+            if ticker in summary.failed:
+                continue
+            if updated:
+                summary.updated += 1
+            else:
+                summary.inserted += 1
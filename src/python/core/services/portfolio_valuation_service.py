@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, List
+
+import numpy as np
+
+from core.domain.portfolio import PositionArrays
+from core.repositories.portfolio_repository import PortfolioRepository
+
+@dataclass
+class ValueBreakdown:
+    currency: str
+    key: str  # asset class or exchange MIC
+    market_value: Decimal
+    weight: float  # of the currency's total
+
+@dataclass
+class PortfolioValuation:
+    portfolio_id: int
+    positions: PositionArrays
+    market_values: np.ndarray  # object, Decimal; None for positions without a price
+    weights: np.ndarray  # float64, of the total in the position's currency
+    # There are no FX rates to convert with, so values are only ever summed
+    # within one currency: every total, weight and breakdown is per currency.
+    totals: Dict[str, Decimal]
+    by_asset_class: List[ValueBreakdown]
+    by_exchange: List[ValueBreakdown]
+    unpriced: List[int]  # listing IDs without any price
+
+class PortfolioValuationService:
+    """
+    Values a portfolio from one repository query: quantities and latest closes
+    arrive as aligned arrays and every figure is computed on whole arrays, with
+    group sums done by ufunc.at rather than by looping over positions.
+    Market values and totals are exact Decimals; only weights, being ratios,
+    are computed in float64.
+    """
+
+    def __init__(self, portfolio_repository: PortfolioRepository):
+        self.portfolio_repo = portfolio_repository
+
+    def value(self, portfolio_id: int) -> PortfolioValuation:
+        return self.value_positions(portfolio_id, self.portfolio_repo.load_positions(portfolio_id))
+
+    def value_positions(self, portfolio_id: int, positions: PositionArrays) -> PortfolioValuation:
+        # None becomes NaN, so this also marks the positions without a price
+        approximate_values = positions.quantities.astype(np.float64) * positions.prices.astype(np.float64)
+        priced = ~np.isnan(approximate_values)
+        market_values = np.full(len(positions), None, dtype=object)
+        market_values[priced] = positions.quantities[priced] * positions.prices[priced]
+        currencies, currency_index = np.unique(positions.currencies, return_inverse=True)
+        totals = _sum_by(currency_index[priced], market_values[priced], len(currencies))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = approximate_values / totals.astype(np.float64)[currency_index]
+        # A currency whose longs and shorts net to zero has no meaningful weights
+        weights[~np.isfinite(weights)] = np.nan
+
+        return PortfolioValuation(
+            portfolio_id=portfolio_id,
+            positions=positions,
+            market_values=market_values,
+            weights=weights,
+            totals=dict(zip(currencies.tolist(), totals.tolist())),
+            by_asset_class=self._breakdown(positions.asset_classes, currencies, currency_index, market_values, priced, totals),
+            by_exchange=self._breakdown(positions.mic_codes, currencies, currency_index, market_values, priced, totals),
+            unpriced=positions.listing_ids[~priced].tolist()
+        )
+
+    def _breakdown(
+        self,
+        keys: np.ndarray,
+        currencies: np.ndarray,
+        currency_index: np.ndarray,
+        market_values: np.ndarray,
+        priced: np.ndarray,
+        totals: np.ndarray
+    ) -> List[ValueBreakdown]:
+        names, key_index = np.unique(keys, return_inverse=True)
+        # One bin per (currency, key) pair
+        groups = (currency_index * len(names) + key_index)[priced]
+        sums = _sum_by(groups, market_values[priced], len(currencies) * len(names))
+        present = np.bincount(groups, minlength=len(sums)) > 0
+        breakdown = []
+        for group in np.flatnonzero(present):
+            currency, key = divmod(int(group), len(names))
+            total = totals[currency]
+            breakdown.append(ValueBreakdown(
+                currency=str(currencies[currency]),
+                key=str(names[key]),
+                market_value=sums[group],
+                weight=float(sums[group] / total) if total else float("nan")
+            ))
+        return breakdown
+
+def _sum_by(groups: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """Sums Decimal values into `size` bins; bincount would go through float64."""
+    sums = np.full(size, Decimal(0), dtype=object)
+    np.add.at(sums, groups, values)
+    return sums
@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+# All functions take date x listing matrices (see PriceMatrix) and work on
+# whole columns at once; none of them loops over dates or listings in Python.
+# Missing values are NaN throughout.
+
+TRADING_DAYS_PER_YEAR = 252
+
+def forward_fill(closes: np.ndarray) -> np.ndarray:
+    """Carries each listing's last close over the dates it didn't trade; NaN before its first close."""
+    rows = np.arange(closes.shape[0])[:, None]
+    last = np.maximum.accumulate(np.where(np.isnan(closes), -1, rows), axis=0)
+    filled = closes[np.maximum(last, 0), np.arange(closes.shape[1])]
+    filled[last < 0] = np.nan
+    return filled
+
+def daily_returns(closes: np.ndarray) -> np.ndarray:
+    """
+    Simple returns for dates[1:]. A listing's return is measured from its own
+    previous close however many rows back that is: a date on which only another
+    venue traded is a missing value, not a day of zero return.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = closes[1:] / forward_fill(closes)[:-1] - 1
+    returns[~np.isfinite(returns)] = np.nan
+    return returns
+
+def _std(values: np.ndarray) -> np.ndarray:
+    valid = ~np.isnan(values)
+    n = valid.sum(axis=0)
+    x = np.where(valid, values, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = x.sum(axis=0) / n
+        variance = (np.where(valid, x - mean, 0.0) ** 2).sum(axis=0) / (n - 1)
+    return np.where(n > 1, np.sqrt(variance), np.nan)
+
+@dataclass
+class ReturnSummary:
+    total_return: np.ndarray
+    annualized_return: np.ndarray
+    annualized_volatility: np.ndarray
+
+def summarize_returns(dates: np.ndarray, closes: np.ndarray, returns: np.ndarray) -> ReturnSummary:
+    columns = np.arange(closes.shape[1])
+    traded = ~np.isnan(closes)
+    first = traded.argmax(axis=0)
+    last = closes.shape[0] - 1 - traded[::-1].argmax(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total = closes[last, columns] / closes[first, columns] - 1
+        years = (dates[last] - dates[first]).astype(np.float64) / 365.25
+        annualized = np.where(years > 0, (1 + total) ** (1 / years) - 1, np.nan)
+    return ReturnSummary(
+        total_return=total,
+        annualized_return=annualized,
+        annualized_volatility=_std(returns) * np.sqrt(TRADING_DAYS_PER_YEAR)
+    )
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    sums = np.cumsum(values, axis=0)
+    sums[window:] = sums[window:] - sums[:-window]
+    return sums
+
+def rolling_volatility(returns: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """
+    Annualized standard deviation of returns over the last `window` rows, once
+    those rows hold at least `min_periods` returns for the listing.
+    """
+    valid = ~np.isnan(returns)
+    x = np.where(valid, returns, 0.0)
+    n = _window_sums(valid.astype(np.float64), window)
+    total = _window_sums(x, window)
+    squares = _window_sums(x * x, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = (squares - total * total / n) / (n - 1)
+    # Running sums can leave a tiny negative variance for a flat series
+    volatility = np.sqrt(np.clip(variance, 0.0, None) * TRADING_DAYS_PER_YEAR)
+    volatility[(n < max(min_periods, 2)) | np.isnan(volatility)] = np.nan
+    return volatility
+
+@dataclass
+class Drawdowns:
+    drawdown: np.ndarray  # fraction below the running peak, <= 0
+    max_drawdown: np.ndarray
+    peak_rows: np.ndarray  # row of the peak before the deepest drawdown; -1 if never traded
+    trough_rows: np.ndarray
+
+def drawdowns(closes: np.ndarray) -> Drawdowns:
+    filled = forward_fill(closes)
+    peaks = np.fmax.accumulate(filled, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = filled / peaks - 1
+    rows = np.arange(closes.shape[0])[:, None]
+    # The date the peak was set, not a later date it was merely carried over
+    peak_rows = np.maximum.accumulate(np.where(closes >= peaks, rows, -1), axis=0)
+
+    columns = np.arange(closes.shape[1])
+    traded = ~np.isnan(drawdown).all(axis=0)
+    trough_rows = np.where(np.isnan(drawdown), np.inf, drawdown).argmin(axis=0)
+    return Drawdowns(
+        drawdown=drawdown,
+        max_drawdown=np.where(traded, drawdown[trough_rows, columns], np.nan),
+        peak_rows=np.where(traded, peak_rows[trough_rows, columns], -1),
+        trough_rows=np.where(traded, trough_rows, -1)
+    )
+
+def correlation_matrix(returns: np.ndarray, min_periods: int) -> np.ndarray:
+    """
+    Pearson correlation of every pair of listings over the dates both have a
+    return for. Pairwise sums come from four matrix products, so 500 listings
+    take milliseconds; pairs sharing fewer than `min_periods` returns are NaN.
+    """
+    valid = ~np.isnan(returns)
+    present = valid.astype(np.float64)
+    x = np.where(valid, returns, 0.0)
+
+    n = present.T @ present
+    sums = x.T @ present  # sums[i, j]: listing i's returns on the dates j has one too
+    squares = (x * x).T @ present
+    products = x.T @ x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariance = products - sums * sums.T / n
+        variance = squares - sums * sums / n
+        correlation = covariance / np.sqrt(variance * variance.T)
+    correlation = np.clip(correlation, -1.0, 1.0)
+    correlation[(n < max(min_periods, 2)) | ~np.isfinite(correlation)] = np.nan
+    return correlation
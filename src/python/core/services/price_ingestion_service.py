@@ -0,0 +1,118 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterator, List, Optional
+
+from core.domain.listing import Listing
+from core.domain.price_bar import PriceBar
+from core.interfaces.market_data import MarketDataBar, PriceHistoryProvider
+from core.repositories.price_repository import PriceRepository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_BATCH_SIZE = 100
+
+@dataclass
+class PriceIngestionSummary:
+    requested: int = 0
+    downloaded: int = 0  # bars received from the provider
+    written: int = 0  # rows inserted or changed; re-ingesting identical bars writes none
+    invalid: int = 0  # bars rejected by validation, e.g. low above high
+    empty: List[str] = field(default_factory=list)  # tickers the provider had no bars for
+    failed: Dict[str, str] = field(default_factory=dict)
+
+class PriceIngestionService:
+    """
+    Loads daily bars for listings in batches of tickers: one provider download and
+    one bulk load (COPY + merge) per batch. The next batch downloads while the
+    current one is written, so the network and the database work in parallel.
+    """
+
+    def __init__(
+        self,
+        price_repository: PriceRepository,
+        provider: PriceHistoryProvider,
+        batch_size: int = DEFAULT_HISTORY_BATCH_SIZE
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.price_repo = price_repository
+        self.provider = provider
+        self.batch_size = batch_size
+
+    def ingest(self, listings: List[Listing], start: date, end: date) -> PriceIngestionSummary:
+        if start > end:
+            raise ValueError("start must not be after end")
+        summary = PriceIngestionSummary(requested=len(listings))
+        by_ticker = self._listing_ids_by_ticker(listings, summary)
+        tickers = list(by_ticker)
+        batches = [tickers[i:i + self.batch_size] for i in range(0, len(tickers), self.batch_size)]
+
+        created = self.price_repo.ensure_partitions(start, end)
+        if created:
+            logger.info(f"Created price partitions: {', '.join(created)}")
+        logger.info(f"Ingesting {start}..{end} for {len(tickers)} tickers in {len(batches)} batches...")
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="price-download") as downloader:
+            pending: Optional[Future] = downloader.submit(self.provider.get_price_history, batches[0], start, end) if batches else None
+            for i, batch in enumerate(batches):
+                future = pending
+                pending = downloader.submit(self.provider.get_price_history, batches[i + 1], start, end) if i + 1 < len(batches) else None
+                try:
+                    history = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to download history for {len(batch)} tickers: {e}")
+                    for ticker in batch:
+                        summary.failed[ticker] = f"Download failed: {e}"
+                    continue
+                summary.written += self.price_repo.bulk_load(self._bars(batch, history, by_ticker, summary))
+
+        logger.info(
+            f"Price ingestion complete: {summary.downloaded} bars downloaded, {summary.written} written, "
+            f"{len(summary.empty)} tickers empty, {len(summary.failed)} failed"
+        )
+        return summary
+
+    def _listing_ids_by_ticker(self, listings: List[Listing], summary: PriceIngestionSummary) -> Dict[str, int]:
+        by_ticker: Dict[str, List[int]] = {}
+        for listing in listings:
+            by_ticker.setdefault(listing.ticker, []).append(listing.id)
+        resolved = {}
+        for ticker, ids in by_ticker.items():
+            if len(set(ids)) > 1:
+                # A provider symbol names one venue; guessing which listing it is
+                # would file one exchange's prices under another.
+                summary.failed[ticker] = f"Ambiguous ticker: {len(set(ids))} listings"
+            else:
+                resolved[ticker] = ids[0]
+        return resolved
+
+    def _bars(
+        self,
+        batch: List[str],
+        history: Dict[str, List[MarketDataBar]],
+        listing_ids: Dict[str, int],
+        summary: PriceIngestionSummary
+    ) -> Iterator[PriceBar]:
+        # A generator, so bars stream into COPY without building a second list
+        for ticker in batch:
+            bars = history.get(ticker) or []
+            if not bars:
+                summary.empty.append(ticker)
+                continue
+            summary.downloaded += len(bars)
+            for bar in bars:
+                try:
+                    yield PriceBar(
+                        listing_id=listing_ids[ticker],
+                        date=bar.date,
+                        open=bar.open,
+                        high=bar.high,
+                        low=bar.low,
+                        close=bar.close,
+                        adj_close=bar.adj_close,
+                        volume=bar.volume
+                    )
+                except ValueError as e:
+                    summary.invalid += 1
+                    logger.debug(f"Skipping {ticker} bar for {bar.date}: {e}")
@@ -0,0 +1,150 @@
+import asyncio
+import logging
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from core.domain.enums import SyncItemStatus
+from core.domain.sync_job import SyncJob, SyncJobItem
+from core.interfaces.market_data import AsyncMarketDataProvider
+from core.repositories.sync_job_repository import SyncJobRepository
+from core.services.asset_sync_service import AssetSyncService, DEFAULT_SYNC_BATCH_SIZE
+from core.services.async_asset_sync_service import AsyncAssetSyncService, DEFAULT_MAX_IN_FLIGHT
+from core.services.sync_summary import SyncSummary
+
+logger = logging.getLogger(__name__)
+
+# A job whose worker has not reported progress for this long is assumed dead.
+HEARTBEAT_TIMEOUT = timedelta(minutes=10)
+MAX_ATTEMPTS = 3
+
+class SyncJobRunner:
+    """
+    Executes queued sync jobs outside the API process.
+    A job is processed in chunks; after each chunk the per-ticker outcome is
+    written back and the heartbeat refreshed, so progress is visible while the job
+    runs and a retry after a crash resumes with the tickers still pending.
+    """
+
+    def __init__(
+        self,
+        job_repository: SyncJobRepository,
+        sync_service: AssetSyncService,
+        worker_id: str,
+        chunk_size: int = DEFAULT_SYNC_BATCH_SIZE
+    ):
+        self.job_repo = job_repository
+        self.sync_service = sync_service
+        self.worker_id = worker_id
+        self.chunk_size = chunk_size
+
+    def run_next(self) -> bool:
+        """Claims and runs one job. Returns False when the queue is empty."""
+        job = self.job_repo.claim_next(self.worker_id)
+        if job is None:
+            return False
+
+        logger.info(f"Worker {self.worker_id} claimed sync job {job.id} (attempt {job.attempts})")
+        try:
+            summary = self.run(job)
+        except Exception as e:
+            logger.error(f"Sync job {job.id} failed: {e}", exc_info=True)
+            self.job_repo.fail(job.id, str(e))
+            return True
+
+        self.job_repo.complete(job.id, asdict(summary))
+        logger.info(f"Sync job {job.id} complete: {summary.synced} synced, {len(summary.failed)} failed")
+        return True
+
+    def run(self, job: SyncJob) -> SyncSummary:
+        pending = self._pending_tickers(job)
+        fresh_within = self._fresh_within(job)
+
+        summary = SyncSummary()
+        for start in range(0, len(pending), self.chunk_size):
+            chunk = pending[start:start + self.chunk_size]
+            chunk_summary = self.sync_service.sync_assets(
+                chunk,
+                batch_size=self.chunk_size,
+                incremental=job.incremental,
+                fresh_within=fresh_within
+            )
+            self.job_repo.record_progress(job.id, self._item_outcomes(chunk, chunk_summary))
+            summary.merge(chunk_summary)
+        return summary
+
+    def _pending_tickers(self, job: SyncJob) -> List[str]:
+        return [i.ticker for i in job.items if i.status == SyncItemStatus.PENDING]
+
+    def _fresh_within(self, job: SyncJob) -> Optional[timedelta]:
+        return timedelta(minutes=job.fresh_within_minutes) if job.fresh_within_minutes else None
+
+    def _item_outcomes(self, tickers: List[str], summary: SyncSummary) -> Dict[str, SyncJobItem]:
+        outcomes = {}
+        for ticker in tickers:
+            if ticker in summary.failed:
+                outcomes[ticker] = SyncJobItem(ticker, SyncItemStatus.FAILED, summary.failed[ticker])
+            elif ticker in summary.skipped:
+                outcomes[ticker] = SyncJobItem(ticker, SyncItemStatus.SKIPPED, summary.skipped[ticker])
+            else:
+                # Includes fresh and unchanged tickers in incremental mode: they are in sync.
+                outcomes[ticker] = SyncJobItem(ticker, SyncItemStatus.SYNCED)
+        return outcomes
+
+class AsyncSyncJobRunner(SyncJobRunner):
+    """
+    Executes queued sync jobs on an event loop, through AsyncAssetSyncService.
+    Lets the API process work the queue without a thread per job: fetches are
+    awaited, and the blocking repository calls are handed to worker threads one
+    at a time, so the session is never used concurrently.
+    """
+
+    def __init__(
+        self,
+        job_repository: SyncJobRepository,
+        sync_service: AssetSyncService,
+        market_data_provider: AsyncMarketDataProvider,
+        worker_id: str,
+        chunk_size: int = DEFAULT_SYNC_BATCH_SIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ):
+        super().__init__(job_repository, sync_service, worker_id, chunk_size)
+        self.market_data = market_data_provider
+        self.max_in_flight = max_in_flight
+
+    async def arun_next(self) -> bool:
+        """Claims and runs one job. Returns False when the queue is empty."""
+        job = await asyncio.to_thread(self.job_repo.claim_next, self.worker_id)
+        if job is None:
+            return False
+
+        logger.info(f"Worker {self.worker_id} claimed sync job {job.id} (attempt {job.attempts})")
+        try:
+            summary = await self.arun(job)
+        except Exception as e:
+            logger.error(f"Sync job {job.id} failed: {e}", exc_info=True)
+            await asyncio.to_thread(self.job_repo.fail, job.id, str(e))
+            return True
+
+        await asyncio.to_thread(self.job_repo.complete, job.id, asdict(summary))
+        logger.info(f"Sync job {job.id} complete: {summary.synced} synced, {len(summary.failed)} failed")
+        return True
+
+    async def arun(self, job: SyncJob) -> SyncSummary:
+        pending = self._pending_tickers(job)
+        engine = AsyncAssetSyncService(
+            self.sync_service,
+            self.market_data,
+            max_in_flight=self.max_in_flight,
+            batch_size=self.chunk_size,
+            incremental=job.incremental,
+            fresh_within=self._fresh_within(job)
+        )
+
+        summary = SyncSummary()
+        for start in range(0, len(pending), self.chunk_size):
+            chunk = pending[start:start + self.chunk_size]
+            chunk_summary = await engine.sync_assets(chunk)
+            await asyncio.to_thread(self.job_repo.record_progress, job.id, self._item_outcomes(chunk, chunk_summary))
+            summary.merge(chunk_summary)
+        return summary
@@ -0,0 +1,52 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+@dataclass
+class SyncSummary:
+    """
+    Outcome of a sync run.
+    Successes are only counted, but every skipped or failed ticker is reported with
+    its reason so one bad row never hides behind an otherwise successful run.
+    """
+    requested: int = 0
+    # Tickers the provider returned data for
+    fetched: int = 0
+    synced: int = 0
+    # Incremental mode only: skipped before fetching because they were synced recently,
+    # fetched but identical to what is stored, or actually written.
+    fresh: int = 0
+    unchanged: int = 0
+    updated: int = 0
+    inserted: int = 0
+    skipped: Dict[str, str] = field(default_factory=dict)
+    failed: Dict[str, str] = field(default_factory=dict)
+    # Mapping misses: provider exchange code that resolved to no seeded exchange
+    # (by mapping, MIC or ticker suffix) -> number of tickers skipped because of it
+    unknown_exchanges: Dict[str, int] = field(default_factory=dict)
+
+    def skip_unknown_exchange(self, ticker: str, exchange_code: Optional[str]) -> None:
+        code = exchange_code or "<missing>"
+        self.unknown_exchanges[code] = self.unknown_exchanges.get(code, 0) + 1
+        self.skipped[ticker] = f"Unknown exchange {exchange_code}"
+
+    def log_unknown_exchanges(self, logger: logging.Logger) -> None:
+        # One line per run instead of one per ticker: a missing venue typically
+        # affects hundreds of tickers at once.
+        if self.unknown_exchanges:
+            counts = ", ".join(f"{code} ({count})" for code, count in sorted(self.unknown_exchanges.items()))
+            logger.warning(f"Skipped tickers on unknown exchanges: {counts}")
+
+    def merge(self, other: "SyncSummary") -> "SyncSummary":
+        self.requested += other.requested
+        self.fetched += other.fetched
+        self.synced += other.synced
+        self.fresh += other.fresh
+        self.unchanged += other.unchanged
+        self.updated += other.updated
+        self.inserted += other.inserted
+        self.skipped.update(other.skipped)
+        self.failed.update(other.failed)
+        for code, count in other.unknown_exchanges.items():
+            self.unknown_exchanges[code] = self.unknown_exchanges.get(code, 0) + count
+        return self
@@ -1,10 +1,10 @@
 import datetime
 
-from sqlalchemy import Boolean, CheckConstraint, Column, DateTime, Enum, ForeignKey, Integer, String, UniqueConstraint, func
+from sqlalchemy import DDL, JSON, BigInteger, Boolean, CheckConstraint, Column, Date, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, Text, UniqueConstraint, event, func, text
 from sqlalchemy.orm import relationship
 
 from infrastructure.database.base import Base
-from core.domain.enums import AssetClass
+from core.domain.enums import AssetClass, ExchangeCodeKind, SyncItemStatus, SyncJobStatus
 
 class ExchangeModel(Base):
     __tablename__ = "exchanges"
@@ -26,6 +26,27 @@ class ExchangeModel(Base):
     def __repr__(self):
         return f"<Exchange(id={self.id}, mic_code='{self.mic_code}', name='{self.name}')>"
 
+class ExchangeMappingModel(Base):
+    __tablename__ = "provider_exchange_mappings"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    provider = Column(String(50), nullable=False)
+    kind = Column(Enum(ExchangeCodeKind), nullable=False)
+    code = Column(String(20), nullable=False)
+    # Not a foreign key: a mapping may be added before its exchange is seeded
+    mic_code = Column(String(20), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("provider", "kind", "code", name="uq_provider_exchange_mapping"),
+        CheckConstraint("length(code) > 0", name="check_mapping_code_length"),
+        CheckConstraint("length(mic_code) > 0", name="check_mapping_mic_code_length"),
+    )
+
+    def __repr__(self):
+        return f"<ExchangeMapping(provider='{self.provider}', kind='{self.kind}', code='{self.code}', mic_code='{self.mic_code}')>"
+
 class AssetModel(Base):
     __tablename__ = "assets"
 
@@ -42,6 +63,8 @@ class AssetModel(Base):
     # Constraints for robust data integrity
     __table_args__ = (
         CheckConstraint("length(name) > 0", name="check_name_length"),
+        # Pages of one asset class in ID order
+        Index("ix_assets_asset_class_id", "asset_class", "id"),
     )
 
     def __repr__(self):
@@ -56,6 +79,8 @@ class ListingModel(Base):
     ticker = Column(String(20), nullable=False)
     currency = Column(String(10), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
+    content_hash = Column(String(64), nullable=True)
+    synced_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -64,7 +89,166 @@ class ListingModel(Base):
     __table_args__ = (
         CheckConstraint("length(ticker) > 0", name="check_ticker_length"),
         UniqueConstraint('ticker', 'exchange_id', name='uq_listing_ticker_exchange'),
+        Index("ix_listings_asset_id", "asset_id"),
+        Index("ix_listings_exchange_id", "exchange_id"),
     )
 
     def __repr__(self):
         return f"<Listing(id={self.id}, ticker='{self.ticker}', exchange_id={self.exchange_id})>"
+
+def _trigram_available(ddl, target, bind, **kw) -> bool:
+    # pg_trgm is one of Postgres' contrib modules, which some builds leave out.
+    # Tables are still created there; only fuzzy search is unavailable.
+    return bind.dialect.name == "postgresql" and bind.execute(
+        text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).first() is not None
+
+# Trigram GIN indexes serving fuzzy name and ticker search (SqlAlchemyAssetRepository.search)
+event.listen(
+    AssetModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(callable_=_trigram_available)
+)
+event.listen(
+    AssetModel.__table__,
+    "after_create",
+    DDL("CREATE INDEX ix_assets_name_trgm ON assets USING gin (name gin_trgm_ops)").execute_if(callable_=_trigram_available)
+)
+event.listen(
+    ListingModel.__table__,
+    "after_create",
+    DDL("CREATE INDEX ix_listings_ticker_trgm ON listings USING gin (ticker gin_trgm_ops)").execute_if(callable_=_trigram_available)
+)
+
+class ListingPriceModel(Base):
+    __tablename__ = "listing_prices"
+
+    # The primary key doubles as the (listing, date range) index for history reads
+    listing_id = Column(Integer, ForeignKey("listings.id", ondelete="CASCADE"), primary_key=True)
+    date = Column(Date, primary_key=True)
+    open = Column(Numeric(20, 6), nullable=False)
+    high = Column(Numeric(20, 6), nullable=False)
+    low = Column(Numeric(20, 6), nullable=False)
+    close = Column(Numeric(20, 6), nullable=False)
+    adj_close = Column(Numeric(20, 6), nullable=True)
+    volume = Column(BigInteger, nullable=True)
+
+    __table_args__ = (
+        CheckConstraint("low <= high", name="check_price_low_high"),
+        CheckConstraint("low >= 0", name="check_price_non_negative"),
+        CheckConstraint("volume IS NULL OR volume >= 0", name="check_price_volume"),
+        # Declared on the parent, so every partition gets its own; a few pages per
+        # partition instead of a btree entry per row, since bars arrive in date order.
+        Index("ix_listing_prices_date_brin", "date", postgresql_using="brin"),
+        # One partition per calendar year (see SqlAlchemyPriceRepository.ensure_partitions)
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
+
+    def __repr__(self):
+        return f"<ListingPrice(listing_id={self.listing_id}, date={self.date}, close={self.close})>"
+
+# Catches bars outside every yearly partition, so a load never fails for want
+# of one; ensure_partitions moves such rows into their year when it creates it.
+event.listen(
+    ListingPriceModel.__table__,
+    "after_create",
+    DDL("CREATE TABLE listing_prices_default PARTITION OF listing_prices DEFAULT").execute_if(dialect="postgresql")
+)
+
+class ListingLatestPriceModel(Base):
+    __tablename__ = "listing_latest_prices"
+
+    # The newest bar of each listing, kept current by SqlAlchemyPriceRepository.bulk_load
+    # so "last price" reads are a key lookup instead of a search of the history.
+    listing_id = Column(Integer, ForeignKey("listings.id", ondelete="CASCADE"), primary_key=True)
+    date = Column(Date, nullable=False)
+    close = Column(Numeric(20, 6), nullable=False)
+    adj_close = Column(Numeric(20, 6), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<ListingLatestPrice(listing_id={self.listing_id}, date={self.date}, close={self.close})>"
+
+class PortfolioModel(Base):
+    __tablename__ = "portfolios"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("length(name) > 0", name="check_portfolio_name_length"),
+    )
+
+    def __repr__(self):
+        return f"<Portfolio(id={self.id}, name='{self.name}')>"
+
+class HoldingModel(Base):
+    __tablename__ = "portfolio_holdings"
+
+    # One position per listing; the key also serves "all holdings of a portfolio"
+    portfolio_id = Column(Integer, ForeignKey("portfolios.id", ondelete="CASCADE"), primary_key=True)
+    listing_id = Column(Integer, ForeignKey("listings.id"), primary_key=True)
+    quantity = Column(Numeric(28, 10), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("quantity <> 0", name="check_holding_quantity"),
+    )
+
+    def __repr__(self):
+        return f"<Holding(portfolio_id={self.portfolio_id}, listing_id={self.listing_id}, quantity={self.quantity})>"
+
+class SyncJobModel(Base):
+    __tablename__ = "sync_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    status = Column(Enum(SyncJobStatus), nullable=False, default=SyncJobStatus.PENDING)
+    incremental = Column(Boolean, default=False, nullable=False)
+    fresh_within_minutes = Column(Integer, nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    worker_id = Column(String(255), nullable=True)
+    error = Column(Text, nullable=True)
+    summary = Column(JSON, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    items = relationship("SyncJobItemModel", backref="job", cascade="all, delete-orphan", order_by="SyncJobItemModel.id")
+
+    __table_args__ = (
+        CheckConstraint("attempts >= 0", name="check_sync_job_attempts"),
+        # Workers poll for the oldest pending job; keep that lookup off a full scan.
+        Index("ix_sync_jobs_status_id", "status", "id"),
+    )
+
+    def __repr__(self):
+        return f"<SyncJob(id={self.id}, status='{self.status}')>"
+
+class SyncJobItemModel(Base):
+    __tablename__ = "sync_job_items"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, ForeignKey("sync_jobs.id", ondelete="CASCADE"), nullable=False)
+    ticker = Column(String(20), nullable=False)
+    status = Column(Enum(SyncItemStatus), nullable=False, default=SyncItemStatus.PENDING)
+    message = Column(Text, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("length(ticker) > 0", name="check_sync_item_ticker_length"),
+        UniqueConstraint('job_id', 'ticker', name='uq_sync_job_item_ticker'),
+        # Single-flight: a ticker is pending in at most one job, so overlapping
+        # sync requests attach to the queued work instead of fetching it again.
+        Index(
+            "uq_sync_job_items_pending_ticker", "ticker", unique=True,
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'")
+        ),
+    )
+
+    def __repr__(self):
+        return f"<SyncJobItem(job_id={self.job_id}, ticker='{self.ticker}', status='{self.status}')>"
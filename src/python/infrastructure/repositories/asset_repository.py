@@ -1,16 +1,27 @@
-from typing import List, Optional
+import zlib
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import select, func
+from sqlalchemy import Float, and_, case, cast, exists, or_, select, func, text, tuple_, union, update
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from core.domain.asset import Asset
+from core.domain.asset import Asset, AssetFilter, AssetMatch
 from core.repositories.asset_repository import AssetRepository
-from infrastructure.database.models import AssetModel
+from infrastructure.database.models import AssetModel, ExchangeModel, ListingModel
+from infrastructure.repositories.batching import chunked, id_in
+from infrastructure.services.listing_resolve_cache import RESOLVE_CACHE, ListingResolveCache
+
+# Lowest word similarity between the query and part of a name for a match
+SEARCH_WORD_SIMILARITY = 0.5
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 class SqlAlchemyAssetRepository(AssetRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, resolve_cache: ListingResolveCache = RESOLVE_CACHE):
         self.session = session
+        # Ticker resolutions carry the asset, so asset writes invalidate them
+        self.resolve_cache = resolve_cache
 
     def _to_domain(self, model: AssetModel) -> Asset:
         return Asset(
@@ -45,11 +56,107 @@ class SqlAlchemyAssetRepository(AssetRepository):
             return self._to_domain(result)
         return None
 
+    def get_by_ids(self, asset_ids: List[int]) -> List[Asset]:
+        # Plain rows, not ORM instances: a batch is thousands of rows, and
+        # identity-mapped objects for each mostly make work for the garbage
+        # collector. Rows carry the same attribute names, so _to_domain applies.
+        stmt = select(AssetModel.__table__).where(id_in(self.session, AssetModel.id, asset_ids))
+        return [self._to_domain(r) for r in self.session.execute(stmt)]
+
     def list_all(self) -> List[Asset]:
         stmt = select(AssetModel)
         results = self.session.execute(stmt).scalars().all()
         return [self._to_domain(r) for r in results]
 
+    def list_page(self, after_id: Optional[int], limit: int, filters: Optional[AssetFilter] = None) -> List[Asset]:
+        # Keyset on the primary key: every page is an index range scan of limit
+        # rows, where OFFSET would walk past all earlier pages first.
+        stmt = self._filtered(select(AssetModel), filters).order_by(AssetModel.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(AssetModel.id > after_id)
+        return [self._to_domain(r) for r in self.session.execute(stmt).scalars()]
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        filters: Optional[AssetFilter] = None,
+        after: Optional[Tuple[float, int]] = None
+    ) -> List[AssetMatch]:
+        query = query.strip()
+        if self.session.get_bind().dialect.name == "postgresql":
+            # The "%>" operator reads its cut-off from this setting. The default,
+            # 0.6, rejects a single typo in a short word ("aple"). set_config's
+            # is_local limits the change to this transaction.
+            self.session.execute(select(func.set_config(
+                "pg_trgm.word_similarity_threshold", str(SEARCH_WORD_SIMILARITY), True
+            )))
+            # pg_trgm: both candidate conditions are served by the trigram GIN
+            # indexes, so only close names and tickers are ever scored.
+            # "%>" is word similarity: a close match to any part of the name.
+            # A UNION rather than an OR of the two, which the planner can only
+            # answer by testing every asset name in turn.
+            candidates = AssetModel.id.in_(union(
+                select(AssetModel.id).where(AssetModel.name.op("%>")(query)),
+                select(ListingModel.asset_id).where(or_(
+                    ListingModel.ticker.op("%")(query),
+                    ListingModel.ticker.ilike(_escape_like(query) + "%", escape="\\")
+                ))
+            ))
+            best_ticker = (
+                select(func.max(case(
+                    (func.upper(ListingModel.ticker) == query.upper(), 1.0),
+                    else_=func.similarity(ListingModel.ticker, query)
+                )))
+                .where(ListingModel.asset_id == AssetModel.id)
+                .correlate(AssetModel)
+                .scalar_subquery()
+            )
+            score = func.greatest(func.word_similarity(query, AssetModel.name), func.coalesce(best_ticker, 0))
+        else:
+            # Without trigrams: substring matches, exact tickers first
+            candidates = or_(
+                AssetModel.name.icontains(query, autoescape=True),
+                exists().where(ListingModel.asset_id == AssetModel.id, ListingModel.ticker.icontains(query, autoescape=True))
+            )
+            exact_ticker = exists().where(
+                ListingModel.asset_id == AssetModel.id, func.upper(ListingModel.ticker) == query.upper()
+            )
+            score = case((exact_ticker, 1.0), else_=0.5)
+        scored = self._filtered(
+            select(AssetModel.id.label("id"), cast(score, Float).label("score")).where(candidates), filters
+        ).subquery()
+
+        # Keyset on (score, id), the result order, so later pages neither skip
+        # nor repeat matches the way OFFSET would if rows change in between.
+        stmt = select(AssetModel, scored.c.score).join(scored, scored.c.id == AssetModel.id)
+        if after is not None:
+            after_score, after_id = after
+            stmt = stmt.where(or_(
+                scored.c.score < after_score,
+                and_(scored.c.score == after_score, scored.c.id > after_id)
+            ))
+        stmt = stmt.order_by(scored.c.score.desc(), scored.c.id).limit(limit)
+        return [AssetMatch(asset=self._to_domain(model), score=score) for model, score in self.session.execute(stmt)]
+
+    def _filtered(self, stmt, filters: Optional[AssetFilter]):
+        if filters is None:
+            return stmt
+        if filters.asset_class is not None:
+            stmt = stmt.where(AssetModel.asset_class == filters.asset_class)
+        if filters.is_active is not None:
+            stmt = stmt.where(AssetModel.is_active == filters.is_active)
+        if filters.mic_code is not None or filters.currency is not None:
+            listed = select(ListingModel.id).where(ListingModel.asset_id == AssetModel.id)
+            if filters.mic_code is not None:
+                listed = listed.join(ExchangeModel, ExchangeModel.id == ListingModel.exchange_id).where(
+                    ExchangeModel.mic_code == filters.mic_code
+                )
+            if filters.currency is not None:
+                listed = listed.where(ListingModel.currency == filters.currency)
+            stmt = stmt.where(listed.exists())
+        return stmt
+
     # Removed get_by_ticker since ticker is no longer on Asset
 
     def upsert(self, asset: Asset) -> Asset:
@@ -81,8 +188,14 @@ class SqlAlchemyAssetRepository(AssetRepository):
                 set_=model_data
             ).returning(AssetModel)
 
-            result = self.session.execute(stmt).scalar_one()
-            self.session.commit()
+            try:
+                result = self.session.execute(stmt).scalar_one()
+                self.session.commit()
+            except Exception:
+                # Leave the session usable for the caller's next row.
+                self.session.rollback()
+                raise
+            self.resolve_cache.invalidate_assets([result.id])
             return self._to_domain(result)
         else:
              # If no ISIN, try to find by name and asset_class as a fallback "identity"
@@ -100,7 +213,126 @@ class SqlAlchemyAssetRepository(AssetRepository):
                  # name/class are same
                  existing.updated_at = func.now()
                  self.session.commit()
+                 self.resolve_cache.invalidate_assets([existing.id])
                  self.session.refresh(existing)
                  return self._to_domain(existing)
              else:
                  return self.create(asset)
+
+    def upsert_many(self, assets: List[Asset]) -> List[Asset]:
+        if not assets:
+            return []
+
+        try:
+            by_isin = self._upsert_many_by_isin([a for a in assets if a.isin])
+            by_identity = self._upsert_many_by_identity([a for a in assets if not a.isin])
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        self.resolve_cache.invalidate_assets([a.id for a in list(by_isin.values()) + list(by_identity.values())])
+
+        return [
+            by_isin[a.isin] if a.isin else by_identity[(a.name, a.asset_class)]
+            for a in assets
+        ]
+
+    def _upsert_many_by_isin(self, assets: List[Asset]) -> Dict[str, Asset]:
+        # ON CONFLICT cannot touch the same row twice in one statement, so collapse
+        # duplicates first (last one wins). Sorting by ISIN makes concurrent batches
+        # take row locks in the same order, which keeps them from deadlocking.
+        unique = {a.isin: a for a in assets}
+        rows = [
+            {
+                "name": a.name,
+                "asset_class": a.asset_class,
+                "isin": a.isin,
+                "is_active": a.is_active,
+            }
+            for _, a in sorted(unique.items())
+        ]
+
+        saved = {}
+        for chunk in chunked(rows):
+            stmt = pg_insert(AssetModel).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[AssetModel.isin],
+                set_={
+                    "name": stmt.excluded.name,
+                    "asset_class": stmt.excluded.asset_class,
+                    "is_active": stmt.excluded.is_active,
+                    "updated_at": func.now()
+                }
+            ).returning(AssetModel)
+
+            results = self.session.execute(
+                stmt, execution_options={"populate_existing": True}
+            ).scalars().all()
+            for model in results:
+                saved[model.isin] = self._to_domain(model)
+        return saved
+
+    def _upsert_many_by_identity(self, assets: List[Asset]) -> Dict[Tuple[str, object], Asset]:
+        # Same fallback identity as `upsert`: assets without an ISIN are matched on
+        # name + asset class, which has no unique constraint to conflict on.
+        unique = {(a.name, a.asset_class): a for a in assets}
+        if not unique:
+            return {}
+
+        # Without a constraint, two concurrent writers (e.g. sync shards) could both
+        # miss the SELECT below and insert the same asset twice. Transaction-scoped
+        # advisory locks on the identity serialize them; taking them in sorted order
+        # keeps writers with overlapping batches from deadlocking.
+        lock_keys = sorted({
+            zlib.crc32(f"{name}|{asset_class.value}".encode()) for name, asset_class in unique
+        })
+        self.session.execute(
+            text("SELECT pg_advisory_xact_lock(k) FROM unnest(CAST(:keys AS bigint[])) AS k"),
+            {"keys": lock_keys}
+        )
+
+        existing = {}
+        keys = list(unique.keys())
+        for chunk in chunked(keys):
+            stmt = select(AssetModel.id, AssetModel.name, AssetModel.asset_class).where(
+                tuple_(AssetModel.name, AssetModel.asset_class).in_(chunk),
+                AssetModel.isin == None
+            ).order_by(AssetModel.id)
+            for row in self.session.execute(stmt):
+                # Legacy duplicates may exist; the oldest row is the canonical one.
+                existing.setdefault((row.name, row.asset_class), row.id)
+
+        saved = {}
+        for is_active in (True, False):
+            ids = sorted(
+                asset_id for key, asset_id in existing.items()
+                if unique[key].is_active == is_active
+            )
+            for chunk in chunked(ids):
+                stmt = (
+                    update(AssetModel)
+                    .where(AssetModel.id.in_(chunk))
+                    .values(is_active=is_active, updated_at=func.now())
+                    .returning(AssetModel)
+                )
+                results = self.session.execute(
+                    stmt, execution_options={"populate_existing": True}
+                ).scalars().all()
+                for model in results:
+                    saved[(model.name, model.asset_class)] = self._to_domain(model)
+
+        missing = [
+            {
+                "name": a.name,
+                "asset_class": a.asset_class,
+                "isin": None,
+                "is_active": a.is_active,
+            }
+            for key, a in unique.items() if key not in existing
+        ]
+        for chunk in chunked(missing):
+            stmt = pg_insert(AssetModel).values(chunk).returning(AssetModel)
+            for model in self.session.execute(stmt).scalars().all():
+                saved[(model.name, model.asset_class)] = self._to_domain(model)
+
+        return saved
@@ -0,0 +1,27 @@
+from typing import Iterator, List, TypeVar
+
+from sqlalchemy import BigInteger, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+# Postgres caps a statement at 65535 bind parameters; 1000 rows keeps multi-row
+# statements well below that while still amortising the round trip.
+UPSERT_CHUNK_SIZE = 1000
+
+def chunked(items: List[T], size: int = UPSERT_CHUNK_SIZE) -> Iterator[List[T]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def id_in(session: Session, column, ids: List[int]):
+    """
+    `column = ANY(:ids)` on Postgres: the IDs travel as one array parameter, so
+    the statement text is the same however many there are and a lookup of
+    thousands needs neither chunking nor thousands of binds. Elsewhere, IN.
+    The array is bigint[] so an ID past the integer range is simply not found
+    instead of failing the cast; btree still compares integer with bigint.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        return column == any_(literal(ids, ARRAY(BigInteger)))
+    return column.in_(ids)
@@ -5,8 +5,10 @@ from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from core.domain.exchange import Exchange
+from core.domain.exchange_mapping import ExchangeMapping
 from core.repositories.exchange_repository import ExchangeRepository
-from infrastructure.database.models import ExchangeModel
+from infrastructure.database.models import ExchangeModel, ExchangeMappingModel
+from infrastructure.repositories.batching import id_in
 
 class SqlAlchemyExchangeRepository(ExchangeRepository):
     def __init__(self, session: Session):
@@ -45,11 +47,21 @@ class SqlAlchemyExchangeRepository(ExchangeRepository):
             return self._to_domain(result)
         return None
 
+    def get_by_ids(self, exchange_ids: List[int]) -> List[Exchange]:
+        stmt = select(ExchangeModel).where(id_in(self.session, ExchangeModel.id, exchange_ids))
+        return [self._to_domain(m) for m in self.session.execute(stmt).scalars()]
+
     def list_all(self) -> List[Exchange]:
         stmt = select(ExchangeModel)
         results = self.session.execute(stmt).scalars().all()
         return [self._to_domain(r) for r in results]
 
+    def list_page(self, after_id: Optional[int], limit: int) -> List[Exchange]:
+        stmt = select(ExchangeModel).order_by(ExchangeModel.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(ExchangeModel.id > after_id)
+        return [self._to_domain(r) for r in self.session.execute(stmt).scalars()]
+
     def upsert(self, exchange: Exchange) -> Exchange:
         model_data = {
             "name": exchange.name,
@@ -80,3 +92,36 @@ class SqlAlchemyExchangeRepository(ExchangeRepository):
         if result:
             return self._to_domain(result)
         return None
+
+    def _mapping_to_domain(self, model: ExchangeMappingModel) -> ExchangeMapping:
+        return ExchangeMapping(
+            id=model.id,
+            provider=model.provider,
+            kind=model.kind,
+            code=model.code,
+            mic_code=model.mic_code,
+            created_at=model.created_at,
+            updated_at=model.updated_at
+        )
+
+    def list_mappings(self, provider: str) -> List[ExchangeMapping]:
+        stmt = select(ExchangeMappingModel).where(ExchangeMappingModel.provider == provider)
+        results = self.session.execute(stmt).scalars().all()
+        return [self._mapping_to_domain(r) for r in results]
+
+    def upsert_mapping(self, mapping: ExchangeMapping) -> ExchangeMapping:
+        stmt = pg_insert(ExchangeMappingModel).values(
+            provider=mapping.provider,
+            kind=mapping.kind,
+            code=mapping.code,
+            mic_code=mapping.mic_code
+        )
+
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ExchangeMappingModel.provider, ExchangeMappingModel.kind, ExchangeMappingModel.code],
+            set_={"mic_code": mapping.mic_code, "updated_at": func.now()}
+        ).returning(ExchangeMappingModel)
+
+        result = self.session.execute(stmt).scalar_one()
+        self.session.commit()
+        return self._mapping_to_domain(result)
@@ -1,18 +1,26 @@
-from typing import List, Optional
+from datetime import date
+from decimal import Decimal
+from typing import Iterator, List, Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from core.domain.asset import Asset
+from core.domain.catalog_entry import CatalogEntry
 from core.domain.listing import Listing
+from core.domain.resolved_listing import ResolvedListing
 from core.repositories.listing_repository import ListingRepository
-from infrastructure.database.models import ListingModel
+from infrastructure.database.models import AssetModel, ExchangeModel, ListingLatestPriceModel, ListingModel
+from infrastructure.repositories.batching import chunked, id_in
+from infrastructure.services.listing_resolve_cache import RESOLVE_CACHE, ListingResolveCache
 
 class SqlAlchemyListingRepository(ListingRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, resolve_cache: ListingResolveCache = RESOLVE_CACHE):
         self.session = session
+        self.resolve_cache = resolve_cache
 
-    def _to_domain(self, model: ListingModel) -> Listing:
+    def _to_domain(self, model: ListingModel, last_price: Optional[Decimal] = None, last_price_date: Optional[date] = None) -> Listing:
         return Listing(
             id=model.id,
             asset_id=model.asset_id,
@@ -20,8 +28,19 @@ class SqlAlchemyListingRepository(ListingRepository):
             ticker=model.ticker,
             currency=model.currency,
             is_active=model.is_active,
+            content_hash=model.content_hash,
+            synced_at=model.synced_at,
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            last_price=last_price,
+            last_price_date=last_price_date
+        )
+
+    def _select_with_latest_price(self, listing=ListingModel):
+        # The latest-price table has one row per listing, so this stays a keyed
+        # join however long the price history grows.
+        return select(listing, ListingLatestPriceModel.close, ListingLatestPriceModel.date).outerjoin(
+            ListingLatestPriceModel, ListingLatestPriceModel.listing_id == ListingModel.id
         )
 
     def _to_model(self, domain: Listing) -> ListingModel:
@@ -30,37 +49,121 @@ class SqlAlchemyListingRepository(ListingRepository):
             exchange_id=domain.exchange_id,
             ticker=domain.ticker,
             currency=domain.currency,
-            is_active=domain.is_active
+            is_active=domain.is_active,
+            content_hash=domain.content_hash
         )
 
     def create(self, listing: Listing) -> Listing:
         model = self._to_model(listing)
         self.session.add(model)
         self.session.commit()
+        self.resolve_cache.invalidate([listing.ticker])
         self.session.refresh(model)
         return self._to_domain(model)
 
     def get_by_id(self, listing_id: int) -> Optional[Listing]:
-        stmt = select(ListingModel).where(ListingModel.id == listing_id)
-        result = self.session.execute(stmt).scalar_one_or_none()
+        stmt = self._select_with_latest_price().where(ListingModel.id == listing_id)
+        result = self.session.execute(stmt).one_or_none()
         if result:
-            return self._to_domain(result)
+            return self._to_domain(*result)
         return None
 
+    def get_by_ids(self, listing_ids: List[int]) -> List[Listing]:
+        # Plain rows rather than ORM instances, as in SqlAlchemyAssetRepository.get_by_ids
+        stmt = self._select_with_latest_price(ListingModel.__table__).where(
+            id_in(self.session, ListingModel.id, listing_ids)
+        )
+        return [self._to_domain(r, r.close, r.date) for r in self.session.execute(stmt)]
+
+    def resolve(self, ticker: str, mic_code: Optional[str] = None) -> List[ResolvedListing]:
+        key = (ticker, mic_code)
+        cached = self.resolve_cache.get(key)
+        if cached is not None:
+            # A hit never touches the session, so no connection is checked out
+            return list(cached)
+
+        generation = self.resolve_cache.generation()
+        # Served by the (ticker, exchange_id) unique index and the exchange's MIC index
+        stmt = (
+            select(ListingModel, AssetModel, ExchangeModel.mic_code)
+            .join(AssetModel, AssetModel.id == ListingModel.asset_id)
+            .join(ExchangeModel, ExchangeModel.id == ListingModel.exchange_id)
+            .where(ListingModel.ticker == ticker)
+            .order_by(ListingModel.id)
+        )
+        if mic_code is not None:
+            stmt = stmt.where(ExchangeModel.mic_code == mic_code)
+        resolved = tuple(
+            ResolvedListing(
+                listing=self._to_domain(listing),
+                asset=Asset(
+                    id=asset.id,
+                    name=asset.name,
+                    asset_class=asset.asset_class,
+                    isin=asset.isin,
+                    is_active=asset.is_active,
+                    created_at=asset.created_at,
+                    updated_at=asset.updated_at
+                ),
+                mic_code=mic
+            )
+            for listing, asset, mic in self.session.execute(stmt)
+        )
+        self.resolve_cache.put(key, resolved, generation)
+        return list(resolved)
+
     def list_all(self) -> List[Listing]:
-        stmt = select(ListingModel)
-        results = self.session.execute(stmt).scalars().all()
-        return [self._to_domain(r) for r in results]
+        stmt = self._select_with_latest_price()
+        results = self.session.execute(stmt).all()
+        return [self._to_domain(*r) for r in results]
+
+    def list_page(self, after_id: Optional[int], limit: int) -> List[Listing]:
+        stmt = self._select_with_latest_price().order_by(ListingModel.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(ListingModel.id > after_id)
+        return [self._to_domain(*r) for r in self.session.execute(stmt)]
 
     def get_by_asset_id(self, asset_id: int) -> List[Listing]:
-        stmt = select(ListingModel).where(ListingModel.asset_id == asset_id)
-        results = self.session.execute(stmt).scalars().all()
-        return [self._to_domain(r) for r in results]
+        stmt = self._select_with_latest_price().where(ListingModel.asset_id == asset_id)
+        results = self.session.execute(stmt).all()
+        return [self._to_domain(*r) for r in results]
+
+    def stream_catalog(self, batch_size: int) -> Iterator[List[CatalogEntry]]:
+        stmt = (
+            select(
+                ListingModel.id, ListingModel.ticker, ListingModel.currency, ListingModel.is_active,
+                AssetModel.id, AssetModel.name, AssetModel.asset_class, AssetModel.isin, AssetModel.is_active,
+                ExchangeModel.id, ExchangeModel.mic_code, ExchangeModel.name
+            )
+            .join(AssetModel, AssetModel.id == ListingModel.asset_id)
+            .join(ExchangeModel, ExchangeModel.id == ListingModel.exchange_id)
+            .order_by(ListingModel.id)
+        )
+        # yield_per runs the query on a server-side cursor (psycopg's named
+        # cursor) and fetches batch_size rows per round trip, so memory holds
+        # one batch however big the catalog. Executed on the session's
+        # connection, plain column rows skip the ORM's result processing.
+        result = self.session.connection().execute(stmt, execution_options={"yield_per": batch_size})
+        try:
+            for rows in result.partitions():
+                yield [
+                    CatalogEntry(
+                        listing_id=r[0], ticker=r[1], currency=r[2], listing_is_active=r[3],
+                        asset_id=r[4], asset_name=r[5], asset_class=r[6].value, isin=r[7], asset_is_active=r[8],
+                        exchange_id=r[9], mic_code=r[10], exchange_name=r[11]
+                    )
+                    for r in rows
+                ]
+        finally:
+            # Releases the cursor when the consumer stops early, e.g. on a client disconnect
+            result.close()
 
     def upsert(self, listing: Listing) -> Listing:
         model_data = {
             "currency": listing.currency,
             "is_active": listing.is_active,
+            "content_hash": listing.content_hash,
+            "synced_at": func.now(),
             "updated_at": func.now()
         }
 
@@ -71,7 +174,9 @@ class SqlAlchemyListingRepository(ListingRepository):
             exchange_id=listing.exchange_id,
             ticker=listing.ticker,
             currency=listing.currency,
-            is_active=listing.is_active
+            is_active=listing.is_active,
+            content_hash=listing.content_hash,
+            synced_at=func.now()
         )
 
         stmt = stmt.on_conflict_do_update(
@@ -79,6 +184,87 @@ class SqlAlchemyListingRepository(ListingRepository):
             set_=model_data
         ).returning(ListingModel)
 
-        result = self.session.execute(stmt).scalar_one()
-        self.session.commit()
+        try:
+            result = self.session.execute(stmt).scalar_one()
+            self.session.commit()
+        except Exception:
+            # Leave the session usable for the caller's next row.
+            self.session.rollback()
+            raise
+        self.resolve_cache.invalidate([listing.ticker])
         return self._to_domain(result)
+
+    def upsert_many(self, listings: List[Listing]) -> List[Listing]:
+        if not listings:
+            return []
+
+        # ON CONFLICT cannot touch the same row twice in one statement, so collapse
+        # duplicates first (last one wins). Sorting by the conflict key makes
+        # concurrent batches take row locks in the same order.
+        unique = {(l.ticker, l.exchange_id): l for l in listings}
+        rows = [
+            {
+                "asset_id": l.asset_id,
+                "exchange_id": l.exchange_id,
+                "ticker": l.ticker,
+                "currency": l.currency,
+                "is_active": l.is_active,
+                "content_hash": l.content_hash,
+                "synced_at": func.now(),
+            }
+            for _, l in sorted(unique.items())
+        ]
+
+        saved = {}
+        try:
+            for chunk in chunked(rows):
+                stmt = pg_insert(ListingModel).values(chunk)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[ListingModel.ticker, ListingModel.exchange_id],
+                    set_={
+                        "currency": stmt.excluded.currency,
+                        "is_active": stmt.excluded.is_active,
+                        "content_hash": stmt.excluded.content_hash,
+                        "synced_at": func.now(),
+                        "updated_at": func.now()
+                    }
+                ).returning(ListingModel)
+
+                results = self.session.execute(
+                    stmt, execution_options={"populate_existing": True}
+                ).scalars().all()
+                for model in results:
+                    saved[(model.ticker, model.exchange_id)] = self._to_domain(model)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        self.resolve_cache.invalidate({ticker for ticker, _ in unique})
+
+        return [saved[(l.ticker, l.exchange_id)] for l in listings]
+
+    def get_by_tickers(self, tickers: List[str]) -> List[Listing]:
+        listings = []
+        for chunk in chunked(list(dict.fromkeys(tickers))):
+            stmt = select(ListingModel).where(ListingModel.ticker.in_(chunk))
+            results = self.session.execute(stmt).scalars().all()
+            listings.extend(self._to_domain(r) for r in results)
+        return listings
+
+    def mark_synced(self, listing_ids: List[int]) -> None:
+        if not listing_ids:
+            return
+        try:
+            for chunk in chunked(sorted(set(listing_ids))):
+                self.session.execute(
+                    update(ListingModel)
+                    .where(ListingModel.id.in_(chunk))
+                    # Pin updated_at, otherwise the column's onupdate default would
+                    # bump it and the row would look modified.
+                    .values(synced_at=func.now(), updated_at=ListingModel.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
@@ -0,0 +1,109 @@
+from typing import List, Optional
+
+import numpy as np
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from core.domain.portfolio import Holding, Portfolio, PositionArrays
+from core.repositories.portfolio_repository import PortfolioRepository
+from infrastructure.database.models import (
+    AssetModel,
+    ExchangeModel,
+    HoldingModel,
+    ListingLatestPriceModel,
+    ListingModel,
+    PortfolioModel,
+)
+
+class SqlAlchemyPortfolioRepository(PortfolioRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _to_domain(self, model: PortfolioModel) -> Portfolio:
+        return Portfolio(
+            id=model.id,
+            name=model.name,
+            description=model.description,
+            created_at=model.created_at,
+            updated_at=model.updated_at
+        )
+
+    def _holding_to_domain(self, model: HoldingModel) -> Holding:
+        return Holding(
+            portfolio_id=model.portfolio_id,
+            listing_id=model.listing_id,
+            quantity=model.quantity,
+            updated_at=model.updated_at
+        )
+
+    def create(self, portfolio: Portfolio) -> Portfolio:
+        model = PortfolioModel(name=portfolio.name, description=portfolio.description)
+        self.session.add(model)
+        self.session.commit()
+        self.session.refresh(model)
+        return self._to_domain(model)
+
+    def get_by_id(self, portfolio_id: int) -> Optional[Portfolio]:
+        stmt = select(PortfolioModel).where(PortfolioModel.id == portfolio_id)
+        result = self.session.execute(stmt).scalar_one_or_none()
+        if result:
+            return self._to_domain(result)
+        return None
+
+    def list_all(self) -> List[Portfolio]:
+        stmt = select(PortfolioModel).order_by(PortfolioModel.id)
+        return [self._to_domain(m) for m in self.session.execute(stmt).scalars()]
+
+    def replace_holdings(self, portfolio_id: int, holdings: List[Holding]) -> List[Holding]:
+        try:
+            self.session.execute(delete(HoldingModel).where(HoldingModel.portfolio_id == portfolio_id))
+            if holdings:
+                # One multi-row INSERT per batch rather than an ORM flush per position
+                self.session.execute(
+                    insert(HoldingModel),
+                    [{"portfolio_id": portfolio_id, "listing_id": h.listing_id, "quantity": h.quantity} for h in holdings]
+                )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return self.get_holdings(portfolio_id)
+
+    def get_holdings(self, portfolio_id: int) -> List[Holding]:
+        stmt = (
+            select(HoldingModel)
+            .where(HoldingModel.portfolio_id == portfolio_id)
+            .order_by(HoldingModel.listing_id)
+        )
+        return [self._holding_to_domain(m) for m in self.session.execute(stmt).scalars()]
+
+    def load_positions(self, portfolio_id: int) -> PositionArrays:
+        stmt = (
+            select(
+                HoldingModel.listing_id,
+                HoldingModel.quantity,
+                ListingLatestPriceModel.close,
+                ListingLatestPriceModel.date,
+                ListingModel.currency,
+                AssetModel.asset_class,
+                ExchangeModel.mic_code
+            )
+            .join(ListingModel, ListingModel.id == HoldingModel.listing_id)
+            .join(AssetModel, AssetModel.id == ListingModel.asset_id)
+            .join(ExchangeModel, ExchangeModel.id == ListingModel.exchange_id)
+            # One keyed row per holding, however long the price history
+            .outerjoin(ListingLatestPriceModel, ListingLatestPriceModel.listing_id == HoldingModel.listing_id)
+            .where(HoldingModel.portfolio_id == portfolio_id)
+            .order_by(HoldingModel.listing_id)
+        )
+        rows = self.session.execute(stmt).all()
+        listing_ids, quantities, prices, dates, currencies, asset_classes, mic_codes = zip(*rows) if rows else ((),) * 7
+        return PositionArrays(
+            listing_ids=np.array(listing_ids, dtype=np.int64),
+            quantities=np.array(quantities, dtype=object),
+            prices=np.array(prices, dtype=object),
+            price_dates=np.array(dates, dtype="datetime64[D]"),
+            currencies=np.array(currencies, dtype=str),
+            asset_classes=np.array([c.value for c in asset_classes], dtype=str),
+            mic_codes=np.array(mic_codes, dtype=str)
+        )
@@ -0,0 +1,237 @@
+from datetime import date
+from typing import Dict, Iterable, List
+
+import numpy as np
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from core.domain.price_bar import PriceBar
+from core.domain.price_matrix import PriceMatrix
+from core.repositories.price_repository import PriceRepository
+from infrastructure.database.models import ListingPriceModel
+
+_COLUMNS = ("listing_id", "date", "open", "high", "low", "close", "adj_close", "volume")
+_PARTITION_PREFIX = "listing_prices_y"
+_DEFAULT_PARTITION = "listing_prices_default"
+
+# Postgres' binary array format (array_send): a header of dimension count,
+# has-NULLs flag and element type OID, then a (length, lower bound) pair per
+# dimension, then each element as a big-endian length and value.
+_ARRAY_HEADER = np.dtype([("ndim", ">i4"), ("has_nulls", ">i4"), ("element_oid", ">i4")])
+_ARRAY_DIMENSION = np.dtype([("length", ">i4"), ("lower_bound", ">i4")])
+_INT4_OID = 23
+_FLOAT8_OID = 701
+_INT4_ELEMENT = np.dtype([("length", ">i4"), ("value", ">i4")])
+_FLOAT8_ELEMENT = np.dtype([("length", ">i4"), ("value", ">f8")])
+
+def partition_name(year: int) -> str:
+    return f"{_PARTITION_PREFIX}{year}"
+
+def _decode_array(data: bytes, element: np.dtype, element_oid: int) -> np.ndarray:
+    """Values of a one-dimensional, NULL-free array_send result of the given element type."""
+    ndim, has_nulls, oid = np.frombuffer(data, dtype=_ARRAY_HEADER, count=1)[0].tolist()
+    if oid != element_oid:
+        raise ValueError(f"Expected an array of type OID {element_oid}, got {oid}")
+    if has_nulls:
+        raise ValueError("Array contains NULLs")
+    value_type = element["value"].newbyteorder("=")
+    if ndim == 0:
+        return np.empty(0, dtype=value_type)
+    if ndim != 1:
+        raise ValueError(f"Expected a one-dimensional array, got {ndim} dimensions")
+    length = int(np.frombuffer(data, dtype=_ARRAY_DIMENSION, count=1, offset=_ARRAY_HEADER.itemsize)[0]["length"])
+    offset = _ARRAY_HEADER.itemsize + _ARRAY_DIMENSION.itemsize
+    elements = np.frombuffer(data, dtype=element, count=length, offset=offset)
+    if (elements["length"] != element["value"].itemsize).any():
+        raise ValueError("Unexpected element length")
+    return elements["value"].astype(value_type)
+
+class SqlAlchemyPriceRepository(PriceRepository):
+    """
+    Price history store. Writes bypass the ORM: bars are streamed with COPY into a
+    temporary staging table and merged with one INSERT ... ON CONFLICT, which is
+    orders of magnitude faster than row inserts for millions of bars.
+
+    Each load also advances listing_latest_prices, one row per listing holding its
+    newest bar, which is what valuation and listing reads use for "last price".
+
+    The table is range partitioned by calendar year, so a range read only scans
+    the years it covers and old years can be detached without rewriting anything.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _to_domain(self, model: ListingPriceModel) -> PriceBar:
+        return PriceBar(
+            listing_id=model.listing_id,
+            date=model.date,
+            open=model.open,
+            high=model.high,
+            low=model.low,
+            close=model.close,
+            adj_close=model.adj_close,
+            volume=model.volume
+        )
+
+    def bulk_load(self, bars: Iterable[PriceBar]) -> int:
+        columns = ", ".join(_COLUMNS)
+        try:
+            # A sequence column records arrival order, so when a bar appears twice
+            # in one load the later one wins, as it would with row-by-row upserts.
+            self.session.execute(text(
+                "CREATE TEMP TABLE listing_prices_staging "
+                "(LIKE listing_prices INCLUDING DEFAULTS, seq bigserial) ON COMMIT DROP"
+            ))
+            # COPY goes through the driver (psycopg) on the session's own connection,
+            # so it is part of the same transaction.
+            connection = self.session.connection().connection.driver_connection
+            with connection.cursor() as cursor, cursor.copy(f"COPY listing_prices_staging ({columns}) FROM STDIN") as copy:
+                for bar in bars:
+                    copy.write_row((
+                        bar.listing_id, bar.date, bar.open, bar.high, bar.low,
+                        bar.close, bar.adj_close, bar.volume
+                    ))
+
+            # Re-ingesting an overlapping range is idempotent: identical bars are
+            # left alone (no dead tuples), corrected ones are overwritten.
+            updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in _COLUMNS[2:])
+            changed = " OR ".join(f"listing_prices.{c} IS DISTINCT FROM EXCLUDED.{c}" for c in _COLUMNS[2:])
+            written = self.session.execute(text(
+                f"INSERT INTO listing_prices ({columns}) "
+                f"SELECT DISTINCT ON (listing_id, date) {columns} FROM listing_prices_staging "
+                f"ORDER BY listing_id, date, seq DESC "
+                f"ON CONFLICT (listing_id, date) DO UPDATE SET {updates} WHERE {changed}"
+            )).rowcount
+            # Carry each listing's newest staged bar into the latest-price table.
+            # Only the batch is looked at, never the history: a backfill of older
+            # bars leaves the row alone, a newer or corrected last bar replaces it.
+            self.session.execute(text(
+                "INSERT INTO listing_latest_prices (listing_id, date, close, adj_close) "
+                "SELECT DISTINCT ON (listing_id) listing_id, date, close, adj_close FROM listing_prices_staging "
+                "ORDER BY listing_id, date DESC, seq DESC "
+                "ON CONFLICT (listing_id) DO UPDATE SET date = EXCLUDED.date, close = EXCLUDED.close, "
+                "adj_close = EXCLUDED.adj_close, updated_at = now() "
+                "WHERE listing_latest_prices.date < EXCLUDED.date OR (listing_latest_prices.date = EXCLUDED.date AND "
+                "(listing_latest_prices.close IS DISTINCT FROM EXCLUDED.close "
+                "OR listing_latest_prices.adj_close IS DISTINCT FROM EXCLUDED.adj_close))"
+            ))
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return written
+
+    def get_range(self, listing_id: int, start: date, end: date) -> List[PriceBar]:
+        stmt = (
+            select(ListingPriceModel)
+            .where(
+                ListingPriceModel.listing_id == listing_id,
+                ListingPriceModel.date >= start,
+                ListingPriceModel.date <= end
+            )
+            .order_by(ListingPriceModel.date)
+        )
+        return [self._to_domain(m) for m in self.session.execute(stmt).scalars()]
+
+    def get_close_matrix(self, listing_ids: List[int], start: date, end: date) -> PriceMatrix:
+        listing_ids = list(dict.fromkeys(listing_ids))
+        if self.session.get_bind().dialect.name == "postgresql":
+            # One row per listing carrying its whole series as two arrays in
+            # Postgres' binary array format: a few hundred rows to decode instead
+            # of a tuple per bar, and no float -> text -> float round trip.
+            rows = self.session.execute(text(
+                "SELECT listing_id, array_send(array_agg(date - CAST(:start AS date))), "
+                "array_send(array_agg(CAST(coalesce(adj_close, close) AS float8))) "
+                "FROM listing_prices WHERE listing_id = ANY(:ids) AND date >= :start AND date <= :end "
+                "GROUP BY listing_id"
+            ), {"ids": listing_ids, "start": start, "end": end}).all()
+            days = [_decode_array(r[1], _INT4_ELEMENT, _INT4_OID) for r in rows]
+            observed_ids = np.repeat(np.array([r[0] for r in rows], dtype=np.int64), [len(d) for d in days])
+            observed_dates = np.datetime64(start, "D") + np.concatenate(days or [np.empty(0, dtype=np.int64)])
+            observed_closes = np.concatenate([_decode_array(r[2], _FLOAT8_ELEMENT, _FLOAT8_OID) for r in rows] or [np.empty(0)])
+        else:
+            stmt = select(
+                ListingPriceModel.listing_id,
+                ListingPriceModel.date,
+                func.coalesce(ListingPriceModel.adj_close, ListingPriceModel.close)
+            ).where(
+                ListingPriceModel.listing_id.in_(listing_ids),
+                ListingPriceModel.date >= start,
+                ListingPriceModel.date <= end
+            )
+            rows = self.session.execute(stmt).all()
+            observed_ids = np.array([r[0] for r in rows], dtype=np.int64)
+            observed_dates = np.array([r[1] for r in rows], dtype="datetime64[D]")
+            observed_closes = np.array([r[2] for r in rows], dtype=np.float64)
+        return PriceMatrix.from_observations(listing_ids, observed_ids, observed_dates, observed_closes)
+
+    def ensure_partitions(self, start: date, end: date) -> List[str]:
+        if start > end:
+            raise ValueError("start must not be after end")
+        created = []
+        try:
+            # Two ingestions starting at once must not both create the same year
+            self.session.execute(text("SELECT pg_advisory_xact_lock(hashtext('listing_prices_partitions'))"))
+            existing = self._yearly_partitions()
+            for year in range(start.year, end.year + 1):
+                if year in existing:
+                    continue
+                name = partition_name(year)
+                lower, upper = date(year, 1, 1), date(year + 1, 1, 1)
+                # A year detached by detach_partitions_before is still there as a
+                # standalone table; attach it again rather than clash with it.
+                detached = self.session.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is not None
+                if not detached:
+                    # Built standalone and attached once filled: bars loaded before the
+                    # year had a partition sit in the default one, and attaching fails
+                    # while the default partition still holds rows for the new range.
+                    self.session.execute(text(
+                        f"CREATE TABLE {name} (LIKE listing_prices INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+                    ))
+                # Bars loaded since the detach are newer than the ones kept aside
+                self.session.execute(text(
+                    f"WITH moved AS (DELETE FROM {_DEFAULT_PARTITION} WHERE date >= :lower AND date < :upper RETURNING *) "
+                    f"INSERT INTO {name} SELECT * FROM moved"
+                    + (
+                        " ON CONFLICT (listing_id, date) DO UPDATE SET open = excluded.open, high = excluded.high, "
+                        "low = excluded.low, close = excluded.close, adj_close = excluded.adj_close, volume = excluded.volume"
+                        if detached else ""
+                    )
+                ), {"lower": lower, "upper": upper})
+                self.session.execute(text(
+                    f"ALTER TABLE listing_prices ATTACH PARTITION {name} "
+                    f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+                ))
+                created.append(name)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return created
+
+    def detach_partitions_before(self, cutoff: date) -> List[str]:
+        detached = []
+        try:
+            self.session.execute(text("SELECT pg_advisory_xact_lock(hashtext('listing_prices_partitions'))"))
+            for year, name in sorted(self._yearly_partitions().items()):
+                if date(year + 1, 1, 1) > cutoff:
+                    continue
+                self.session.execute(text(f"ALTER TABLE listing_prices DETACH PARTITION {name}"))
+                detached.append(name)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return detached
+
+    def _yearly_partitions(self) -> Dict[int, str]:
+        names = self.session.execute(text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'listing_prices'::regclass"
+        )).scalars()
+        return {
+            int(name[len(_PARTITION_PREFIX):]): name
+            for name in names
+            if name.startswith(_PARTITION_PREFIX) and name[len(_PARTITION_PREFIX):].isdigit()
+        }
@@ -0,0 +1,267 @@
+from datetime import timedelta
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import select, func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from core.domain.enums import SyncItemStatus, SyncJobStatus
+from core.domain.sync_job import SyncEnqueueResult, SyncJob, SyncJobItem
+from core.repositories.sync_job_repository import SyncJobRepository
+from infrastructure.database.models import SyncJobModel, SyncJobItemModel
+from infrastructure.repositories.batching import chunked
+
+def _covers(incremental: bool, fresh_within_minutes: Optional[int], wanted_incremental: bool, wanted_fresh_within_minutes: Optional[int]) -> bool:
+    """Whether a job run with the first options also syncs everything one with the wanted options would."""
+    if not incremental:
+        # A full sync fetches and writes every ticker
+        return True
+    if not wanted_incremental:
+        return False
+    # Incremental syncs skip tickers synced within the window; a narrower window skips less
+    return (fresh_within_minutes or 0) <= (wanted_fresh_within_minutes or 0)
+
+class SqlAlchemySyncJobRepository(SyncJobRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _to_domain(self, model: SyncJobModel, with_items: bool = False) -> SyncJob:
+        items = [self._item_to_domain(i) for i in model.items] if with_items else []
+        return SyncJob(
+            id=model.id,
+            tickers=[i.ticker for i in model.items],
+            status=model.status,
+            incremental=model.incremental,
+            fresh_within_minutes=model.fresh_within_minutes,
+            attempts=model.attempts,
+            worker_id=model.worker_id,
+            error=model.error,
+            summary=model.summary,
+            created_at=model.created_at,
+            started_at=model.started_at,
+            heartbeat_at=model.heartbeat_at,
+            finished_at=model.finished_at,
+            items=items
+        )
+
+    def _item_to_domain(self, model: SyncJobItemModel) -> SyncJobItem:
+        return SyncJobItem(
+            ticker=model.ticker,
+            status=model.status,
+            message=model.message,
+            updated_at=model.updated_at
+        )
+
+    def enqueue(self, job: SyncJob) -> SyncEnqueueResult:
+        # Sorted, so two requests inserting overlapping tickers wait on each other's
+        # index entries in the same order instead of deadlocking.
+        tickers = sorted(set(job.tickers))
+        model = SyncJobModel(
+            status=SyncJobStatus.PENDING,
+            incremental=job.incremental,
+            fresh_within_minutes=job.fresh_within_minutes,
+            attempts=0
+        )
+        self.session.add(model)
+        self.session.flush()
+
+        scheduled = self._insert_pending(model.id, tickers)
+        # A ticker pending under weaker options (incremental, or a wider freshness
+        # window) would be skipped where this job asks for it to be fetched, so it
+        # moves to this job instead of coalescing. Only queued jobs give tickers up:
+        # a running job's worker may already be syncing them.
+        superseded = self._supersede_weaker(model, [t for t in tickers if t not in scheduled])
+        if superseded:
+            scheduled |= self._insert_pending(model.id, superseded)
+        coalesced = self._pending_job_ids([t for t in tickers if t not in scheduled])
+
+        if not scheduled:
+            self.session.rollback()
+            return SyncEnqueueResult(job=None, coalesced=coalesced)
+
+        self.session.commit()
+        self.session.refresh(model)
+        return SyncEnqueueResult(job=self._to_domain(model), coalesced=coalesced)
+
+    def _insert_pending(self, job_id: int, tickers: List[str]) -> Set[str]:
+        # The partial unique index on pending tickers makes this atomic across
+        # concurrent requests: a ticker another job already has pending is not
+        # inserted, whichever request got there first.
+        insert = pg_insert if self.session.get_bind().dialect.name == "postgresql" else sqlite_insert
+        inserted: Set[str] = set()
+        for chunk in chunked(tickers):
+            stmt = (
+                insert(SyncJobItemModel)
+                .values([{"job_id": job_id, "ticker": t, "status": SyncItemStatus.PENDING} for t in chunk])
+                .on_conflict_do_nothing()
+                .returning(SyncJobItemModel.ticker)
+            )
+            inserted.update(self.session.execute(stmt).scalars())
+        return inserted
+
+    def _supersede_weaker(self, job: SyncJobModel, tickers: List[str]) -> List[str]:
+        """Marks pending items of queued jobs that would sync less than `job` as skipped; returns their tickers."""
+        weaker: Dict[int, List[str]] = {}
+        for chunk in chunked(tickers):
+            stmt = (
+                select(SyncJobItemModel.job_id, SyncJobItemModel.ticker, SyncJobModel.incremental, SyncJobModel.fresh_within_minutes)
+                .join(SyncJobModel, SyncJobModel.id == SyncJobItemModel.job_id)
+                .where(
+                    SyncJobItemModel.ticker.in_(chunk),
+                    SyncJobItemModel.status == SyncItemStatus.PENDING,
+                    SyncJobModel.status == SyncJobStatus.PENDING
+                )
+                # Holds the jobs until commit, so a worker cannot claim one between
+                # this check and the update below (claim_next skips locked jobs).
+                .with_for_update(of=SyncJobModel, read=True)
+            )
+            for job_id, ticker, incremental, fresh_within_minutes in self.session.execute(stmt):
+                if not _covers(incremental, fresh_within_minutes, job.incremental, job.fresh_within_minutes):
+                    weaker.setdefault(job_id, []).append(ticker)
+
+        superseded = []
+        for job_id, job_tickers in sorted(weaker.items()):
+            for chunk in chunked(job_tickers):
+                # Re-checks the status, so of two requests superseding the same item
+                # only one gets it; the other coalesces into that one.
+                result = self.session.execute(
+                    update(SyncJobItemModel)
+                    .where(
+                        SyncJobItemModel.job_id == job_id,
+                        SyncJobItemModel.ticker.in_(chunk),
+                        SyncJobItemModel.status == SyncItemStatus.PENDING
+                    )
+                    .values(
+                        status=SyncItemStatus.SKIPPED,
+                        message=f"Superseded by sync job {job.id}, which asked for a fuller sync",
+                        updated_at=func.now()
+                    )
+                    .returning(SyncJobItemModel.ticker)
+                )
+                superseded.extend(result.scalars())
+        return sorted(superseded)
+
+    def _pending_job_ids(self, tickers: List[str]) -> Dict[str, Optional[int]]:
+        pending: Dict[str, int] = {}
+        for chunk in chunked(tickers):
+            stmt = select(SyncJobItemModel.ticker, SyncJobItemModel.job_id).where(
+                SyncJobItemModel.ticker.in_(chunk),
+                SyncJobItemModel.status == SyncItemStatus.PENDING
+            )
+            pending.update(self.session.execute(stmt).all())
+        return {t: pending.get(t) for t in tickers}
+
+    def get_by_id(self, job_id: int, with_items: bool = False) -> Optional[SyncJob]:
+        stmt = select(SyncJobModel).where(SyncJobModel.id == job_id)
+        result = self.session.execute(stmt).scalar_one_or_none()
+        if result:
+            return self._to_domain(result, with_items=with_items)
+        return None
+
+    def claim_next(self, worker_id: str) -> Optional[SyncJob]:
+        # SKIP LOCKED lets any number of workers poll concurrently: each one gets a
+        # different pending job (or none) without blocking on the others' row locks.
+        stmt = (
+            select(SyncJobModel)
+            .where(SyncJobModel.status == SyncJobStatus.PENDING)
+            .order_by(SyncJobModel.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        model = self.session.execute(stmt).scalar_one_or_none()
+        if model is None:
+            self.session.rollback()
+            return None
+
+        model.status = SyncJobStatus.RUNNING
+        model.worker_id = worker_id
+        model.attempts += 1
+        model.started_at = func.now()
+        model.heartbeat_at = func.now()
+        model.error = None
+        self.session.commit()
+        self.session.refresh(model)
+        return self._to_domain(model, with_items=True)
+
+    def record_progress(self, job_id: int, items: Dict[str, SyncJobItem]) -> None:
+        # Only pending items are updated, so an outcome never overwrites an item
+        # that was settled some other way.
+        by_status: Dict[tuple, list] = {}
+        for ticker, item in items.items():
+            by_status.setdefault((item.status, item.message), []).append(ticker)
+
+        for (status, message), tickers in by_status.items():
+            self.session.execute(
+                update(SyncJobItemModel)
+                .where(
+                    SyncJobItemModel.job_id == job_id,
+                    SyncJobItemModel.ticker.in_(tickers),
+                    SyncJobItemModel.status == SyncItemStatus.PENDING
+                )
+                .values(status=status, message=message, updated_at=func.now())
+                .execution_options(synchronize_session=False)
+            )
+        self.session.execute(
+            update(SyncJobModel)
+            .where(SyncJobModel.id == job_id)
+            .values(heartbeat_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        self.session.commit()
+
+    def complete(self, job_id: int, summary: dict) -> None:
+        self._finish(job_id, SyncJobStatus.SUCCEEDED, summary=summary)
+
+    def fail(self, job_id: int, error: str) -> None:
+        self._finish(job_id, SyncJobStatus.FAILED, error=error)
+
+    def _finish(self, job_id: int, status: SyncJobStatus, summary: Optional[dict] = None, error: Optional[str] = None) -> None:
+        self.session.rollback()
+        values = {"status": status, "finished_at": func.now(), "heartbeat_at": func.now(), "error": error}
+        if summary is not None:
+            values["summary"] = summary
+        self.session.execute(
+            update(SyncJobModel)
+            .where(SyncJobModel.id == job_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if status == SyncJobStatus.FAILED:
+            self._fail_pending_items([job_id], error)
+        self.session.commit()
+
+    def _fail_pending_items(self, job_ids: List[int], message: str) -> None:
+        # A pending item holds its ticker's single-flight slot; a dead job must
+        # give it up or that ticker could never be scheduled again.
+        self.session.execute(
+            update(SyncJobItemModel)
+            .where(SyncJobItemModel.job_id.in_(job_ids), SyncJobItemModel.status == SyncItemStatus.PENDING)
+            .values(status=SyncItemStatus.FAILED, message=message, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+
+    def requeue_stale(self, heartbeat_timeout: timedelta, max_attempts: int) -> int:
+        # A worker that crashed or was restarted leaves its job RUNNING with an old
+        # heartbeat. Items already marked done keep their status; the retry only
+        # picks up the rest of the work on a new claim.
+        stale = (
+            select(SyncJobModel)
+            .where(
+                SyncJobModel.status == SyncJobStatus.RUNNING,
+                SyncJobModel.heartbeat_at < func.now() - heartbeat_timeout
+            )
+            .with_for_update(skip_locked=True)
+        )
+        models = self.session.execute(stale).scalars().all()
+        for model in models:
+            if model.attempts >= max_attempts:
+                model.status = SyncJobStatus.FAILED
+                model.error = f"Worker {model.worker_id} stopped responding after {model.attempts} attempts"
+                model.finished_at = func.now()
+                self._fail_pending_items([model.id], model.error)
+            else:
+                model.status = SyncJobStatus.PENDING
+                model.worker_id = None
+        self.session.commit()
+        return len(models)
@@ -0,0 +1,225 @@
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+
+from core.interfaces.market_data import ProviderThrottledError
+from core.services.metrics import PROVIDER_CIRCUIT_OPEN, PROVIDER_CONCURRENCY_LIMIT, PROVIDER_THROTTLED
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+THROTTLING_STATUS_CODES = {429, 503}
+
+def is_throttling_error(error: BaseException) -> bool:
+    """
+    True for errors that mean "slow down" rather than "this request is wrong":
+    HTTP 429/503, rate limit exceptions (yfinance's YFRateLimitError) and timeouts.
+    """
+    if isinstance(error, TimeoutError) or isinstance(getattr(error, "reason", None), TimeoutError):
+        return True
+    response = getattr(error, "response", None)
+    for status in (getattr(error, "code", None), getattr(error, "status_code", None), getattr(response, "status_code", None)):
+        if status in THROTTLING_STATUS_CODES:
+            return True
+    name = type(error).__name__
+    return "RateLimit" in name or "Timeout" in name
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    headers = getattr(error, "headers", None) or getattr(getattr(error, "response", None), "headers", None)
+    try:
+        return float(headers.get("Retry-After")) if headers else None
+    except (TypeError, ValueError):
+        # HTTP-date form; rare enough to fall back to our own backoff
+        return None
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on concurrent calls, as TCP congestion control does for packets.
+    Each success raises the limit by 1/limit, about +1 per full window of calls;
+    each throttled call cuts it by `decrease_factor`. Only calls started after the
+    last cut can cut again, so one overload seen by many in-flight calls counts once.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.clock = clock
+        self._limit = float(initial_limit if initial_limit is not None else max(min_limit, max_limit // 2))
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self) -> float:
+        """Blocks until a slot is free. Returns the start time to pass to a release method."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+            return self.clock()
+
+    def release(self, started_at: float) -> None:
+        """Releases a slot without adjusting the limit (e.g. the call failed for another reason)."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def release_success(self, started_at: float) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    def release_throttled(self, started_at: float) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if started_at >= self._last_decrease:
+                self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                self._last_decrease = self.clock()
+            self._condition.notify_all()
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None, rng: random.Random = random) -> float:
+        # Full jitter: calls throttled together would otherwise retry together and
+        # be throttled together again.
+        delay = rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive throttled calls and then fails
+    calls fast for `reset_timeout` seconds. After that a single probe call is let
+    through: success closes the circuit, another throttle reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 20, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit opened after {self._failures} consecutive throttled calls")
+                self.state = self.OPEN
+                self._opened_at = self.clock()
+                self._probe_in_flight = False
+
+class AdaptiveThrottle:
+    """
+    Wraps provider calls with an AIMD concurrency limit, jittered retries of
+    throttled calls, and a circuit breaker. A call that is still throttled after
+    its retries, or rejected by the open circuit, raises ProviderThrottledError
+    instead of looking like missing data.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        retry: Optional[RetryPolicy] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None
+    ):
+        self.name = name
+        self.retry = retry or RetryPolicy()
+        self.limiter = limiter or AdaptiveConcurrencyLimiter(max_concurrency)
+        self.breaker = breaker or CircuitBreaker()
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self._report()
+
+    def call(self, fn: Callable[..., T], *args) -> T:
+        last_error: Optional[BaseException] = None
+        for attempt in range(self.retry.max_attempts):
+            if not self.breaker.allow():
+                raise ProviderThrottledError(f"{self.name} circuit open after repeated throttling") from last_error
+
+            started_at = self.limiter.acquire()
+            try:
+                result = fn(*args)
+            except Exception as e:
+                if not is_throttling_error(e):
+                    # The provider answered; the request itself was the problem.
+                    self.limiter.release(started_at)
+                    self.breaker.record_success()
+                    self._report()
+                    raise
+                self.limiter.release_throttled(started_at)
+                self.breaker.record_failure()
+                PROVIDER_THROTTLED.inc(provider=self.name)
+                self._report()
+                last_error = e
+                if attempt + 1 < self.retry.max_attempts:
+                    self.sleep(self.retry.delay(attempt, _retry_after(e), self.rng))
+                continue
+
+            self.limiter.release_success(started_at)
+            self.breaker.record_success()
+            self._report()
+            return result
+
+        raise ProviderThrottledError(
+            f"{self.name} throttled {self.retry.max_attempts} times: {last_error}"
+        ) from last_error
+
+    def _report(self) -> None:
+        PROVIDER_CONCURRENCY_LIMIT.set(self.limiter.limit, provider=self.name)
+        PROVIDER_CIRCUIT_OPEN.set(1 if self.breaker.state == CircuitBreaker.OPEN else 0, provider=self.name)
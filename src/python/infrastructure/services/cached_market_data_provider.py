@@ -0,0 +1,171 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.interfaces.market_data import MarketDataProvider, MarketDataAsset, MarketDataExchange, PartialFetchError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+# Unknown tickers are cached too, but briefly: the provider reports transient
+# failures the same way (None), and those should be retried soon.
+DEFAULT_NEGATIVE_TTL_SECONDS = 15 * 60
+DEFAULT_MAX_ENTRIES = 200_000
+
+# SQLite limits host parameters per statement (999 on older builds).
+_LOOKUP_CHUNK_SIZE = 500
+
+def default_cache_path() -> str:
+    return os.getenv("MARKET_DATA_CACHE_PATH", os.path.join(os.getcwd(), ".cache", "market_data.sqlite3"))
+
+class CachingMarketDataProvider(MarketDataProvider):
+    """
+    Read-through cache in front of another MarketDataProvider, persisted in SQLite
+    so it survives restarts and is shared by the API and scripts on one host.
+    Entries expire after their TTL; when the store grows past `max_entries` the
+    least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        provider: MarketDataProvider,
+        path: Optional[str] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time
+    ):
+        self.provider = provider
+        self.name = provider.name
+        self.path = path or default_cache_path()
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # One connection shared across the provider's worker threads, serialised by a lock.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS asset_cache (
+                ticker TEXT PRIMARY KEY,
+                payload TEXT,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_asset_cache_accessed_at ON asset_cache (accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_asset_cache_expires_at ON asset_cache (expires_at)")
+
+    def get_asset_details(self, ticker: str) -> Optional[MarketDataAsset]:
+        return self._read_through([ticker], lambda missing: {ticker: self.provider.get_asset_details(ticker)})[ticker]
+
+    def get_exchange_details(self, mic_code: str) -> Optional[MarketDataExchange]:
+        return self.provider.get_exchange_details(mic_code)
+
+    def get_assets_bulk(self, tickers: List[str]) -> Dict[str, Optional[MarketDataAsset]]:
+        return self._read_through(list(dict.fromkeys(tickers)), self.provider.get_assets_bulk)
+
+    def _read_through(
+        self,
+        unique_tickers: List[str],
+        fetch: Callable[[List[str]], Dict[str, Optional[MarketDataAsset]]]
+    ) -> Dict[str, Optional[MarketDataAsset]]:
+        cached = self._lookup(unique_tickers)
+        missing = [t for t in unique_tickers if t not in cached]
+
+        with self._lock:
+            self.hits += len(cached)
+            self.misses += len(missing)
+
+        errors: Dict[str, str] = {}
+        try:
+            fetched = fetch(missing) if missing else {}
+        except PartialFetchError as e:
+            fetched, errors = e.results, e.errors
+        if missing:
+            # Tickers that errored say nothing about the ticker, so they must not
+            # be negatively cached; they are asked for again next time.
+            self._store({t: fetched.get(t) for t in missing if t not in errors})
+
+        results = {t: cached[t] if t in cached else fetched.get(t) for t in unique_tickers if t not in errors}
+        if errors:
+            raise PartialFetchError(results, errors)
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM asset_cache").fetchone()[0]
+            return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM asset_cache")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _lookup(self, tickers: List[str]) -> Dict[str, Optional[MarketDataAsset]]:
+        now = self.clock()
+        found: Dict[str, Optional[MarketDataAsset]] = {}
+        with self._lock:
+            for start in range(0, len(tickers), _LOOKUP_CHUNK_SIZE):
+                chunk = tickers[start:start + _LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT ticker, payload FROM asset_cache WHERE ticker IN ({placeholders}) AND expires_at > ?",
+                    (*chunk, now)
+                ).fetchall()
+                for ticker, payload in rows:
+                    found[ticker] = MarketDataAsset(**json.loads(payload)) if payload is not None else None
+            if found:
+                self._conn.executemany(
+                    "UPDATE asset_cache SET accessed_at = ? WHERE ticker = ?",
+                    [(now, ticker) for ticker in found]
+                )
+        return found
+
+    def _store(self, results: Dict[str, Optional[MarketDataAsset]]) -> None:
+        now = self.clock()
+        rows: List[Tuple[str, Optional[str], float, float]] = []
+        for ticker, data in results.items():
+            if data is None:
+                rows.append((ticker, None, now + self.negative_ttl_seconds, now))
+            else:
+                rows.append((ticker, json.dumps(asdict(data)), now + self.ttl_seconds, now))
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO asset_cache (ticker, payload, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._evict(now)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM asset_cache WHERE expires_at <= ?", (now,))
+        overflow = self._conn.execute("SELECT COUNT(*) FROM asset_cache").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM asset_cache WHERE ticker IN "
+                "(SELECT ticker FROM asset_cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            )
+            logger.info(f"Evicted {overflow} least recently used market data cache entries")
@@ -0,0 +1,133 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from core.domain.resolved_listing import ResolvedListing
+from core.services.metrics import LISTING_RESOLVE_CACHE
+
+DEFAULT_TTL_SECONDS = 60
+# Unknown tickers are cached too, but briefly: a listing created by another
+# process cannot invalidate this cache and would otherwise stay unresolvable.
+DEFAULT_NEGATIVE_TTL_SECONDS = 5
+DEFAULT_MAX_ENTRIES = 100_000
+
+# (ticker, MIC or None for "any exchange")
+ResolveKey = Tuple[str, Optional[str]]
+Resolution = Tuple[ResolvedListing, ...]
+
+class ListingResolveCache:
+    """
+    Bounded in-process cache of ticker (+ MIC) resolutions.
+    Entries expire after their TTL; past `max_entries` the least recently used
+    entry is evicted. Listing writes through SqlAlchemyListingRepository
+    invalidate every entry for the tickers they touch, asset writes through
+    SqlAlchemyAssetRepository every entry holding those assets; writes from
+    other processes are only picked up when entries expire.
+    Callers get copies, so a caller changing a result cannot change the cache.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[ResolveKey, Tuple[float, Resolution]]" = OrderedDict()
+        # Keys by ("ticker", ticker) and ("asset", asset ID), so invalidating
+        # either needs no scan
+        self._keys: Dict[Hashable, Set[ResolveKey]] = {}
+        # Bumped by every invalidation; see `generation`
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: ResolveKey) -> Optional[Resolution]:
+        """The cached resolution (empty when nothing matched), or None on a miss."""
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                LISTING_RESOLVE_CACHE.inc(result="miss")
+                return None
+            self._entries.move_to_end(key)
+        LISTING_RESOLVE_CACHE.inc(result="hit")
+        return _copy(entry[1])
+
+    def generation(self) -> int:
+        """
+        Take this before reading the database on a miss and hand it to `put`: a
+        write committed in between makes `put` drop the possibly stale result.
+        """
+        with self._lock:
+            return self._generation
+
+    def put(self, key: ResolveKey, resolution: Resolution, generation: int) -> None:
+        ttl = self.ttl_seconds if resolution else self.negative_ttl_seconds
+        expires_at = self.clock() + ttl
+        with self._lock:
+            if generation != self._generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, _copy(resolution))
+            for tag in _tags(key, resolution):
+                self._keys.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tickers: Iterable[str]) -> None:
+        self._invalidate([("ticker", ticker) for ticker in tickers])
+
+    def invalidate_assets(self, asset_ids: Iterable[int]) -> None:
+        self._invalidate([("asset", asset_id) for asset_id in asset_ids])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _invalidate(self, tags: List[Hashable]) -> None:
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                for key in list(self._keys.get(tag, ())):
+                    self._remove(key)
+
+    def _remove(self, key: ResolveKey) -> None:
+        _, resolution = self._entries.pop(key)
+        for tag in _tags(key, resolution):
+            keys = self._keys[tag]
+            keys.discard(key)
+            if not keys:
+                del self._keys[tag]
+
+def _tags(key: ResolveKey, resolution: Resolution) -> List[Hashable]:
+    # A ticker can resolve to several listings of one asset
+    return list(dict.fromkeys([("ticker", key[0])] + [("asset", r.asset.id) for r in resolution]))
+
+def _copy(resolution: Resolution) -> Resolution:
+    # Listing and Asset are mutable; neither the cache nor its callers may share them
+    return tuple(
+        ResolvedListing(listing=replace(r.listing), asset=replace(r.asset), mic_code=r.mic_code)
+        for r in resolution
+    )
+
+# Shared by every repository in the process, so one request's write
+# invalidates what the next request would read.
+RESOLVE_CACHE = ListingResolveCache()
@@ -1,23 +1,94 @@
-from typing import Dict, List, Optional
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional
 import yfinance as yf
 import pandas as pd
-from core.interfaces.market_data import MarketDataProvider, MarketDataAsset, MarketDataExchange
+from core.interfaces.market_data import (
+    MarketDataProvider,
+    MarketDataAsset,
+    MarketDataBar,
+    MarketDataExchange,
+    PartialFetchError,
+    PriceHistoryProvider,
+    ProviderThrottledError,
+)
 from core.domain.enums import AssetClass
+from core.services.metrics import SYNC_STAGE_SECONDS
+from infrastructure.services.adaptive_throttle import AdaptiveThrottle
+from infrastructure.services.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+
+# Shared by every provider instance in the process: Yahoo throttles per client,
+# so two overlapping syncs must split the budget rather than double it.
+_shared_rate_limiter = RateLimiter(DEFAULT_REQUESTS_PER_SECOND, burst=DEFAULT_MAX_WORKERS)
+# Same reasoning: the concurrency Yahoo tolerates is learned once per process.
+_shared_throttle = AdaptiveThrottle("yfinance", max_concurrency=DEFAULT_MAX_WORKERS)
+
+def _fetch_yfinance_info(ticker: str) -> dict:
+    return yf.Ticker(ticker).info
+
+def _download_yfinance_history(tickers: List[str], start: date, end: date) -> pd.DataFrame:
+    # One request batch for all tickers; `end` is exclusive in yfinance.
+    return yf.download(
+        tickers,
+        start=start.isoformat(),
+        end=(end + timedelta(days=1)).isoformat(),
+        interval="1d",
+        group_by="ticker",
+        auto_adjust=False,
+        actions=False,
+        threads=True,
+        progress=False
+    )
+
+def _decimal(value) -> Decimal:
+    # Through the shortest repr, so 187.45 arrives as Decimal("187.45") rather
+    # than the float's exact binary expansion
+    return Decimal(repr(float(value)))
+
+class YFinanceMarketDataProvider(MarketDataProvider, PriceHistoryProvider):
+    name = "yfinance"
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate_limiter: Optional[RateLimiter] = None,
+        info_fetcher: Optional[Callable[[str], dict]] = None,
+        throttle: Optional[AdaptiveThrottle] = None,
+        history_downloader: Optional[Callable[[List[str], date, date], pd.DataFrame]] = None
+    ):
+        """
+        max_workers: upper bound on concurrent `.info` requests in `get_assets_bulk`.
+        rate_limiter: defaults to the process-wide limiter.
+        info_fetcher: returns the raw `.info` dict for a ticker; injectable so the
+            worker pool can be exercised against a local HTTP stand-in.
+        throttle: adaptive concurrency, retries and circuit breaker around each
+            request; defaults to the process-wide one.
+        history_downloader: returns a `yf.download`-shaped frame; injectable like
+            `info_fetcher`.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or _shared_rate_limiter
+        self.info_fetcher = info_fetcher or _fetch_yfinance_info
+        self.throttle = throttle or _shared_throttle
+        self.history_downloader = history_downloader or _download_yfinance_history
 
-class YFinanceMarketDataProvider(MarketDataProvider):
     def get_asset_details(self, ticker: str) -> Optional[MarketDataAsset]:
+        """Returns None when Yahoo has no usable data; raises ProviderThrottledError when it won't say."""
         try:
-            ticker_obj = yf.Ticker(ticker)
-            info = ticker_obj.info
-
-            # yfinance info dict keys vary, we need to be defensive
-            if not info or 'symbol' not in info:
-                return None
-
-            return self._map_to_asset_data(ticker, info)
+            return self._fetch_asset(ticker)
+        except ProviderThrottledError:
+            raise
         except Exception as e:
-            # Log error ideally
-            print(f"Error fetching data for {ticker}: {e}")
+            logger.warning(f"Error fetching data for {ticker}: {e}")
             return None
 
     def get_exchange_details(self, mic_code: str) -> Optional[MarketDataExchange]:
@@ -27,44 +98,106 @@ class YFinanceMarketDataProvider(MarketDataProvider):
         return None
 
     def get_assets_bulk(self, tickers: List[str]) -> Dict[str, Optional[MarketDataAsset]]:
-        results = {}
-        # YFinance download is for price data, Tickers is for info
-        # For bulk info, it's actually slower with yf.Tickers if we access .info one by one
-        # But let's try to use it.
-
-        # Optimization: yfinance Tickers object
-        tickers_obj = yf.Tickers(" ".join(tickers))
-
-        for ticker_symbol in tickers:
-            try:
-                ticker_data = tickers_obj.tickers[ticker_symbol]
-                # Note: Accessing .info triggers a request per ticker usually
-                info = ticker_data.info
-                if info and 'symbol' in info:
-                    results[ticker_symbol] = self._map_to_asset_data(ticker_symbol, info)
-                else:
-                    results[ticker_symbol] = None
-            except Exception as e:
-                print(f"Error fetching bulk data for {ticker_symbol}: {e}")
-                results[ticker_symbol] = None
-
+        # `.info` is one blocking HTTP request per ticker and yf.Tickers does not
+        # batch it, so fan the requests out over a bounded pool instead. The rate
+        # limiter, not the pool size, decides how hard we hit Yahoo.
+        unique_tickers = list(dict.fromkeys(tickers))
+        if not unique_tickers:
+            return {}
+
+        workers = min(self.max_workers, len(unique_tickers))
+        results: Dict[str, Optional[MarketDataAsset]] = {}
+        errors: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yfinance") as pool:
+            futures = {ticker: pool.submit(self.get_asset_details, ticker) for ticker in unique_tickers}
+            for ticker, future in futures.items():
+                try:
+                    results[ticker] = future.result()
+                except ProviderThrottledError as e:
+                    errors[ticker] = str(e)
+        if errors:
+            raise PartialFetchError(results, errors)
         return results
 
+    def get_price_history(self, tickers: List[str], start: date, end: date) -> Dict[str, List[MarketDataBar]]:
+        unique_tickers = list(dict.fromkeys(tickers))
+        if not unique_tickers:
+            return {}
+        frame = self.throttle.call(self.history_downloader, unique_tickers, start, end)
+
+        history: Dict[str, List[MarketDataBar]] = {}
+        for ticker in unique_tickers:
+            history[ticker] = self._frame_to_bars(frame, ticker)
+        return history
+
+    def _frame_to_bars(self, frame: pd.DataFrame, ticker: str) -> List[MarketDataBar]:
+        if frame is None or frame.empty:
+            return []
+        if isinstance(frame.columns, pd.MultiIndex):
+            if ticker not in frame.columns.get_level_values(0):
+                return []
+            frame = frame[ticker]
+        # Failed or not-yet-listed days come back as NaN rows
+        frame = frame.dropna(subset=["Open", "High", "Low", "Close"])
+        if frame.empty:
+            return []
+
+        # Column-wise conversion: one pass per column instead of per-cell lookups
+        adj_close = frame["Adj Close"] if "Adj Close" in frame else None
+        volume = frame["Volume"] if "Volume" in frame else None
+        return [
+            MarketDataBar(
+                date=day.date(),
+                open=_decimal(o),
+                high=_decimal(h),
+                low=_decimal(l),
+                close=_decimal(c),
+                adj_close=None if adj_close is None or pd.isna(a) else _decimal(a),
+                volume=None if volume is None or pd.isna(v) else int(v)
+            )
+            for day, o, h, l, c, a, v in zip(
+                frame.index,
+                frame["Open"].to_numpy(),
+                frame["High"].to_numpy(),
+                frame["Low"].to_numpy(),
+                frame["Close"].to_numpy(),
+                adj_close.to_numpy() if adj_close is not None else [None] * len(frame),
+                volume.to_numpy() if volume is not None else [None] * len(frame),
+            )
+        ]
+
+    def _fetch_asset(self, ticker: str) -> Optional[MarketDataAsset]:
+        # The pool only bounds threads; how many of them may talk to Yahoo at once
+        # is the throttle's adaptive limit.
+        info = self.throttle.call(self._fetch_info, ticker)
+
+        # yfinance info dict keys vary, we need to be defensive
+        if not info or 'symbol' not in info:
+            return None
+
+        return self._map_to_asset_data(ticker, info)
+
+    def _fetch_info(self, ticker: str) -> dict:
+        self.rate_limiter.acquire()
+        # Timed after the limiter so the histogram shows Yahoo's latency, not our throttling
+        with SYNC_STAGE_SECONDS.time(stage="fetch"):
+            return self.info_fetcher(ticker)
+
     def _map_to_asset_data(self, ticker: str, info: dict) -> MarketDataAsset:
         # Map yfinance 'quoteType' to AssetClass
         # EQUITY, ETF, MUTUALFUND, CRYPTOCURRENCY, CURRENCY, INDEX, FUTURE, OPTION
         quote_type = info.get('quoteType', 'EQUITY').upper()
 
         asset_class_map = {
-            'EQUITY': AssetClass.STOCK,
-            'ETF': AssetClass.ETF,
-            'CRYPTOCURRENCY': AssetClass.CRYPTO,
+            'EQUITY': AssetClass.EQUITY,
+            'ETF': AssetClass.EQUITY, # No fund class yet; ETFs trade like equities
+            'CRYPTOCURRENCY': AssetClass.CRYPTOCURRENCY,
             # Default fallback
         }
 
-        # If not in map, default to STOCK or handle error.
-        # For this implementation, we default to STOCK if unknown, or we could be more strict.
-        asset_class = asset_class_map.get(quote_type, AssetClass.STOCK)
+        # If not in map, default to EQUITY or handle error.
+        # For this implementation, we default to EQUITY if unknown, or we could be more strict.
+        asset_class = asset_class_map.get(quote_type, AssetClass.EQUITY)
 
         # Try to find ISIN
         isin = info.get('isin')
@@ -0,0 +1,34 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core.services.metrics import CONTENT_TYPE, MetricsRegistry, REGISTRY
+
+logger = logging.getLogger(__name__)
+
+def start_metrics_server(port: int, registry: MetricsRegistry = REGISTRY, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """
+    Serves `registry` on http://host:port/metrics from a daemon thread.
+    For processes without the API, such as sync workers, whose metrics would
+    otherwise never be scraped.
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            payload = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"Serving metrics on {host}:{server.server_address[1]}/metrics")
+    return server
@@ -0,0 +1,34 @@
+import threading
+import time
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+    Tokens refill continuously at `rate` per second up to `burst`; `acquire` blocks
+    until one is available, so any number of workers sharing an instance stay
+    under the same request rate together.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        if burst < 1:
+            raise ValueError("Burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            # Sleep outside the lock so other workers can keep checking the bucket.
+            time.sleep(wait)
@@ -0,0 +1,241 @@
+import gzip
+import json
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from infrastructure.services.adaptive_throttle import AdaptiveThrottle, RetryPolicy, is_throttling_error
+from infrastructure.services.market_data_service import (
+    YFinanceMarketDataProvider,
+    DEFAULT_MAX_WORKERS,
+    _fetch_yfinance_info,
+)
+
+logger = logging.getLogger(__name__)
+
+# Archives are gzipped JSON lines, one per ticker:
+#   {"ticker": "AAPL", "info": {...raw .info dict...}}
+#   {"ticker": "GONE", "error": "HTTP Error 404: Not Found"}
+# Later lines win, so re-recording a ticker by appending is fine.
+
+class ReplayFetchError(Exception):
+    """A recorded or injected provider error."""
+
+class ReplayRateLimitError(Exception):
+    """Injected throttling; recognised as such by the adaptive throttle, like yfinance's YFRateLimitError."""
+
+class RecordingInfoFetcher:
+    """
+    Info fetcher that passes requests through to `fetcher` (the live yfinance call
+    by default) and appends every answer to an archive. Throttling is not
+    recorded: it says something about the moment, not about the ticker.
+    """
+
+    def __init__(self, archive_path: str, fetcher: Callable[[str], dict] = _fetch_yfinance_info):
+        self.archive_path = archive_path
+        self.fetcher = fetcher
+        self.recorded = 0
+        self._file = gzip.open(archive_path, "at", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def __call__(self, ticker: str) -> dict:
+        try:
+            info = self.fetcher(ticker)
+        except Exception as e:
+            if not is_throttling_error(e):
+                self._write({"ticker": ticker, "error": str(e)})
+            raise
+        self._write({"ticker": ticker, "info": info})
+        return info
+
+    def _write(self, record: dict) -> None:
+        line = json.dumps(record, default=str, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self.recorded += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+class ReplayInfoFetcher:
+    """
+    Info fetcher that serves an archive, with optional synthetic latency and
+    injected errors. Tickers missing from the archive answer like an unknown
+    symbol does live, with an empty dict.
+
+    Injection is decided per (seed, ticker, attempt), not by a shared random
+    stream, so a run is reproducible however the worker threads interleave, and
+    a throttled ticker can still succeed on a retry.
+    """
+
+    def __init__(
+        self,
+        archive_path: str,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        for rate in (error_rate, throttle_rate):
+            if not 0 <= rate <= 1:
+                raise ValueError("Error and throttle rates must be between 0 and 1")
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.seed = seed
+        self.sleep = sleep
+        # Raw lines, parsed per request: keeps 100k payloads affordable in memory
+        # and charges each request the JSON decoding a live response would cost.
+        self._records: Dict[str, str] = load_archive(archive_path)
+        self._attempts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def tickers(self):
+        return list(self._records)
+
+    def __call__(self, ticker: str) -> dict:
+        with self._lock:
+            attempt = self._attempts.get(ticker, 0)
+            self._attempts[ticker] = attempt + 1
+        rng = random.Random(f"{self.seed}:{ticker}:{attempt}")
+
+        delay = self.latency + rng.uniform(-self.latency_jitter, self.latency_jitter)
+        if delay > 0:
+            self.sleep(delay)
+        # Drawn unconditionally so changing one rate does not reshuffle the other
+        throttled, failed = rng.random() < self.throttle_rate, rng.random() < self.error_rate
+        if throttled:
+            raise ReplayRateLimitError(f"Injected rate limit for {ticker}")
+        if failed:
+            raise ReplayFetchError(f"Injected error for {ticker}")
+
+        line = self._records.get(ticker)
+        if line is None:
+            return {}
+        record = json.loads(line)
+        if "error" in record:
+            raise ReplayFetchError(record["error"])
+        return record["info"]
+
+def load_archive(archive_path: str) -> Dict[str, str]:
+    records: Dict[str, str] = {}
+    with gzip.open(archive_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                # Only the ticker is needed up front; it always leads the record.
+                records[json.loads(line)["ticker"]] = line
+    return records
+
+class _NoRateLimit:
+    def acquire(self) -> None:
+        pass
+
+class ReplayMarketDataProvider(YFinanceMarketDataProvider):
+    """
+    `YFinanceMarketDataProvider` over a recorded archive instead of the network.
+    Everything past the `.info` call (worker pool, adaptive throttle, mapping) is
+    the production code path, so sync benchmarks measure what actually runs.
+    It keeps the `yfinance` name so the recorded exchange codes resolve.
+    """
+
+    def __init__(
+        self,
+        archive_path: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0
+    ):
+        self.replay = ReplayInfoFetcher(
+            archive_path,
+            latency=latency,
+            latency_jitter=latency_jitter,
+            error_rate=error_rate,
+            throttle_rate=throttle_rate,
+            seed=seed
+        )
+        super().__init__(
+            max_workers=max_workers,
+            rate_limiter=_NoRateLimit(),
+            info_fetcher=self.replay,
+            # Its own throttle: replayed throttling must not shrink the live
+            # provider's learned limit in the same process.
+            throttle=AdaptiveThrottle(
+                "replay",
+                max_concurrency=max_workers,
+                retry=RetryPolicy(base_delay=latency or 0.01, max_delay=max(1.0, 10 * latency))
+            )
+        )
+
+class RecordingMarketDataProvider(YFinanceMarketDataProvider):
+    """Live `YFinanceMarketDataProvider` that also records every `.info` payload to an archive."""
+
+    def __init__(self, archive_path: str, **kwargs):
+        self.recorder = RecordingInfoFetcher(archive_path, kwargs.pop("info_fetcher", _fetch_yfinance_info))
+        super().__init__(info_fetcher=self.recorder, **kwargs)
+
+    def close(self) -> None:
+        self.recorder.close()
+
+@dataclass
+class ReplayProviderFactory:
+    """Picklable provider factory for `ShardedAssetSync`: every shard replays the same archive."""
+
+    archive_path: str
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    seed: int = 0
+
+    def __call__(self, shards: int) -> ReplayMarketDataProvider:
+        return ReplayMarketDataProvider(
+            self.archive_path,
+            latency=self.latency,
+            latency_jitter=self.latency_jitter,
+            error_rate=self.error_rate,
+            throttle_rate=self.throttle_rate,
+            seed=self.seed
+        )
+
+# (exchange code, ticker suffix, currency) in roughly the mix a real universe has
+_SYNTHETIC_VENUES = [
+    ("NMS", "", "USD"), ("NMS", "", "USD"), ("NYQ", "", "USD"), ("NYQ", "", "USD"),
+    ("NGM", "", "USD"), ("LSE", ".L", "GBp"), ("JPX", ".T", "JPY"), ("FRA", ".F", "EUR"),
+]
+
+def write_synthetic_archive(archive_path: str, count: int, seed: int = 0) -> None:
+    """
+    Writes `count` made-up tickers with yfinance-shaped payloads, for benchmark
+    universes larger than any recording. Same `count` and `seed`, same archive.
+    """
+    rng = random.Random(seed)
+    with gzip.open(archive_path, "wt", encoding="utf-8") as f:
+        for i in range(count):
+            code, suffix, currency = rng.choice(_SYNTHETIC_VENUES)
+            ticker = f"SYN{i:06d}{suffix}"
+            info = {
+                "symbol": ticker,
+                "longName": f"Synthetic Holdings {i}",
+                "shortName": f"SYN {i}",
+                "quoteType": "ETF" if rng.random() < 0.1 else "EQUITY",
+                "currency": currency,
+                "exchange": code,
+                "isin": f"XS{i:09d}{rng.randrange(10)}",
+                "regularMarketPrice": round(rng.uniform(1, 500), 2),
+                "marketCap": rng.randrange(10 ** 6, 10 ** 12),
+            }
+            f.write(json.dumps({"ticker": ticker, "info": info}, separators=(",", ":")) + "\n")
@@ -0,0 +1,161 @@
+import logging
+import multiprocessing
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.interfaces.market_data import MarketDataProvider
+from core.services.asset_sync_service import AssetSyncService, DEFAULT_SYNC_BATCH_SIZE
+from core.services.pipelined_asset_sync_service import PipelinedAssetSyncService
+from core.services.metrics import record_sync_summary
+from core.services.sync_summary import SyncSummary
+from infrastructure.database.base import get_db_url
+from infrastructure.repositories.asset_repository import SqlAlchemyAssetRepository
+from infrastructure.repositories.exchange_repository import SqlAlchemyExchangeRepository
+from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
+from infrastructure.services.cached_market_data_provider import CachingMarketDataProvider
+from infrastructure.services.market_data_service import (
+    YFinanceMarketDataProvider,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_REQUESTS_PER_SECOND,
+)
+from infrastructure.services.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Receives the shard count so the provider can take its share of any global
+# budget. Must be a module-level callable: it is pickled into each worker.
+ProviderFactory = Callable[[int], MarketDataProvider]
+
+def default_provider_factory(shards: int) -> MarketDataProvider:
+    # Each process has its own limiter, so split the request budget between them
+    # rather than multiplying it by the shard count.
+    limiter = RateLimiter(DEFAULT_REQUESTS_PER_SECOND / shards, burst=DEFAULT_MAX_WORKERS)
+    return CachingMarketDataProvider(YFinanceMarketDataProvider(rate_limiter=limiter))
+
+def shard_tickers(tickers: List[str], shards: int) -> List[List[str]]:
+    """
+    Splits tickers into `shards` lists by a stable hash.
+    The same ticker always lands in the same shard, so two shards never upsert the
+    same listing. Duplicates are dropped; order within a shard is preserved.
+    """
+    if shards < 1:
+        raise ValueError("shards must be at least 1")
+    result: List[List[str]] = [[] for _ in range(shards)]
+    for ticker in dict.fromkeys(tickers):
+        result[zlib.crc32(ticker.encode()) % shards].append(ticker)
+    return result
+
+# Per-process state, built once by the pool initializer.
+_worker_sessions = None
+_worker_provider: Optional[MarketDataProvider] = None
+
+def _init_shard_worker(db_url: str, provider_factory: ProviderFactory, shards: int) -> None:
+    global _worker_sessions, _worker_provider
+    # A shard only ever holds one session, so one pooled connection is enough.
+    engine = create_engine(db_url, pool_size=1, max_overflow=0)
+    _worker_sessions = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    _worker_provider = provider_factory(shards)
+
+def _sync_shard(
+    tickers: List[str],
+    batch_size: int,
+    incremental: bool,
+    fresh_within: Optional[timedelta]
+) -> SyncSummary:
+    session = _worker_sessions()
+    try:
+        service = AssetSyncService(
+            SqlAlchemyAssetRepository(session),
+            SqlAlchemyExchangeRepository(session),
+            SqlAlchemyListingRepository(session),
+            _worker_provider
+        )
+        # Stream within the shard too, so a 50k-ticker shard starts writing after
+        # its first batch instead of after its last fetch.
+        pipeline = PipelinedAssetSyncService(
+            service,
+            _worker_provider,
+            batch_size=batch_size,
+            incremental=incremental,
+            fresh_within=fresh_within
+        )
+        return pipeline.sync_assets(tickers)
+    finally:
+        session.close()
+
+class ShardedAssetSync:
+    """
+    Runs the streaming sync (`PipelinedAssetSyncService`) over a process pool, one
+    shard per process, each with its own engine and session. Meant for ticker universes large enough
+    that a single process is bound by one core and one connection.
+
+    Exchanges are only read by shards; seed them before calling `sync_assets` so
+    every shard resolves against the same table. Shards can still meet on an asset
+    (a dual listing shares its ISIN); the asset repository takes row locks in a
+    fixed order so those collisions serialize instead of deadlocking.
+    """
+
+    def __init__(
+        self,
+        shards: int,
+        provider_factory: ProviderFactory = default_provider_factory,
+        db_url: Optional[str] = None,
+        mp_context=None
+    ):
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.shards = shards
+        self.provider_factory = provider_factory
+        self.db_url = db_url or get_db_url()
+        # Spawn rather than fork: a forked child would inherit the parent's pooled
+        # connections, and two processes sharing one socket corrupt each other.
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+
+    def sync_assets(
+        self,
+        tickers: List[str],
+        batch_size: int = DEFAULT_SYNC_BATCH_SIZE,
+        incremental: bool = False,
+        fresh_within: Optional[timedelta] = None
+    ) -> SyncSummary:
+        shards = [s for s in shard_tickers(tickers, self.shards) if s]
+        summary = SyncSummary()
+        if not shards:
+            return summary
+
+        logger.info(f"Syncing {sum(len(s) for s in shards)} assets across {len(shards)} shards...")
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=self.mp_context,
+            initializer=_init_shard_worker,
+            initargs=(self.db_url, self.provider_factory, self.shards)
+        ) as pool:
+            futures: Dict = {
+                pool.submit(_sync_shard, shard, batch_size, incremental, fresh_within): shard
+                for shard in shards
+            }
+            for future in as_completed(futures):
+                shard = futures[future]
+                try:
+                    summary.merge(future.result())
+                except Exception as e:
+                    # A crashed shard must not hide behind the others' success.
+                    logger.error(f"Shard of {len(shard)} tickers failed: {e}", exc_info=True)
+                    summary.requested += len(shard)
+                    for ticker in shard:
+                        summary.failed[ticker] = f"Shard failed: {e}"
+
+        # Shards record into their own process's registry, which dies with the
+        # pool; the merged result is what this process reports.
+        record_sync_summary(summary)
+        summary.log_unknown_exchanges(logger)
+        logger.info(
+            f"Sharded sync complete: {summary.synced} synced, "
+            f"{len(summary.skipped)} skipped, {len(summary.failed)} failed"
+        )
+        return summary
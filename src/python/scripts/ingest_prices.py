@@ -0,0 +1,54 @@
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import date
+
+# Add the project root to the python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "../"))
+
+from core.services.price_ingestion_service import PriceIngestionService, DEFAULT_HISTORY_BATCH_SIZE
+from infrastructure.database.session import SessionLocal
+from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
+from infrastructure.repositories.price_repository import SqlAlchemyPriceRepository
+from infrastructure.services.market_data_service import YFinanceMarketDataProvider
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+def read_tickers(path: str) -> list:
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Download daily price history for listings and bulk load it.")
+    parser.add_argument("--start", type=date.fromisoformat, required=True, help="First day, YYYY-MM-DD")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(), help="Last day, YYYY-MM-DD")
+    parser.add_argument("--tickers-file", help="Only these tickers; defaults to every listing")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_HISTORY_BATCH_SIZE, help="Tickers per download and COPY")
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        listing_repo = SqlAlchemyListingRepository(session)
+        if args.tickers_file:
+            listings = listing_repo.get_by_tickers(read_tickers(args.tickers_file))
+        else:
+            listings = listing_repo.list_all()
+
+        service = PriceIngestionService(
+            SqlAlchemyPriceRepository(session),
+            YFinanceMarketDataProvider(),
+            batch_size=args.batch_size
+        )
+        started = time.monotonic()
+        summary = service.ingest(listings, args.start, args.end)
+        for ticker, reason in summary.failed.items():
+            logger.warning(f"{ticker} not ingested: {reason}")
+        logger.info(f"{summary.written} rows written in {time.monotonic() - started:.1f}s")
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    main()
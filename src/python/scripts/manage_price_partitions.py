@@ -0,0 +1,43 @@
+import argparse
+import logging
+import os
+import sys
+from datetime import date
+
+# Add the project root to the python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "../"))
+
+from infrastructure.database.session import SessionLocal
+from infrastructure.repositories.price_repository import SqlAlchemyPriceRepository
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Create upcoming yearly price partitions and detach those past retention. Meant to run from cron."
+    )
+    parser.add_argument("--years-ahead", type=int, default=1, help="Create partitions through this many years after the current one")
+    parser.add_argument(
+        "--retain-years", type=int,
+        help="Detach partitions older than this many years, counting the current one; keeps everything when omitted"
+    )
+    args = parser.parse_args()
+    if args.years_ahead < 0 or (args.retain_years is not None and args.retain_years < 1):
+        parser.error("--years-ahead must be non-negative and --retain-years at least 1")
+
+    today = date.today()
+    session = SessionLocal()
+    try:
+        repo = SqlAlchemyPriceRepository(session)
+        created = repo.ensure_partitions(date(today.year, 1, 1), date(today.year + args.years_ahead, 12, 31))
+        logger.info(f"Created partitions: {', '.join(created) or 'none'}")
+        if args.retain_years is not None:
+            detached = repo.detach_partitions_before(date(today.year - args.retain_years + 1, 1, 1))
+            # Detached tables keep their rows; archive or drop them separately
+            logger.info(f"Detached partitions: {', '.join(detached) or 'none'}")
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import argparse
+import logging
+import os
+import sys
+
+# Add the project root to the python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "../"))
+
+from infrastructure.services.replay_market_data import RecordingMarketDataProvider, write_synthetic_archive
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+def read_tickers(path: str) -> list:
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build a market data archive for offline replay.")
+    parser.add_argument("archive", help="Output .jsonl.gz archive; recordings are appended")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--tickers-file", help="Record live yfinance payloads for these tickers")
+    source.add_argument("--synthetic", type=int, metavar="COUNT", help="Generate COUNT synthetic tickers instead")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --synthetic")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        write_synthetic_archive(args.archive, args.synthetic, seed=args.seed)
+        logger.info(f"Wrote {args.synthetic} synthetic tickers to {args.archive}")
+        return
+
+    tickers = read_tickers(args.tickers_file)
+    provider = RecordingMarketDataProvider(args.archive)
+    try:
+        provider.get_assets_bulk(tickers)
+    except Exception as e:
+        # Throttled tickers are not recorded; rerun with the same file to fill gaps
+        logger.warning(f"Recording incomplete: {e}")
+    finally:
+        provider.close()
+    logger.info(f"Recorded {provider.recorder.recorded} of {len(tickers)} tickers to {args.archive}")
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,8 @@ from infrastructure.repositories.asset_repository import SqlAlchemyAssetReposito
 from infrastructure.repositories.exchange_repository import SqlAlchemyExchangeRepository
 from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
 from infrastructure.services.market_data_service import YFinanceMarketDataProvider
-from core.services.asset_sync_service import AssetSyncService
+from infrastructure.services.cached_market_data_provider import CachingMarketDataProvider
+from core.services.asset_sync_service import AssetSyncService, DEFAULT_SYNC_BATCH_SIZE
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -31,7 +32,8 @@ def seed_market_data():
         asset_repo = SqlAlchemyAssetRepository(session)
         exchange_repo = SqlAlchemyExchangeRepository(session)
         listing_repo = SqlAlchemyListingRepository(session)
-        market_data = YFinanceMarketDataProvider()
+        # Re-running the seed within the cache TTL replays stored payloads instead of refetching
+        market_data = CachingMarketDataProvider(YFinanceMarketDataProvider())
 
         service = AssetSyncService(asset_repo, exchange_repo, listing_repo, market_data)
 
@@ -46,7 +48,25 @@ def seed_market_data():
         ]
         service.seed_exchanges(exchanges)
 
-        # 2. Seed Assets (Discovery)
+        # 2. Seed how yfinance identifies those venues: its exchange codes, and the
+        # ticker suffixes it uses for non-US listings. New venues only need rows here.
+        exchange_mappings = [
+            {"kind": "EXCHANGE_CODE", "code": "NYQ", "mic_code": "XNYS"},
+            {"kind": "EXCHANGE_CODE", "code": "NMS", "mic_code": "XNAS"},
+            {"kind": "EXCHANGE_CODE", "code": "NGM", "mic_code": "XNAS"},
+            {"kind": "EXCHANGE_CODE", "code": "NCM", "mic_code": "XNAS"},
+            {"kind": "EXCHANGE_CODE", "code": "LSE", "mic_code": "XLON"},
+            {"kind": "EXCHANGE_CODE", "code": "IOB", "mic_code": "XLON"},
+            {"kind": "EXCHANGE_CODE", "code": "JPX", "mic_code": "XTKS"},
+            {"kind": "EXCHANGE_CODE", "code": "FRA", "mic_code": "XFRA"},
+            {"kind": "TICKER_SUFFIX", "code": ".L", "mic_code": "XLON"},
+            {"kind": "TICKER_SUFFIX", "code": ".IL", "mic_code": "XLON"},
+            {"kind": "TICKER_SUFFIX", "code": ".T", "mic_code": "XTKS"},
+            {"kind": "TICKER_SUFFIX", "code": ".F", "mic_code": "XFRA"},
+        ]
+        service.seed_exchange_mappings(market_data.name, exchange_mappings)
+
+        # 3. Seed Assets (Discovery)
         # Since we don't have a discovery API, we'll seed with a few popular tickers
         # covering different asset classes and exchanges.
         initial_tickers = [
@@ -55,13 +75,14 @@ def seed_market_data():
             "TSLA",
             "BTC-USD", "ETH-USD", # Crypto
             "SPY", "VOO", # ETFs
-            "AZN.L", "HSBA.L", # LSE (Note: YFinance uses .L for London)
-            # Note: We need to ensure our service maps 'AZN.L' -> LSE (XLON) correctly.
-            # The current map in AssetSyncService might need adjustment for suffix-based mapping if we want to be robust,
-            # but let's see what YFinance returns for exchange code for these.
+            "AZN.L", "HSBA.L", # LSE; the '.L' suffix maps to XLON whatever exchange code YFinance reports
         ]
 
-        service.sync_assets(initial_tickers)
+        # Incremental so re-running the seed doesn't rewrite rows that haven't changed
+        summary = service.sync_assets(initial_tickers, batch_size=DEFAULT_SYNC_BATCH_SIZE, incremental=True)
+        for ticker, reason in {**summary.skipped, **summary.failed}.items():
+            logger.warning(f"{ticker} not synced: {reason}")
+        logger.info(f"Market data cache: {market_data.stats()}")
 
         logger.info("Market data seed completed successfully.")
 
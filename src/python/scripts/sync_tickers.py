@@ -0,0 +1,69 @@
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import timedelta
+
+# Add the project root to the python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "../"))
+
+from core.services.asset_sync_service import DEFAULT_SYNC_BATCH_SIZE
+from infrastructure.services.replay_market_data import ReplayProviderFactory, load_archive
+from infrastructure.services.sharded_sync import ShardedAssetSync, default_provider_factory
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+def read_tickers(path: str) -> list:
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sync a large ticker universe across several processes.")
+    parser.add_argument("tickers_file", nargs="?", help="File with one ticker per line; with --replay, defaults to every archived ticker")
+    parser.add_argument("--shards", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_SYNC_BATCH_SIZE)
+    parser.add_argument("--incremental", action="store_true", help="Only write listings whose market data changed")
+    parser.add_argument("--fresh-within-minutes", type=int, help="With --incremental, skip recently synced tickers")
+    parser.add_argument("--replay", metavar="ARCHIVE", help="Serve market data from a recorded archive instead of yfinance")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="With --replay, synthetic latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="With --replay, fraction of requests that fail")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="With --replay, fraction of requests that are rate limited")
+    parser.add_argument("--seed", type=int, default=0, help="With --replay, seed for injected latency and errors")
+    args = parser.parse_args()
+
+    if args.tickers_file:
+        tickers = read_tickers(args.tickers_file)
+    elif args.replay:
+        tickers = list(load_archive(args.replay))
+    else:
+        parser.error("tickers_file is required without --replay")
+    fresh_within = timedelta(minutes=args.fresh_within_minutes) if args.fresh_within_minutes else None
+
+    provider_factory = default_provider_factory
+    if args.replay:
+        provider_factory = ReplayProviderFactory(
+            args.replay,
+            latency=args.latency_ms / 1000,
+            latency_jitter=args.latency_ms / 2000,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            seed=args.seed
+        )
+
+    # Exchanges must already be seeded (see seed_market_data.py): shards only read them.
+    started = time.monotonic()
+    summary = ShardedAssetSync(args.shards, provider_factory=provider_factory).sync_assets(
+        tickers,
+        batch_size=args.batch_size,
+        incremental=args.incremental,
+        fresh_within=fresh_within
+    )
+    elapsed = time.monotonic() - started
+    for ticker, reason in {**summary.skipped, **summary.failed}.items():
+        logger.warning(f"{ticker} not synced: {reason}")
+    logger.info(f"{summary.requested} tickers in {elapsed:.1f}s ({summary.requested / elapsed:.0f} tickers/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import logging
+import multiprocessing
+import os
+import socket
+import sys
+import time
+from typing import Optional
+
+# Add the project root to the python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "../"))
+
+from infrastructure.database.session import get_session
+from infrastructure.repositories.asset_repository import SqlAlchemyAssetRepository
+from infrastructure.repositories.exchange_repository import SqlAlchemyExchangeRepository
+from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
+from infrastructure.repositories.sync_job_repository import SqlAlchemySyncJobRepository
+from infrastructure.services.market_data_service import YFinanceMarketDataProvider
+from infrastructure.services.cached_market_data_provider import CachingMarketDataProvider
+from infrastructure.services.metrics_server import start_metrics_server
+from core.services.asset_sync_service import AssetSyncService
+from core.services.sync_job_runner import HEARTBEAT_TIMEOUT, MAX_ATTEMPTS, SyncJobRunner
+
+logger = logging.getLogger(__name__)
+
+def run_worker(worker_id: str, poll_interval: float, metrics_port: Optional[int] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format=f"%(asctime)s [{worker_id}] %(levelname)s %(name)s: %(message)s")
+    logger.info("Sync worker started")
+    if metrics_port is not None:
+        start_metrics_server(metrics_port)
+
+    market_data = CachingMarketDataProvider(YFinanceMarketDataProvider())
+    while True:
+        session_gen = get_session()
+        session = next(session_gen)
+        try:
+            job_repo = SqlAlchemySyncJobRepository(session)
+            service = AssetSyncService(
+                SqlAlchemyAssetRepository(session),
+                SqlAlchemyExchangeRepository(session),
+                SqlAlchemyListingRepository(session),
+                market_data
+            )
+            runner = SyncJobRunner(job_repo, service, worker_id)
+
+            requeued = job_repo.requeue_stale(HEARTBEAT_TIMEOUT, MAX_ATTEMPTS)
+            if requeued:
+                logger.warning(f"Recovered {requeued} sync jobs from unresponsive workers")
+
+            worked = runner.run_next()
+        except Exception as e:
+            logger.error(f"Sync worker loop failed: {e}", exc_info=True)
+            worked = False
+        finally:
+            session.close()
+
+        if not worked:
+            time.sleep(poll_interval)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run sync job workers outside the API process.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="Seconds to wait when the queue is empty")
+    parser.add_argument(
+        "--metrics-port", type=int,
+        help="Serve Prometheus metrics from this port; worker i of --workers N uses port + i"
+    )
+    args = parser.parse_args()
+
+    prefix = f"{socket.gethostname()}-{os.getpid()}"
+    if args.workers == 1:
+        run_worker(f"{prefix}-0", args.poll_interval, args.metrics_port)
+        return
+
+    # Spawn rather than fork: each worker must build its own engine and
+    # connection pool instead of inheriting the parent's sockets.
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=run_worker,
+            args=(f"{prefix}-{i}", args.poll_interval, args.metrics_port + i if args.metrics_port is not None else None),
+            daemon=True
+        )
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.interfaces.market_data import PartialFetchError, ProviderThrottledError
+from core.services.metrics import PROVIDER_THROTTLED
+from infrastructure.services.adaptive_throttle import (
+    AdaptiveConcurrencyLimiter,
+    AdaptiveThrottle,
+    CircuitBreaker,
+    RetryPolicy,
+    is_throttling_error,
+)
+from infrastructure.services.market_data_service import YFinanceMarketDataProvider
+from infrastructure.services.rate_limiter import RateLimiter
+
+CAPACITY = 3
+LATENCY = 0.02
+
+class ThrottlingQuoteHandler(BaseHTTPRequestHandler):
+    """Quote endpoint that answers 429 whenever more than CAPACITY requests are in flight."""
+
+    def do_GET(self):
+        server = self.server
+        ticker = self.path.rsplit("/", 1)[-1]
+        with server.lock:
+            server.in_flight += 1
+            overloaded = server.in_flight > CAPACITY or ticker == "BLOCKED"
+        try:
+            time.sleep(LATENCY)
+            if overloaded:
+                server.throttled += 1
+                self.send_response(429)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            payload = json.dumps({"symbol": ticker, "longName": f"{ticker} Corp", "exchange": "NMS"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+class ThrottlingQuoteServer(ThreadingHTTPServer):
+    request_queue_size = 64
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.throttled = 0
+
+@pytest.fixture
+def throttling_server():
+    server = ThrottlingQuoteServer(("127.0.0.1", 0), ThrottlingQuoteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+
+@pytest.fixture
+def http_info_fetcher(throttling_server):
+    url = f"http://127.0.0.1:{throttling_server.server_address[1]}"
+
+    def fetch(ticker):
+        with urllib.request.urlopen(f"{url}/info/{ticker}", timeout=5) as response:
+            return json.loads(response.read())
+    return fetch
+
+def _fast_retries(max_attempts=8):
+    return RetryPolicy(max_attempts=max_attempts, base_delay=0.005, max_delay=0.05)
+
+def test_provider_converges_below_throttling_threshold(throttling_server, http_info_fetcher):
+    throttle = AdaptiveThrottle("fake", max_concurrency=16, retry=_fast_retries(), rng=random.Random(1))
+    provider = YFinanceMarketDataProvider(
+        max_workers=16,
+        rate_limiter=RateLimiter(rate=10_000, burst=16),
+        info_fetcher=http_info_fetcher,
+        throttle=throttle
+    )
+    tickers = [f"T{i}" for i in range(120)]
+    throttled_before = PROVIDER_THROTTLED.value(provider="fake")
+
+    results = provider.get_assets_bulk(tickers)
+
+    # Every ticker made it through, none was silently turned into "no data"
+    assert all(results[t].name == f"{t} Corp" for t in tickers)
+    assert throttling_server.throttled > 0
+    assert PROVIDER_THROTTLED.value(provider="fake") - throttled_before == throttling_server.throttled
+    # Started at 8 against a capacity of 3: the limit was cut and stayed near capacity
+    assert throttle.limiter.limit <= 2 * CAPACITY
+    # Once converged, throttling is the exception rather than every other call
+    assert throttling_server.throttled < len(tickers) / 2
+
+def test_persistent_throttling_is_reported_not_returned_as_none(http_info_fetcher):
+    throttle = AdaptiveThrottle("fake", max_concurrency=4, retry=_fast_retries(3), sleep=lambda s: None)
+    provider = YFinanceMarketDataProvider(
+        max_workers=2,
+        rate_limiter=RateLimiter(rate=10_000, burst=4),
+        info_fetcher=http_info_fetcher,
+        throttle=throttle
+    )
+
+    with pytest.raises(PartialFetchError) as raised:
+        provider.get_assets_bulk(["AAPL", "BLOCKED"])
+
+    assert raised.value.results["AAPL"].ticker == "AAPL"
+    assert "BLOCKED" not in raised.value.results
+    assert "throttled 3 times" in raised.value.errors["BLOCKED"]
+    with pytest.raises(ProviderThrottledError):
+        provider.get_asset_details("BLOCKED")
+
+def test_limiter_increases_additively_and_cuts_once_per_overload():
+    clock = [0.0]
+    limiter = AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=4, clock=lambda: clock[0])
+
+    # Roughly +1 per window's worth of successes
+    for _ in range(5):
+        limiter.release_success(limiter.acquire())
+    assert limiter.limit == 5
+
+    clock[0] = 1.0
+    early = [limiter.acquire() for _ in range(3)]
+    clock[0] = 2.0
+    for started_at in early:
+        limiter.release_throttled(started_at)
+    # Three calls hit the same overload, but only the first of them cuts
+    assert limiter.limit == 2
+
+    clock[0] = 3.0
+    limiter.release_throttled(limiter.acquire())
+    assert limiter.limit == 1
+
+    limiter.release_throttled(limiter.acquire())
+    assert limiter.limit == 1
+
+def test_limiter_blocks_beyond_limit():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=2, initial_limit=1)
+    started_at = limiter.acquire()
+    acquired = threading.Event()
+
+    thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    thread.start()
+    assert not acquired.wait(0.05)
+
+    limiter.release(started_at)
+    assert acquired.wait(1)
+    thread.join()
+
+def test_retry_delay_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    rng = random.Random(7)
+
+    delays = [policy.delay(attempt, rng=rng) for attempt in range(10) for _ in range(20)]
+
+    assert all(0 <= d <= 5.0 for d in delays)
+    assert len(set(delays)) == len(delays)
+    assert policy.delay(0, retry_after=3.0, rng=rng) >= 3.0
+    assert policy.delay(0, retry_after=60.0, rng=rng) == 5.0
+
+def test_circuit_breaker_fails_fast_then_probes():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=lambda: now[0])
+    calls = []
+
+    def throttled():
+        calls.append(1)
+        raise urllib.error.HTTPError("http://fake", 429, "Too Many Requests", {}, None)
+
+    throttle = AdaptiveThrottle("fake", max_concurrency=4, retry=_fast_retries(3), breaker=breaker, sleep=lambda s: None)
+
+    with pytest.raises(ProviderThrottledError, match="throttled 3 times"):
+        throttle.call(throttled)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(ProviderThrottledError, match="circuit open"):
+        throttle.call(throttled)
+    assert len(calls) == 3
+
+    now[0] = 11
+    assert throttle.call(lambda: "ok") == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_half_open_circuit_reopens_on_failed_probe():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    breaker.record_failure()
+
+    now[0] = 11
+    assert breaker.allow()
+    # Only one probe at a time
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+def test_other_errors_are_not_retried():
+    calls = []
+
+    def broken():
+        calls.append(1)
+        raise ValueError("bad payload")
+
+    throttle = AdaptiveThrottle("fake", max_concurrency=4, sleep=lambda s: None)
+
+    with pytest.raises(ValueError):
+        throttle.call(broken)
+    assert len(calls) == 1
+
+def test_is_throttling_error():
+    assert is_throttling_error(urllib.error.HTTPError("http://fake", 429, "Too Many Requests", {}, None))
+    assert is_throttling_error(urllib.error.HTTPError("http://fake", 503, "Unavailable", {}, None))
+    assert is_throttling_error(urllib.error.URLError(TimeoutError("timed out")))
+    assert is_throttling_error(TimeoutError())
+
+    class YFRateLimitError(Exception):
+        pass
+
+    assert is_throttling_error(YFRateLimitError())
+    assert not is_throttling_error(urllib.error.HTTPError("http://fake", 404, "Not Found", {}, None))
+    assert not is_throttling_error(KeyError("symbol"))
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.interfaces.market_data import AsyncMarketDataProvider, MarketDataAsset, MarketDataProvider
+from core.services.async_asset_sync_service import AsyncAssetSyncService
+from core.services.market_data_adapter import SyncMarketDataProviderAdapter
+from core.services.sync_summary import SyncSummary
+
+class FakeAsyncProvider(AsyncMarketDataProvider):
+    def __init__(self, latency: float = 0.02):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_seen_in_flight = 0
+        self.fetch_finished_at: Dict[str, float] = {}
+
+    async def aget_asset_details(self, ticker: str) -> Optional[MarketDataAsset]:
+        self.in_flight += 1
+        self.max_seen_in_flight = max(self.max_seen_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if ticker == "BOOM":
+                raise RuntimeError("connection reset")
+            return MarketDataAsset(ticker=ticker, name=f"{ticker} Corp", currency="USD", asset_class="EQUITY", exchange_mic="NMS")
+        finally:
+            self.in_flight -= 1
+            self.fetch_finished_at[ticker] = time.monotonic()
+
+    async def aget_assets_bulk(self, tickers: List[str]) -> Dict[str, Optional[MarketDataAsset]]:
+        return {t: await self.aget_asset_details(t) for t in tickers}
+
+@pytest.fixture
+def recording_sync_service():
+    service = MagicMock()
+    service.persisted_at = []
+
+    def persist(batch, batch_size, existing=None):
+        service.persisted_at.append(time.monotonic())
+        return SyncSummary(synced=sum(1 for d in batch.values() if d))
+
+    service.persist_market_data.side_effect = persist
+    return service
+
+def test_async_sync_bounds_in_flight_requests(recording_sync_service):
+    provider = FakeAsyncProvider()
+    engine = AsyncAssetSyncService(recording_sync_service, provider, max_in_flight=4, batch_size=5)
+
+    summary = asyncio.run(engine.sync_assets([f"T{i}" for i in range(20)] + ["T0"]))
+
+    assert summary.requested == 20
+    assert summary.synced == 20
+    assert provider.max_seen_in_flight == 4
+    assert recording_sync_service.persist_market_data.call_count == 4
+
+def test_async_sync_overlaps_fetching_and_writing(recording_sync_service):
+    provider = FakeAsyncProvider()
+    engine = AsyncAssetSyncService(recording_sync_service, provider, max_in_flight=2, batch_size=2)
+
+    asyncio.run(engine.sync_assets([f"T{i}" for i in range(10)]))
+
+    first_write = recording_sync_service.persisted_at[0]
+    last_fetch = max(provider.fetch_finished_at.values())
+    assert first_write < last_fetch
+
+def test_async_sync_reports_fetch_failures(recording_sync_service):
+    engine = AsyncAssetSyncService(recording_sync_service, FakeAsyncProvider(), max_in_flight=2, batch_size=10)
+
+    summary = asyncio.run(engine.sync_assets(["AAPL", "BOOM"]))
+
+    assert summary.synced == 1
+    assert "BOOM" in summary.failed
+
+def test_sync_provider_adapter_delegates_to_blocking_provider():
+    provider = MagicMock(spec=MarketDataProvider)
+    provider.get_asset_details.return_value = MarketDataAsset(ticker="AAPL", name="Apple", currency="USD", asset_class="EQUITY")
+    provider.get_assets_bulk.return_value = {"AAPL": None}
+    adapter = SyncMarketDataProviderAdapter(provider)
+
+    assert asyncio.run(adapter.aget_asset_details("AAPL")).name == "Apple"
+    assert asyncio.run(adapter.aget_assets_bulk(["AAPL"])) == {"AAPL": None}
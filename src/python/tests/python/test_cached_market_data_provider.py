@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.interfaces.market_data import MarketDataAsset, MarketDataProvider, PartialFetchError
+from infrastructure.services.cached_market_data_provider import CachingMarketDataProvider
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+def _asset(ticker):
+    return MarketDataAsset(ticker=ticker, name=f"{ticker} Corp", currency="USD", asset_class="EQUITY", exchange_mic="NMS")
+
+@pytest.fixture
+def provider():
+    inner = MagicMock(spec=MarketDataProvider)
+    inner.get_assets_bulk.side_effect = lambda tickers: {t: None if t == "NOPE" else _asset(t) for t in tickers}
+    inner.get_asset_details.side_effect = lambda t: None if t == "NOPE" else _asset(t)
+    return inner
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "market_data.sqlite3")
+
+def test_repeated_bulk_fetch_is_served_from_cache(provider, clock, cache_path):
+    cache = CachingMarketDataProvider(provider, cache_path, clock=clock)
+
+    first = cache.get_assets_bulk(["AAPL", "MSFT"])
+    second = cache.get_assets_bulk(["MSFT", "AAPL", "NVDA"])
+
+    assert second["AAPL"] == first["AAPL"]
+    assert provider.get_assets_bulk.call_count == 2
+    assert provider.get_assets_bulk.call_args[0][0] == ["NVDA"]
+    assert cache.stats() == {"hits": 2, "misses": 3, "entries": 3}
+
+def test_cache_persists_across_instances(provider, clock, cache_path):
+    CachingMarketDataProvider(provider, cache_path, clock=clock).get_assets_bulk(["AAPL"])
+
+    reopened = CachingMarketDataProvider(provider, cache_path, clock=clock)
+
+    assert reopened.get_asset_details("AAPL").name == "AAPL Corp"
+    provider.get_asset_details.assert_not_called()
+
+def test_entries_expire_after_ttl(provider, clock, cache_path):
+    cache = CachingMarketDataProvider(provider, cache_path, ttl_seconds=60, clock=clock)
+    cache.get_assets_bulk(["AAPL"])
+
+    clock.now += 61
+    cache.get_assets_bulk(["AAPL"])
+
+    assert provider.get_assets_bulk.call_count == 2
+
+def test_unknown_tickers_are_negatively_cached_for_shorter_ttl(provider, clock, cache_path):
+    cache = CachingMarketDataProvider(provider, cache_path, ttl_seconds=3600, negative_ttl_seconds=60, clock=clock)
+
+    assert cache.get_assets_bulk(["NOPE"]) == {"NOPE": None}
+    assert cache.get_assets_bulk(["NOPE"]) == {"NOPE": None}
+    assert provider.get_assets_bulk.call_count == 1
+
+    clock.now += 61
+    cache.get_assets_bulk(["NOPE"])
+    assert provider.get_assets_bulk.call_count == 2
+
+def test_least_recently_used_entries_are_evicted(provider, clock, cache_path):
+    cache = CachingMarketDataProvider(provider, cache_path, max_entries=2, clock=clock)
+    cache.get_assets_bulk(["AAPL"])
+    clock.now += 1
+    cache.get_assets_bulk(["MSFT"])
+    clock.now += 1
+    cache.get_assets_bulk(["AAPL"])  # touch, so MSFT becomes least recently used
+    clock.now += 1
+    cache.get_assets_bulk(["NVDA"])
+
+    assert cache.stats()["entries"] == 2
+    provider.get_assets_bulk.reset_mock()
+    cache.get_assets_bulk(["AAPL", "MSFT", "NVDA"])
+    assert provider.get_assets_bulk.call_args[0][0] == ["MSFT"]
+
+def test_throttled_tickers_are_not_cached(provider, clock, cache_path):
+    def get_assets_bulk(tickers):
+        results = {t: _asset(t) for t in tickers if t != "SLOW"}
+        if "SLOW" in tickers:
+            raise PartialFetchError(results, {"SLOW": "throttled"})
+        return results
+
+    provider.get_assets_bulk.side_effect = get_assets_bulk
+    cache = CachingMarketDataProvider(provider, cache_path, clock=clock)
+
+    with pytest.raises(PartialFetchError) as raised:
+        cache.get_assets_bulk(["AAPL", "SLOW"])
+    assert set(raised.value.results) == {"AAPL"}
+
+    # AAPL now comes from the cache, SLOW is asked for again rather than read back as missing
+    with pytest.raises(PartialFetchError):
+        cache.get_assets_bulk(["AAPL", "SLOW"])
+    assert provider.get_assets_bulk.call_args[0][0] == ["SLOW"]
+    assert cache.stats()["entries"] == 1
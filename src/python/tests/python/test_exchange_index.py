@@ -0,0 +1,69 @@
+from unittest.mock import MagicMock
+
+from core.domain.exchange import Exchange
+from core.domain.exchange_mapping import ExchangeMapping
+from core.services.exchange_index import ExchangeIndex
+
+XNAS = Exchange(id=1, name="Nasdaq", mic_code="XNAS", currency="USD")
+XLON = Exchange(id=2, name="London Stock Exchange", mic_code="XLON", currency="GBP")
+XDUB = Exchange(id=3, name="Euronext Dublin", mic_code="XDUB", currency="EUR")
+
+def _mapping(kind, code, mic):
+    return ExchangeMapping(provider="yfinance", kind=kind, code=code, mic_code=mic)
+
+MAPPINGS = [
+    _mapping("EXCHANGE_CODE", "NMS", "XNAS"),
+    _mapping("EXCHANGE_CODE", "GER", "XETR"),
+    _mapping("TICKER_SUFFIX", ".L", "XLON"),
+    _mapping("TICKER_SUFFIX", ".IL", "XLON"),
+    _mapping("TICKER_SUFFIX", ".I.L", "XDUB"),
+    _mapping("TICKER_SUFFIX", ".DE", "XETR"),
+]
+
+def test_resolves_provider_code_then_mic():
+    index = ExchangeIndex([XNAS, XLON], MAPPINGS)
+
+    assert index.resolve("NMS") is XNAS
+    assert index.resolve("XLON") is XLON
+    assert index.resolve("NYQ") is None
+    assert index.resolve(None) is None
+
+def test_falls_back_to_longest_ticker_suffix():
+    index = ExchangeIndex([XNAS, XLON, XDUB], MAPPINGS)
+
+    assert index.resolve("???", "AZN.L") is XLON
+    assert index.resolve(None, "abc.il") is XLON
+    assert index.resolve(None, "RYA.I.L") is XDUB
+    # The exchange code wins over the suffix
+    assert index.resolve("NMS", "AZN.L") is XNAS
+
+def test_suffix_needs_a_symbol_in_front():
+    index = ExchangeIndex([XLON], MAPPINGS)
+
+    assert index.resolve(None, ".L") is None
+    assert index.resolve(None, "AAPL") is None
+
+def test_mappings_to_unseeded_exchanges_are_misses():
+    index = ExchangeIndex([XNAS], MAPPINGS)
+
+    assert index.resolve("GER", "SAP.DE") is None
+
+def test_load_reads_mappings_of_one_provider():
+    repo = MagicMock()
+    repo.list_all.return_value = [XNAS]
+    repo.list_mappings.return_value = MAPPINGS
+
+    index = ExchangeIndex.load(repo, "yfinance")
+
+    repo.list_mappings.assert_called_once_with("yfinance")
+    assert index.resolve("NMS") is XNAS
+
+def test_load_without_provider_only_resolves_mics():
+    repo = MagicMock()
+    repo.list_all.return_value = [XNAS]
+
+    index = ExchangeIndex.load(repo)
+
+    repo.list_mappings.assert_not_called()
+    assert index.resolve("XNAS") is XNAS
+    assert index.resolve("NMS") is None
@@ -0,0 +1,101 @@
+import pytest
+
+from core.domain.asset import Asset
+from core.domain.enums import AssetClass
+from core.domain.listing import Listing
+from core.domain.resolved_listing import ResolvedListing
+from infrastructure.services.listing_resolve_cache import ListingResolveCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+def _resolved(ticker, mic="XNAS"):
+    return (ResolvedListing(
+        listing=Listing(id=1, asset_id=1, exchange_id=1, ticker=ticker, currency="USD"),
+        asset=Asset(id=1, name=f"{ticker} Corp", asset_class=AssetClass.EQUITY),
+        mic_code=mic
+    ),)
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_put_then_get_is_a_hit(clock):
+    cache = ListingResolveCache(clock=clock)
+    assert cache.get(("AAPL", "XNAS")) is None
+
+    cache.put(("AAPL", "XNAS"), _resolved("AAPL"), cache.generation())
+
+    assert cache.get(("AAPL", "XNAS")) == _resolved("AAPL")
+    assert cache.get(("AAPL", None)) is None
+
+def test_entries_expire_after_ttl(clock):
+    cache = ListingResolveCache(ttl_seconds=60, negative_ttl_seconds=5, clock=clock)
+    cache.put(("AAPL", None), _resolved("AAPL"), cache.generation())
+    cache.put(("NOPE", None), (), cache.generation())
+
+    clock.now += 6
+    assert cache.get(("AAPL", None)) is not None
+    # Unknown tickers are remembered, but only briefly
+    assert cache.get(("NOPE", None)) is None
+
+    clock.now += 55
+    assert cache.get(("AAPL", None)) is None
+    assert len(cache) == 0
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ListingResolveCache(max_entries=2, clock=clock)
+    cache.put(("A", None), _resolved("A"), cache.generation())
+    cache.put(("B", None), _resolved("B"), cache.generation())
+    cache.get(("A", None))
+
+    cache.put(("C", None), _resolved("C"), cache.generation())
+
+    assert cache.get(("B", None)) is None
+    assert cache.get(("A", None)) is not None and cache.get(("C", None)) is not None
+
+def test_invalidate_drops_the_ticker_on_every_exchange(clock):
+    cache = ListingResolveCache(clock=clock)
+    for key in [("SAP", "XETR"), ("SAP", None), ("SIE", "XETR")]:
+        cache.put(key, _resolved(key[0]), cache.generation())
+
+    cache.invalidate(["SAP"])
+
+    assert cache.get(("SAP", "XETR")) is None and cache.get(("SAP", None)) is None
+    assert cache.get(("SIE", "XETR")) is not None
+
+def test_result_read_before_an_invalidation_is_not_stored(clock):
+    cache = ListingResolveCache(clock=clock)
+    generation = cache.generation()
+
+    # A write commits and invalidates while the miss is still reading the database
+    cache.invalidate(["AAPL"])
+    cache.put(("AAPL", None), (), generation)
+
+    assert cache.get(("AAPL", None)) is None
+
+def test_callers_cannot_change_cached_values(clock):
+    cache = ListingResolveCache(clock=clock)
+    stored = _resolved("AAPL")
+    cache.put(("AAPL", None), stored, cache.generation())
+
+    stored[0].asset.name = "Changed by the writer"
+    cache.get(("AAPL", None))[0].listing.is_active = False
+
+    hit = cache.get(("AAPL", None))[0]
+    assert (hit.asset.name, hit.listing.is_active) == ("AAPL Corp", True)
+
+def test_invalidate_assets_drops_every_ticker_of_the_asset(clock):
+    cache = ListingResolveCache(clock=clock)
+    cache.put(("AAPL", None), _resolved("AAPL") + _resolved("AAPL", "XNYS"), cache.generation())
+    cache.put(("AAPL", "XNAS"), _resolved("AAPL"), cache.generation())
+    cache.put(("NOPE", None), (), cache.generation())
+
+    cache.invalidate_assets([1])
+
+    assert cache.get(("AAPL", None)) is None and cache.get(("AAPL", "XNAS")) is None
+    assert cache.get(("NOPE", None)) == ()
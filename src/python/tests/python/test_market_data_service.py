@@ -0,0 +1,101 @@
+import json
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.domain.enums import AssetClass
+from infrastructure.services.market_data_service import YFinanceMarketDataProvider
+from infrastructure.services.rate_limiter import RateLimiter
+
+LATENCY = 0.1
+
+class FakeQuoteHandler(BaseHTTPRequestHandler):
+    """Stands in for Yahoo's quote endpoint: slow, and failing for some symbols."""
+
+    def do_GET(self):
+        ticker = self.path.rsplit("/", 1)[-1]
+        time.sleep(LATENCY)
+        if ticker == "BOOM":
+            self.send_response(500)
+            self.end_headers()
+            return
+        if ticker == "NOPE":
+            body = {}
+        else:
+            body = {"symbol": ticker, "longName": f"{ticker} Corp", "quoteType": "EQUITY", "currency": "USD", "exchange": "NMS"}
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+class FakeQuoteServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 makes concurrent connects beyond it wait
+    # for a SYN retransmit, which turns the timing assertions flaky.
+    request_queue_size = 64
+
+@pytest.fixture(scope="module")
+def fake_quote_server():
+    server = FakeQuoteServer(("127.0.0.1", 0), FakeQuoteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+@pytest.fixture
+def http_info_fetcher(fake_quote_server):
+    def fetch(ticker):
+        with urllib.request.urlopen(f"{fake_quote_server}/info/{ticker}", timeout=5) as response:
+            return json.loads(response.read())
+    return fetch
+
+def test_get_assets_bulk_fetches_concurrently(http_info_fetcher):
+    tickers = [f"T{i}" for i in range(16)]
+    provider = YFinanceMarketDataProvider(
+        max_workers=8,
+        rate_limiter=RateLimiter(rate=1000, burst=16),
+        info_fetcher=http_info_fetcher
+    )
+
+    started = time.monotonic()
+    results = provider.get_assets_bulk(tickers)
+    elapsed = time.monotonic() - started
+
+    assert list(results) == tickers
+    assert all(r is not None for r in results.values())
+    assert results["T3"].name == "T3 Corp"
+    assert results["T3"].asset_class == AssetClass.EQUITY.value
+    # Sequential fetching would take 16 * LATENCY
+    assert elapsed < 16 * LATENCY / 2
+
+def test_get_assets_bulk_reports_failures_as_none(http_info_fetcher):
+    provider = YFinanceMarketDataProvider(
+        max_workers=4,
+        rate_limiter=RateLimiter(rate=1000, burst=4),
+        info_fetcher=http_info_fetcher
+    )
+
+    results = provider.get_assets_bulk(["AAPL", "BOOM", "NOPE", "AAPL"])
+
+    assert set(results) == {"AAPL", "BOOM", "NOPE"}
+    assert results["AAPL"].ticker == "AAPL"
+    assert results["BOOM"] is None
+    assert results["NOPE"] is None
+
+def test_rate_limiter_bounds_request_rate():
+    limiter = RateLimiter(rate=50, burst=1)
+
+    started = time.monotonic()
+    for _ in range(11):
+        limiter.acquire()
+    elapsed = time.monotonic() - started
+
+    # The first token is available immediately, the other ten refill at 50/s
+    assert elapsed >= 10 / 50 * 0.9
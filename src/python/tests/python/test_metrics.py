@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.domain.asset import Asset
+from core.domain.exchange import Exchange
+from core.interfaces.market_data import MarketDataAsset
+from core.services.asset_sync_service import AssetSyncService
+from core.services.metrics import Counter, Histogram, MetricsRegistry, SYNC_STAGE_SECONDS, SYNC_TICKERS
+
+def test_counter_renders_prometheus_text():
+    registry = MetricsRegistry()
+    counter = Counter("jobs_total", "Jobs run.", ["status"], registry=registry)
+
+    counter.inc(status="ok")
+    counter.inc(2, status="ok")
+    counter.inc(status='bad "quote"')
+
+    assert registry.render() == (
+        "# HELP jobs_total Jobs run.\n"
+        "# TYPE jobs_total counter\n"
+        'jobs_total{status="bad \\"quote\\""} 1\n'
+        'jobs_total{status="ok"} 3\n'
+    )
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = Histogram("latency_seconds", "Latency.", ["route"], buckets=(0.1, 1.0), registry=registry)
+
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, route="/x")
+
+    lines = registry.render().splitlines()
+    assert lines[2:] == [
+        'latency_seconds_bucket{route="/x",le="0.1"} 2',
+        'latency_seconds_bucket{route="/x",le="1"} 3',
+        'latency_seconds_bucket{route="/x",le="+Inf"} 4',
+        'latency_seconds_sum{route="/x"} 3.65',
+        'latency_seconds_count{route="/x"} 4',
+    ]
+
+def test_metrics_reject_wrong_labels_and_duplicates():
+    registry = MetricsRegistry()
+    counter = Counter("c_total", "C.", ["a"], registry=registry)
+
+    with pytest.raises(ValueError):
+        counter.inc(b="x")
+    with pytest.raises(ValueError):
+        counter.inc(-1, a="x")
+    with pytest.raises(ValueError):
+        Counter("c_total", "Again.", registry=registry)
+
+def test_sync_records_stage_timings_and_outcomes():
+    asset_repo = MagicMock()
+    asset_repo.upsert_many.side_effect = lambda assets: [
+        Asset(id=1, name=a.name, asset_class=a.asset_class) for a in assets
+    ]
+    exchange_repo = MagicMock()
+    exchange_repo.list_all.return_value = [Exchange(id=1, name="Nasdaq", mic_code="XNAS", currency="USD")]
+    provider = MagicMock()
+    provider.get_assets_bulk.return_value = {
+        "AAPL": MarketDataAsset("AAPL", "Apple", "USD", "EQUITY", exchange_mic="XNAS"),
+        "NOPE": None,
+    }
+    before = {
+        stage: SYNC_STAGE_SECONDS.count(stage=stage)
+        for stage in ("resolve_exchange", "map", "asset_upsert", "listing_upsert")
+    }
+    synced, skipped = SYNC_TICKERS.value(outcome="synced"), SYNC_TICKERS.value(outcome="skipped")
+
+    AssetSyncService(asset_repo, exchange_repo, MagicMock(), provider).sync_assets(["AAPL", "NOPE"], batch_size=10)
+
+    for stage, count in before.items():
+        assert SYNC_STAGE_SECONDS.count(stage=stage) == count + 1
+    assert SYNC_TICKERS.value(outcome="synced") == synced + 1
+    assert SYNC_TICKERS.value(outcome="skipped") == skipped + 1
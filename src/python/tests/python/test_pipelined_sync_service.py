@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.domain.asset import Asset
+from core.domain.exchange import Exchange
+from core.domain.exchange_mapping import ExchangeMapping
+from core.domain.listing import Listing
+from core.interfaces.market_data import MarketDataAsset, MarketDataExchange, MarketDataProvider
+from core.services.asset_sync_service import AssetSyncService
+from core.services.pipelined_asset_sync_service import PipelinedAssetSyncService
+
+def _market_asset(ticker, name=None, exchange="NMS"):
+    return MarketDataAsset(ticker=ticker, name=name or f"{ticker} Corp", currency="USD", asset_class="EQUITY", exchange_mic=exchange)
+
+class FakeProvider(MarketDataProvider):
+    name = "yfinance"
+
+    def __init__(self, data: Optional[Dict[str, MarketDataAsset]] = None):
+        self.data = data
+        self.calls: List[List[str]] = []
+
+    def get_asset_details(self, ticker: str) -> Optional[MarketDataAsset]:
+        return self.get_assets_bulk([ticker])[ticker]
+
+    def get_exchange_details(self, mic_code: str) -> Optional[MarketDataExchange]:
+        return None
+
+    def get_assets_bulk(self, tickers: List[str]) -> Dict[str, Optional[MarketDataAsset]]:
+        self.calls.append(list(tickers))
+        if "BOOM" in tickers:
+            raise RuntimeError("connection reset")
+        if self.data is None:
+            return {t: _market_asset(t) for t in tickers}
+        return {t: self.data.get(t) for t in tickers}
+
+@pytest.fixture
+def asset_repo():
+    repo = MagicMock()
+    repo.upsert_many.side_effect = lambda assets: [
+        Asset(id=i + 1, name=a.name, asset_class=a.asset_class) for i, a in enumerate(assets)
+    ]
+    return repo
+
+@pytest.fixture
+def exchange_repo():
+    repo = MagicMock()
+    repo.list_all.return_value = [Exchange(id=1, name="Nasdaq", mic_code="XNAS", currency="USD")]
+    repo.list_mappings.return_value = [
+        ExchangeMapping(provider="yfinance", kind="EXCHANGE_CODE", code="NMS", mic_code="XNAS")
+    ]
+    return repo
+
+@pytest.fixture
+def listing_repo():
+    return MagicMock()
+
+def test_pipeline_writes_before_input_is_exhausted(asset_repo, exchange_repo, listing_repo):
+    consumed = []
+    consumed_at_first_write = []
+
+    def tickers():
+        for i in range(5000):
+            consumed.append(i)
+            yield f"T{i}"
+
+    def upsert_many(assets):
+        if not consumed_at_first_write:
+            consumed_at_first_write.append(len(consumed))
+        return [Asset(id=1, name=a.name, asset_class=a.asset_class) for a in assets]
+
+    asset_repo.upsert_many.side_effect = upsert_many
+    provider = FakeProvider()
+    service = AssetSyncService(asset_repo, exchange_repo, listing_repo, provider)
+    pipeline = PipelinedAssetSyncService(service, provider, fetch_workers=2, fetch_chunk_size=10, batch_size=10)
+
+    summary = pipeline.sync_assets(tickers())
+
+    assert summary.requested == 5000
+    assert summary.synced == 5000
+    # Bounded queues: three hops of four chunks plus one chunk per stage thread
+    # is all that can be read ahead of the first write, out of 500 chunks.
+    assert consumed_at_first_write[0] <= 10 * (3 * 4 + 5)
+    assert max(len(c) for c in provider.calls) == 10
+
+def test_pipeline_reports_every_outcome(asset_repo, exchange_repo, listing_repo):
+    provider = FakeProvider({
+        "AAPL": _market_asset("AAPL"),
+        "MSFT": _market_asset("MSFT"),
+        "VOD.L": _market_asset("VOD.L", exchange="XXXX"),
+    })
+    service = AssetSyncService(asset_repo, exchange_repo, listing_repo, provider)
+    pipeline = PipelinedAssetSyncService(service, provider, fetch_workers=2, fetch_chunk_size=2, batch_size=2)
+
+    summary = pipeline.sync_assets(["AAPL", "AAPL", "MSFT", "VOD.L", "NOPE", "BOOM"])
+
+    assert summary.requested == 5
+    assert summary.synced == 2
+    assert summary.fetched == 3
+    assert summary.skipped["NOPE"] == "No market data"
+    assert summary.unknown_exchanges == {"XXXX": 1}
+    assert summary.failed["BOOM"].startswith("Fetch failed")
+    written = sorted(l.ticker for c in listing_repo.upsert_many.call_args_list for l in c[0][0])
+    assert written == ["AAPL", "MSFT"]
+
+def test_incremental_pipeline_loads_state_per_chunk(asset_repo, exchange_repo, listing_repo):
+    now = datetime.now(timezone.utc)
+    unchanged = _market_asset("MSFT")
+    listings = {
+        "AAPL": Listing(id=10, asset_id=1, exchange_id=1, ticker="AAPL", currency="USD", synced_at=now),
+        "MSFT": Listing(id=11, asset_id=2, exchange_id=1, ticker="MSFT", currency="USD",
+                        content_hash=unchanged.content_hash(), synced_at=now - timedelta(days=2)),
+        "NVDA": Listing(id=12, asset_id=3, exchange_id=1, ticker="NVDA", currency="USD",
+                        content_hash="stale-hash", synced_at=now - timedelta(days=2)),
+    }
+    listing_repo.get_by_tickers.side_effect = lambda tickers: [listings[t] for t in tickers if t in listings]
+    provider = FakeProvider()
+    service = AssetSyncService(asset_repo, exchange_repo, listing_repo, provider)
+    pipeline = PipelinedAssetSyncService(
+        service, provider, fetch_chunk_size=2, incremental=True, fresh_within=timedelta(hours=1)
+    )
+
+    summary = pipeline.sync_assets(["AAPL", "MSFT", "NVDA", "AMD"])
+
+    assert [c[0][0] for c in listing_repo.get_by_tickers.call_args_list] == [["AAPL", "MSFT"], ["NVDA", "AMD"]]
+    assert sorted(t for c in provider.calls for t in c) == ["AMD", "MSFT", "NVDA"]
+    assert (summary.fresh, summary.fetched, summary.unchanged, summary.updated, summary.inserted) == (1, 3, 1, 1, 1)
+    listing_repo.mark_synced.assert_called_once_with([11])
+
+def test_pipeline_stops_all_stages_on_unexpected_error(asset_repo, exchange_repo, listing_repo):
+    calls = []
+
+    def get_by_tickers(tickers):
+        calls.append(tickers)
+        if len(calls) == 3:
+            raise RuntimeError("database went away")
+        return []
+
+    listing_repo.get_by_tickers.side_effect = get_by_tickers
+    provider = FakeProvider()
+    service = AssetSyncService(asset_repo, exchange_repo, listing_repo, provider)
+    pipeline = PipelinedAssetSyncService(service, provider, fetch_chunk_size=5, incremental=True)
+
+    with pytest.raises(RuntimeError, match="database went away"):
+        pipeline.sync_assets(f"T{i}" for i in range(10_000))
+
+    assert len(calls) == 3
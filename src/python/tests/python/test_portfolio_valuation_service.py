@@ -0,0 +1,86 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from core.domain.portfolio import PositionArrays
+from core.services.portfolio_valuation_service import PortfolioValuationService
+
+def _positions(rows):
+    listing_ids, quantities, prices, currencies, asset_classes, mic_codes = zip(*rows)
+    return PositionArrays(
+        listing_ids=np.array(listing_ids),
+        quantities=np.array([Decimal(q) for q in quantities], dtype=object),
+        prices=np.array([None if p is None else Decimal(p) for p in prices], dtype=object),
+        price_dates=np.array(["2024-06-28" if p is not None else "NaT" for p in prices], dtype="datetime64[D]"),
+        currencies=np.array(currencies),
+        asset_classes=np.array(asset_classes),
+        mic_codes=np.array(mic_codes),
+    )
+
+@pytest.fixture
+def positions():
+    return _positions([
+        (1, 10, "100.00", "USD", "EQUITY", "XNAS"),
+        (2, 5, "200.00", "USD", "EQUITY", "XNYS"),
+        (3, 20, "50.00", "USD", "FIXED_INCOME", "XNAS"),
+        (4, 100, "2.00", "GBP", "EQUITY", "XLON"),
+        (5, 7, None, "USD", "EQUITY", "XNAS"),
+    ])
+
+def test_values_and_weights_stay_within_a_currency(positions):
+    repo = MagicMock()
+    repo.load_positions.return_value = positions
+
+    valuation = PortfolioValuationService(repo).value(42)
+
+    repo.load_positions.assert_called_once_with(42)
+    assert valuation.totals == {"GBP": Decimal("200.00"), "USD": Decimal("3000.00")}
+    assert valuation.market_values.tolist() == [1000, 1000, 1000, 200, None]
+    np.testing.assert_allclose(valuation.weights, [1 / 3, 1 / 3, 1 / 3, 1.0, np.nan])
+    assert valuation.unpriced == [5]
+
+def test_breakdowns_by_asset_class_and_exchange(positions):
+    valuation = PortfolioValuationService(MagicMock()).value_positions(42, positions)
+
+    by_class = {(b.currency, b.key): (b.market_value, b.weight) for b in valuation.by_asset_class}
+    assert by_class == {
+        ("GBP", "EQUITY"): (200.0, 1.0),
+        ("USD", "EQUITY"): (2000.0, pytest.approx(2 / 3)),
+        ("USD", "FIXED_INCOME"): (1000.0, pytest.approx(1 / 3)),
+    }
+    by_exchange = {(b.currency, b.key): b.market_value for b in valuation.by_exchange}
+    assert by_exchange == {("GBP", "XLON"): 200.0, ("USD", "XNAS"): 2000.0, ("USD", "XNYS"): 1000.0}
+
+def test_net_zero_currency_has_no_weights():
+    positions = _positions([
+        (1, 10, "10.00", "EUR", "EQUITY", "XETR"),
+        (2, -10, "10.00", "EUR", "EQUITY", "XETR"),
+    ])
+
+    valuation = PortfolioValuationService(MagicMock()).value_positions(1, positions)
+
+    assert valuation.totals == {"EUR": 0}
+    assert np.isnan(valuation.weights).all()
+    assert np.isnan(valuation.by_asset_class[0].weight)
+
+def test_empty_portfolio():
+    positions = PositionArrays(*(np.array([], dtype=object) for _ in range(7)))
+
+    valuation = PortfolioValuationService(MagicMock()).value_positions(1, positions)
+
+    assert valuation.totals == {}
+    assert valuation.by_exchange == [] and valuation.unpriced == []
+
+def test_totals_are_exact_decimal_sums():
+    # 0.1 + 0.2 is 0.30000000000000004 in float64
+    positions = _positions([
+        (1, "0.1", "1.00", "USD", "EQUITY", "XNAS"),
+        (2, "0.2", "1.00", "USD", "EQUITY", "XNAS"),
+    ])
+
+    valuation = PortfolioValuationService(MagicMock()).value_positions(1, positions)
+
+    assert valuation.totals == {"USD": Decimal("0.3")}
+    assert valuation.by_exchange[0].market_value == Decimal("0.3")
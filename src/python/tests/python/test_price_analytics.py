@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.services.price_analytics import (
+    correlation_matrix,
+    daily_returns,
+    drawdowns,
+    forward_fill,
+    rolling_volatility,
+    summarize_returns,
+)
+
+@pytest.fixture
+def closes():
+    # Random walks with gaps, and one listing that only starts trading later
+    rng = np.random.default_rng(7)
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.01, (400, 8)), axis=0)
+    closes[rng.random(closes.shape) < 0.1] = np.nan
+    closes[:50, 3] = np.nan
+    return closes
+
+def test_returns_skip_gaps_instead_of_counting_zero_returns(closes):
+    frame = pd.DataFrame(closes)
+    expected = (frame / frame.ffill().shift(1) - 1).iloc[1:]
+
+    np.testing.assert_allclose(daily_returns(closes), expected.to_numpy(), equal_nan=True)
+
+def test_summary_uses_first_and_last_close(closes):
+    dates = np.datetime64("2020-01-01") + np.arange(len(closes))
+    returns = daily_returns(closes)
+
+    summary = summarize_returns(dates, closes, returns)
+
+    frame = pd.DataFrame(closes)
+    first, last = frame.bfill().iloc[0], frame.ffill().iloc[-1]
+    np.testing.assert_allclose(summary.total_return, (last / first - 1).to_numpy())
+    np.testing.assert_allclose(summary.annualized_volatility, pd.DataFrame(returns).std().to_numpy() * np.sqrt(252))
+
+def test_rolling_volatility_matches_pandas(closes):
+    returns = daily_returns(closes)
+
+    result = rolling_volatility(returns, window=21, min_periods=17)
+
+    expected = pd.DataFrame(returns).rolling(21, min_periods=17).std() * np.sqrt(252)
+    np.testing.assert_allclose(result, expected.to_numpy(), equal_nan=True)
+
+def test_drawdowns_find_peak_before_the_deepest_trough():
+    closes = np.array([[100.0], [120.0], [np.nan], [90.0], [110.0], [60.0], [130.0]])
+
+    result = drawdowns(closes)
+
+    assert result.max_drawdown[0] == pytest.approx(60 / 120 - 1)
+    assert (result.peak_rows[0], result.trough_rows[0]) == (1, 5)
+    # The gap carries the last close forward rather than breaking the series
+    assert result.drawdown[2, 0] == 0.0
+
+def test_correlation_is_pairwise_over_shared_dates(closes):
+    returns = daily_returns(closes)
+
+    result = correlation_matrix(returns, min_periods=30)
+
+    expected = pd.DataFrame(returns).corr(min_periods=30).to_numpy()
+    np.testing.assert_allclose(result, expected, equal_nan=True, atol=1e-12)
+
+def test_listing_without_prices_yields_missing_values():
+    closes = np.array([[1.0, np.nan], [2.0, np.nan], [3.0, np.nan]])
+
+    assert np.isnan(forward_fill(closes)[:, 1]).all()
+    assert np.isnan(correlation_matrix(daily_returns(closes), min_periods=2)[1]).all()
+    assert drawdowns(closes).peak_rows[1] == -1
@@ -0,0 +1,116 @@
+import threading
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.domain.listing import Listing
+from core.interfaces.market_data import MarketDataBar, PriceHistoryProvider
+from core.services.price_ingestion_service import PriceIngestionService
+from infrastructure.services.market_data_service import YFinanceMarketDataProvider
+
+def _listing(listing_id, ticker, exchange_id=1):
+    return Listing(id=listing_id, asset_id=listing_id, exchange_id=exchange_id, ticker=ticker, currency="USD")
+
+def _history(days, low=99.0):
+    start = date(2024, 1, 1)
+    return [MarketDataBar(date=start + timedelta(days=i), open=100, high=101, low=low, close=100.5, volume=10) for i in range(days)]
+
+class FakeHistoryProvider(PriceHistoryProvider):
+    def __init__(self):
+        self.calls = []
+
+    def get_price_history(self, tickers, start, end):
+        self.calls.append(list(tickers))
+        if "BOOM" in tickers:
+            raise RuntimeError("connection reset")
+        return {t: [] if t == "NEW" else _history(3, low=200.0 if t == "BAD" else 99.0) for t in tickers}
+
+@pytest.fixture
+def price_repo():
+    repo = MagicMock()
+    repo.loaded = []
+    repo.ensure_partitions.return_value = []
+    # Consume the generator the way COPY would
+    repo.bulk_load.side_effect = lambda bars: repo.loaded.append(list(bars)) or len(repo.loaded[-1])
+    return repo
+
+def test_ingest_loads_one_batch_per_download(price_repo):
+    provider = FakeHistoryProvider()
+    listings = [_listing(i + 1, f"T{i}") for i in range(5)]
+    service = PriceIngestionService(price_repo, provider, batch_size=2)
+
+    summary = service.ingest(listings, date(2024, 1, 1), date(2024, 1, 3))
+
+    price_repo.ensure_partitions.assert_called_once_with(date(2024, 1, 1), date(2024, 1, 3))
+    assert provider.calls == [["T0", "T1"], ["T2", "T3"], ["T4"]]
+    assert [len(batch) for batch in price_repo.loaded] == [6, 6, 3]
+    assert {b.listing_id for b in price_repo.loaded[0]} == {1, 2}
+    assert (summary.requested, summary.downloaded, summary.written) == (5, 15, 15)
+
+def test_ingest_reports_failures_per_ticker(price_repo):
+    listings = [
+        _listing(1, "AAPL"), _listing(2, "NEW"), _listing(3, "BAD"),
+        _listing(4, "DUP", exchange_id=1), _listing(5, "DUP", exchange_id=2),
+        _listing(6, "BOOM"),
+    ]
+    service = PriceIngestionService(price_repo, FakeHistoryProvider(), batch_size=3)
+
+    summary = service.ingest(listings, date(2024, 1, 1), date(2024, 1, 3))
+
+    assert summary.empty == ["NEW"]
+    assert summary.invalid == 3
+    assert summary.failed["DUP"] == "Ambiguous ticker: 2 listings"
+    assert summary.failed["BOOM"].startswith("Download failed")
+    assert summary.written == 3
+
+def test_next_batch_downloads_while_current_one_loads(price_repo):
+    provider = FakeHistoryProvider()
+    second_download_started = threading.Event()
+    original = provider.get_price_history
+
+    def get_price_history(tickers, start, end):
+        if tickers == ["T1"]:
+            second_download_started.set()
+        return original(tickers, start, end)
+
+    provider.get_price_history = get_price_history
+
+    def bulk_load(bars):
+        bars = list(bars)
+        if bars[0].listing_id == 1:
+            assert second_download_started.wait(1)
+        return len(bars)
+
+    price_repo.bulk_load.side_effect = bulk_load
+    service = PriceIngestionService(price_repo, provider, batch_size=1)
+
+    assert service.ingest([_listing(1, "T0"), _listing(2, "T1")], date(2024, 1, 1), date(2024, 1, 3)).written == 6
+
+def test_yfinance_history_frame_is_converted_per_ticker():
+    index = pd.DatetimeIndex(["2024-01-02", "2024-01-03", "2024-01-04"])
+    columns = pd.MultiIndex.from_product([["AAPL", "GONE"], ["Open", "High", "Low", "Close", "Adj Close", "Volume"]])
+    values = np.array([
+        [10, 11, 9, 10.5, 10.4, 100, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan],
+        [np.nan] * 12,
+        [11, 12, 10, 11.5, 11.4, 200, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan],
+    ])
+    downloads = []
+
+    def download(tickers, start, end):
+        downloads.append(tickers)
+        return pd.DataFrame(values, index=index, columns=columns)
+
+    provider = YFinanceMarketDataProvider(history_downloader=download)
+
+    history = provider.get_price_history(["AAPL", "GONE", "AAPL"], date(2024, 1, 1), date(2024, 1, 4))
+
+    assert downloads == [["AAPL", "GONE"]]
+    assert history["GONE"] == []
+    assert [b.date for b in history["AAPL"]] == [date(2024, 1, 2), date(2024, 1, 4)]
+    assert history["AAPL"][1] == MarketDataBar(
+        date(2024, 1, 4), Decimal("11"), Decimal("12"), Decimal("10"), Decimal("11.5"), Decimal("11.4"), 200
+    )
@@ -0,0 +1,22 @@
+import pytest
+
+from infrastructure.services.sharded_sync import shard_tickers
+
+def test_shard_tickers_is_stable_and_deduplicated():
+    tickers = ["AAPL", "MSFT", "GOOGL", "AMZN", "AAPL", "NVDA", "TSLA"]
+
+    first = shard_tickers(tickers, 3)
+    second = shard_tickers(list(reversed(tickers)), 3)
+
+    assert len(first) == 3
+    assert sorted(t for shard in first for t in shard) == sorted(set(tickers))
+    # Same ticker, same shard, regardless of input order
+    for ticker in set(tickers):
+        assert [ticker in s for s in first] == [ticker in s for s in second]
+
+def test_single_shard_keeps_order():
+    assert shard_tickers(["B", "A", "C"], 1) == [["B", "A", "C"]]
+
+def test_shard_tickers_rejects_zero_shards():
+    with pytest.raises(ValueError):
+        shard_tickers(["AAPL"], 0)
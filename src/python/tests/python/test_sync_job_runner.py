@@ -0,0 +1,125 @@
+import asyncio
+from typing import Dict, List, Optional
+
+import pytest
+from unittest.mock import MagicMock
+
+from core.domain.enums import SyncItemStatus
+from core.domain.sync_job import SyncJob, SyncJobItem
+from core.interfaces.market_data import AsyncMarketDataProvider, MarketDataAsset
+from core.services.sync_job_runner import AsyncSyncJobRunner, SyncJobRunner
+from core.services.sync_summary import SyncSummary
+
+def make_job(tickers, done=()):
+    return SyncJob(
+        id=1,
+        tickers=tickers,
+        attempts=1,
+        items=[
+            SyncJobItem(t, SyncItemStatus.SYNCED if t in done else SyncItemStatus.PENDING)
+            for t in tickers
+        ]
+    )
+
+class FakeAsyncProvider(AsyncMarketDataProvider):
+    async def aget_asset_details(self, ticker: str) -> Optional[MarketDataAsset]:
+        await asyncio.sleep(0)
+        if ticker == "BOOM":
+            raise RuntimeError("connection reset")
+        return MarketDataAsset(ticker=ticker, name=f"{ticker} Corp", currency="USD", asset_class="EQUITY")
+
+    async def aget_assets_bulk(self, tickers: List[str]) -> Dict[str, Optional[MarketDataAsset]]:
+        return {t: await self.aget_asset_details(t) for t in tickers}
+
+@pytest.fixture
+def job_repo():
+    return MagicMock()
+
+@pytest.fixture
+def sync_service():
+    service = MagicMock()
+    service.sync_assets.side_effect = lambda tickers, **kwargs: SyncSummary(
+        requested=len(tickers), synced=len(tickers)
+    )
+    return service
+
+def test_run_next_returns_false_on_empty_queue(job_repo, sync_service):
+    job_repo.claim_next.return_value = None
+    runner = SyncJobRunner(job_repo, sync_service, "worker-1")
+
+    assert runner.run_next() is False
+    sync_service.sync_assets.assert_not_called()
+
+def test_run_next_processes_chunks_and_completes(job_repo, sync_service):
+    job_repo.claim_next.return_value = make_job(["A", "B", "C"])
+    runner = SyncJobRunner(job_repo, sync_service, "worker-1", chunk_size=2)
+
+    assert runner.run_next() is True
+
+    assert [c.args[0] for c in sync_service.sync_assets.call_args_list] == [["A", "B"], ["C"]]
+    assert job_repo.record_progress.call_count == 2
+    job_repo.complete.assert_called_once()
+    assert job_repo.complete.call_args.args[1]["synced"] == 3
+
+def test_retry_only_runs_pending_items(job_repo, sync_service):
+    job_repo.claim_next.return_value = make_job(["A", "B", "C"], done={"A", "B"})
+    runner = SyncJobRunner(job_repo, sync_service, "worker-1")
+
+    runner.run_next()
+
+    sync_service.sync_assets.assert_called_once()
+    assert sync_service.sync_assets.call_args.args[0] == ["C"]
+
+def test_item_outcomes_follow_summary(job_repo, sync_service):
+    sync_service.sync_assets.side_effect = None
+    sync_service.sync_assets.return_value = SyncSummary(
+        requested=3, synced=1,
+        skipped={"B": "Unknown exchange XXX"},
+        failed={"C": "DB down"}
+    )
+    job_repo.claim_next.return_value = make_job(["A", "B", "C"])
+    runner = SyncJobRunner(job_repo, sync_service, "worker-1")
+
+    runner.run_next()
+
+    items = job_repo.record_progress.call_args.args[1]
+    assert items["A"].status == SyncItemStatus.SYNCED
+    assert items["B"].status == SyncItemStatus.SKIPPED
+    assert items["C"].status == SyncItemStatus.FAILED
+    assert items["C"].message == "DB down"
+
+def test_job_marked_failed_when_sync_raises(job_repo, sync_service):
+    sync_service.sync_assets.side_effect = RuntimeError("provider down")
+    job_repo.claim_next.return_value = make_job(["A"])
+    runner = SyncJobRunner(job_repo, sync_service, "worker-1")
+
+    assert runner.run_next() is True
+
+    job_repo.fail.assert_called_once_with(1, "provider down")
+    job_repo.complete.assert_not_called()
+
+def test_async_runner_persists_chunks_through_the_async_engine(job_repo, sync_service):
+    sync_service.persist_market_data.side_effect = lambda batch, batch_size, existing=None: SyncSummary(
+        synced=sum(1 for d in batch.values() if d)
+    )
+    job_repo.claim_next.return_value = make_job(["A", "B", "C", "BOOM"], done={"C"})
+    runner = AsyncSyncJobRunner(job_repo, sync_service, FakeAsyncProvider(), "api-worker", chunk_size=2)
+
+    assert asyncio.run(runner.arun_next()) is True
+
+    sync_service.sync_assets.assert_not_called()
+    assert job_repo.record_progress.call_count == 2
+    items = job_repo.record_progress.call_args.args[1]
+    assert items["BOOM"].status == SyncItemStatus.FAILED
+    job_repo.complete.assert_called_once()
+    assert job_repo.complete.call_args.args[1]["synced"] == 2
+
+def test_async_runner_returns_false_on_empty_queue(job_repo, sync_service):
+    job_repo.claim_next.return_value = None
+    runner = AsyncSyncJobRunner(job_repo, sync_service, FakeAsyncProvider(), "api-worker")
+
+    assert asyncio.run(runner.arun_next()) is False
+
+def test_sync_job_requires_tickers():
+    with pytest.raises(ValueError):
+        SyncJob(tickers=[])
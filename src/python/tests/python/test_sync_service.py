@@ -3,9 +3,15 @@ from unittest.mock import MagicMock, patch
 from core.services.asset_sync_service import AssetSyncService
 from core.domain.asset import Asset
 from core.domain.exchange import Exchange
+from core.domain.exchange_mapping import ExchangeMapping
 from core.domain.listing import Listing
 from core.domain.enums import AssetClass
-from core.interfaces.market_data import MarketDataAsset
+from core.interfaces.market_data import MarketDataAsset, PartialFetchError
+
+YFINANCE_MAPPINGS = [
+    ExchangeMapping(provider="yfinance", kind="EXCHANGE_CODE", code="NMS", mic_code="XNAS"),
+    ExchangeMapping(provider="yfinance", kind="EXCHANGE_CODE", code="LSE", mic_code="XLON"),
+]
 
 @pytest.fixture
 def mock_asset_repo():
@@ -16,8 +22,9 @@ def mock_asset_repo():
 @pytest.fixture
 def mock_exchange_repo():
     repo = MagicMock()
-    # Simulate finding an exchange
-    repo.get_by_mic_code.return_value = Exchange(id=1, name="Test Exchange", mic_code="XNYS", currency="USD")
+    # Simulate the exchanges table
+    repo.list_all.return_value = [Exchange(id=1, name="Test Exchange", mic_code="XNYS", currency="USD")]
+    repo.list_mappings.return_value = YFINANCE_MAPPINGS
     return repo
 
 @pytest.fixture
@@ -27,6 +34,7 @@ def mock_listing_repo():
 @pytest.fixture
 def mock_market_data():
     provider = MagicMock()
+    provider.name = "yfinance"
     # Simulate returning data
     provider.get_assets_bulk.return_value = {
         "AAPL": MarketDataAsset(
@@ -45,8 +53,8 @@ def test_sync_assets(mock_asset_repo, mock_exchange_repo, mock_listing_repo, moc
     # Override the exchange mapping inside service for test if needed,
     # or ensure our mock returns what is needed.
     # In the code: 'NMS' -> 'XNAS'.
-    # We need to ensure mock_exchange_repo.get_by_mic_code("XNAS") returns something.
-    mock_exchange_repo.get_by_mic_code.side_effect = lambda mic: Exchange(id=1, name="Nasdaq", mic_code="XNAS", currency="USD") if mic == "XNAS" else None
+    # We need to ensure the exchanges table contains XNAS.
+    mock_exchange_repo.list_all.return_value = [Exchange(id=1, name="Nasdaq", mic_code="XNAS", currency="USD")]
 
     service.sync_assets(["AAPL"])
 
@@ -66,3 +74,183 @@ def test_seed_exchanges(mock_asset_repo, mock_exchange_repo, mock_listing_repo,
     service.seed_exchanges(exchanges)
 
     mock_exchange_repo.upsert.assert_called_once()
+
+def _market_asset(ticker, name="Apple Inc.", isin=None, exchange="NMS"):
+    return MarketDataAsset(
+        ticker=ticker,
+        name=name,
+        currency="USD",
+        asset_class="EQUITY",
+        isin=isin,
+        exchange_mic=exchange
+    )
+
+@pytest.fixture
+def batch_exchange_repo():
+    repo = MagicMock()
+    repo.list_all.return_value = [Exchange(id=1, name="Nasdaq", mic_code="XNAS", currency="USD")]
+    repo.list_mappings.return_value = YFINANCE_MAPPINGS
+    return repo
+
+def test_sync_assets_batched_writes_chunks(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data):
+    mock_asset_repo.upsert_many.side_effect = lambda assets: [
+        Asset(id=i + 1, name=a.name, asset_class=a.asset_class, isin=a.isin) for i, a in enumerate(assets)
+    ]
+    mock_market_data.get_assets_bulk.return_value = {
+        "AAPL": _market_asset("AAPL", isin="US0378331005"),
+        "MSFT": _market_asset("MSFT", name="Microsoft", isin="US5949181045"),
+        "NVDA": _market_asset("NVDA", name="NVIDIA", isin="US67066G1040"),
+    }
+    service = AssetSyncService(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data)
+
+    summary = service.sync_assets(["AAPL", "MSFT", "NVDA"], batch_size=2)
+
+    assert summary.synced == 3
+    assert mock_asset_repo.upsert_many.call_count == 2
+    assert mock_listing_repo.upsert_many.call_count == 2
+    mock_asset_repo.upsert.assert_not_called()
+    first_listings = mock_listing_repo.upsert_many.call_args_list[0][0][0]
+    assert [(l.ticker, l.asset_id) for l in first_listings] == [("AAPL", 1), ("MSFT", 2)]
+
+def test_sync_assets_batched_reports_invalid_rows_per_ticker(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data):
+    mock_asset_repo.upsert_many.side_effect = lambda assets: [
+        Asset(id=1, name=a.name, asset_class=a.asset_class) for a in assets
+    ]
+    mock_market_data.get_assets_bulk.return_value = {
+        "AAPL": _market_asset("AAPL"),
+        "BAD": _market_asset("BAD", name=""),
+        "LSE1": _market_asset("LSE1", exchange="XXXX"),
+        "GONE": None,
+    }
+    service = AssetSyncService(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data)
+
+    summary = service.sync_assets(["AAPL", "BAD", "LSE1", "GONE"], batch_size=10)
+
+    assert summary.synced == 1
+    assert set(summary.failed) == {"BAD"}
+    assert set(summary.skipped) == {"LSE1", "GONE"}
+    written = mock_asset_repo.upsert_many.call_args[0][0]
+    assert [a.name for a in written] == ["Apple Inc."]
+
+def test_sync_assets_batched_falls_back_to_rows_on_db_error(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data):
+    mock_asset_repo.upsert_many.side_effect = RuntimeError("check constraint violated")
+
+    def upsert(asset):
+        if asset.name == "Broken":
+            raise RuntimeError("check constraint violated")
+        return Asset(id=1, name=asset.name, asset_class=asset.asset_class)
+
+    mock_asset_repo.upsert.side_effect = upsert
+    mock_market_data.get_assets_bulk.return_value = {
+        "AAPL": _market_asset("AAPL"),
+        "BRKN": _market_asset("BRKN", name="Broken"),
+    }
+    service = AssetSyncService(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data)
+
+    summary = service.sync_assets(["AAPL", "BRKN"], batch_size=10)
+
+    assert summary.synced == 1
+    assert set(summary.failed) == {"BRKN"}
+    mock_listing_repo.upsert.assert_called_once()
+
+def test_sync_assets_loads_exchanges_once_and_counts_unknown_codes(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data):
+    mock_market_data.get_assets_bulk.return_value = {
+        "AAPL": _market_asset("AAPL"),
+        "MSFT": _market_asset("MSFT", exchange="XNAS"),
+        "VOD.L": _market_asset("VOD.L", exchange="LSE"),
+        "AZN.L": _market_asset("AZN.L", exchange="LSE"),
+    }
+    service = AssetSyncService(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data)
+
+    summary = service.sync_assets(["AAPL", "MSFT", "VOD.L", "AZN.L"])
+
+    assert summary.synced == 2
+    assert summary.unknown_exchanges == {"LSE": 2}
+    assert set(summary.skipped) == {"VOD.L", "AZN.L"}
+    batch_exchange_repo.list_all.assert_called_once()
+    batch_exchange_repo.get_by_mic_code.assert_not_called()
+
+def test_seed_exchanges_refreshes_exchange_index(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data):
+    mock_market_data.get_assets_bulk.return_value = {"VOD.L": _market_asset("VOD.L", exchange="LSE")}
+    service = AssetSyncService(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data)
+    assert service.sync_assets(["VOD.L"]).synced == 0
+
+    batch_exchange_repo.list_all.return_value = [
+        Exchange(id=1, name="Nasdaq", mic_code="XNAS", currency="USD"),
+        Exchange(id=2, name="London Stock Exchange", mic_code="XLON", currency="GBP"),
+    ]
+    # Seeding through another service instance must still reach this one's index
+    other = AssetSyncService(mock_asset_repo, MagicMock(), mock_listing_repo, mock_market_data)
+    other.seed_exchanges([{"name": "London Stock Exchange", "mic_code": "XLON", "currency": "GBP"}])
+
+    summary = service.sync_assets(["VOD.L"])
+    assert summary.synced == 1
+    assert mock_listing_repo.upsert.call_args[0][0].exchange_id == 2
+
+def test_incremental_sync_skips_fresh_and_unchanged_tickers(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data):
+    from datetime import datetime, timedelta, timezone
+
+    now = datetime.now(timezone.utc)
+    unchanged = _market_asset("MSFT", name="Microsoft")
+    changed = _market_asset("NVDA", name="NVIDIA Corp")
+    mock_listing_repo.get_by_tickers.return_value = [
+        Listing(id=10, asset_id=1, exchange_id=1, ticker="AAPL", currency="USD", synced_at=now - timedelta(minutes=5)),
+        Listing(id=11, asset_id=2, exchange_id=1, ticker="MSFT", currency="USD",
+                content_hash=unchanged.content_hash(), synced_at=now - timedelta(days=2)),
+        Listing(id=12, asset_id=3, exchange_id=1, ticker="NVDA", currency="USD",
+                content_hash="stale-hash", synced_at=now - timedelta(days=2)),
+    ]
+    mock_market_data.get_assets_bulk.return_value = {
+        "MSFT": unchanged,
+        "NVDA": changed,
+        "AMD": _market_asset("AMD", name="AMD"),
+    }
+    service = AssetSyncService(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data)
+
+    summary = service.sync_assets(
+        ["AAPL", "MSFT", "NVDA", "AMD"], incremental=True, fresh_within=timedelta(hours=1)
+    )
+
+    mock_market_data.get_assets_bulk.assert_called_once_with(["MSFT", "NVDA", "AMD"])
+    assert (summary.fresh, summary.fetched, summary.unchanged, summary.updated, summary.inserted) == (1, 3, 1, 1, 1)
+    mock_listing_repo.mark_synced.assert_called_once_with([11])
+    written = [c[0][0].ticker for c in mock_listing_repo.upsert.call_args_list]
+    assert written == ["NVDA", "AMD"]
+    assert mock_listing_repo.upsert.call_args[0][0].content_hash == _market_asset("AMD", name="AMD").content_hash()
+
+def test_sync_assets_resolves_ticker_suffix_and_counts_misses(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data):
+    batch_exchange_repo.list_all.return_value = [
+        Exchange(id=1, name="Nasdaq", mic_code="XNAS", currency="USD"),
+        Exchange(id=2, name="London Stock Exchange", mic_code="XLON", currency="GBP"),
+    ]
+    batch_exchange_repo.list_mappings.return_value = YFINANCE_MAPPINGS + [
+        ExchangeMapping(provider="yfinance", kind="TICKER_SUFFIX", code=".L", mic_code="XLON"),
+    ]
+    mock_market_data.get_assets_bulk.return_value = {
+        "AZN.L": _market_asset("AZN.L", exchange="IOB"),
+        "SAP.DE": _market_asset("SAP.DE", exchange="GER"),
+    }
+    service = AssetSyncService(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data)
+
+    summary = service.sync_assets(["AZN.L", "SAP.DE"])
+
+    batch_exchange_repo.list_mappings.assert_called_once_with("yfinance")
+    assert summary.synced == 1
+    assert mock_listing_repo.upsert.call_args[0][0].exchange_id == 2
+    assert summary.unknown_exchanges == {"GER": 1}
+
+def test_sync_assets_reports_throttled_tickers_as_failed(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data):
+    mock_asset_repo.upsert_many.side_effect = lambda assets: [
+        Asset(id=1, name=a.name, asset_class=a.asset_class) for a in assets
+    ]
+    mock_market_data.get_assets_bulk.side_effect = PartialFetchError(
+        {"AAPL": _market_asset("AAPL"), "GONE": None},
+        {"MSFT": "yfinance throttled 4 times"}
+    )
+    service = AssetSyncService(mock_asset_repo, batch_exchange_repo, mock_listing_repo, mock_market_data)
+
+    summary = service.sync_assets(["AAPL", "MSFT", "GONE"], batch_size=10)
+
+    assert summary.synced == 1
+    assert summary.failed == {"MSFT": "Fetch failed: yfinance throttled 4 times"}
+    assert set(summary.skipped) == {"GONE"}
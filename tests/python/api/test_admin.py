@@ -0,0 +1,115 @@
+from infrastructure.repositories.sync_job_repository import SqlAlchemySyncJobRepository
+from core.domain.enums import SyncItemStatus
+from core.domain.sync_job import SyncJobItem
+
+def test_trigger_sync_enqueues_job(client):
+    response = client.post("/admin/sync", json={"tickers": ["AAPL", "MSFT", "AAPL"], "incremental": True})
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    response = client.get(f"/admin/sync/{job_id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "PENDING"
+    assert data["incremental"] is True
+    assert data["progress"]["PENDING"] == 2
+    assert sorted(i["ticker"] for i in data["items"]) == ["AAPL", "MSFT"]
+
+def test_trigger_sync_rejects_empty_tickers(client):
+    response = client.post("/admin/sync", json={"tickers": []})
+    assert response.status_code == 400
+
+def test_sync_job_reports_progress(client, api_sessions):
+    job_id = client.post("/admin/sync", json={"tickers": ["AAPL", "MSFT"]}).json()["job_id"]
+
+    session = api_sessions()
+    try:
+        SqlAlchemySyncJobRepository(session).record_progress(job_id, {
+            "AAPL": SyncJobItem("AAPL", SyncItemStatus.SYNCED),
+            "MSFT": SyncJobItem("MSFT", SyncItemStatus.FAILED, "Provider timeout"),
+        })
+    finally:
+        session.close()
+
+    data = client.get(f"/admin/sync/{job_id}").json()
+    assert data["progress"]["SYNCED"] == 1
+    assert data["progress"]["FAILED"] == 1
+    failed = next(i for i in data["items"] if i["ticker"] == "MSFT")
+    assert failed["message"] == "Provider timeout"
+
+def test_unknown_sync_job_returns_404(client):
+    response = client.get("/admin/sync/999")
+    assert response.status_code == 404
+
+def test_overlapping_sync_requests_are_coalesced(client):
+    first = client.post("/admin/sync", json={"tickers": ["AAPL", "MSFT"]}).json()
+    assert (first["scheduled"], first["coalesced"]) == (2, 0)
+
+    second = client.post("/admin/sync", json={"tickers": ["MSFT", "NVDA", "NVDA", "AAPL"]}).json()
+    assert (second["scheduled"], second["coalesced"]) == (1, 3)
+    assert second["coalesced_into"] == [first["job_id"]]
+    items = client.get(f"/admin/sync/{second['job_id']}").json()["items"]
+    assert [i["ticker"] for i in items] == ["NVDA"]
+
+    third = client.post("/admin/sync", json={"tickers": ["NVDA"]}).json()
+    assert third["job_id"] is None
+    assert (third["scheduled"], third["coalesced"]) == (0, 1)
+    assert third["coalesced_into"] == [second["job_id"]]
+
+def test_finished_tickers_can_be_scheduled_again(client, api_sessions):
+    job_id = client.post("/admin/sync", json={"tickers": ["AAPL", "MSFT"]}).json()["job_id"]
+    session = api_sessions()
+    try:
+        repository = SqlAlchemySyncJobRepository(session)
+        repository.record_progress(job_id, {"AAPL": SyncJobItem("AAPL", SyncItemStatus.SYNCED)})
+        repository.fail(job_id, "Worker crashed")
+    finally:
+        session.close()
+
+    data = client.get(f"/admin/sync/{job_id}").json()
+    msft = next(i for i in data["items"] if i["ticker"] == "MSFT")
+    assert (msft["status"], msft["message"]) == ("FAILED", "Worker crashed")
+
+    response = client.post("/admin/sync", json={"tickers": ["AAPL", "MSFT"]}).json()
+    assert (response["scheduled"], response["coalesced"]) == (2, 0)
+
+def test_tickers_pending_under_weaker_options_are_rescheduled(client):
+    first = client.post("/admin/sync", json={"tickers": ["AAPL", "MSFT"], "incremental": True, "fresh_within_minutes": 60}).json()
+
+    # An equal or narrower freshness window is already covered
+    same = client.post("/admin/sync", json={"tickers": ["AAPL"], "incremental": True, "fresh_within_minutes": 120}).json()
+    assert (same["scheduled"], same["coalesced"]) == (0, 1)
+
+    # A full refresh would fetch tickers the pending incremental job skips
+    full = client.post("/admin/sync", json={"tickers": ["AAPL"], "incremental": False}).json()
+    assert (full["scheduled"], full["coalesced"]) == (1, 0)
+
+    items = {i["ticker"]: i for i in client.get(f"/admin/sync/{first['job_id']}").json()["items"]}
+    assert items["AAPL"]["status"] == "SKIPPED"
+    assert items["AAPL"]["message"].startswith(f"Superseded by sync job {full['job_id']}")
+    assert items["MSFT"]["status"] == "PENDING"
+
+    # ...and then covers any later request for it
+    later = client.post("/admin/sync", json={"tickers": ["AAPL"], "incremental": True, "fresh_within_minutes": 1}).json()
+    assert later["coalesced_into"] == [full["job_id"]]
+
+def test_running_jobs_keep_their_tickers(client, api_sessions):
+    first = client.post("/admin/sync", json={"tickers": ["AAPL"], "incremental": True}).json()
+    session = api_sessions()
+    try:
+        SqlAlchemySyncJobRepository(session).claim_next("worker-1")
+    finally:
+        session.close()
+
+    # The worker may already be syncing AAPL, so the fuller request waits on it
+    full = client.post("/admin/sync", json={"tickers": ["AAPL"], "incremental": False}).json()
+    assert full["job_id"] is None
+    assert full["coalesced_into"] == [first["job_id"]]
+
+    items = client.get(f"/admin/sync/{first['job_id']}").json()["items"]
+    assert items[0]["status"] == "PENDING"
+
+def test_trigger_sync_rejects_tickers_the_queue_cannot_store(client):
+    for ticker in ["", "X" * 21]:
+        response = client.post("/admin/sync", json={"tickers": ["AAPL", ticker]})
+        assert response.status_code == 422
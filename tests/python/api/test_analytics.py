@@ -0,0 +1,87 @@
+from datetime import date, timedelta
+
+import pytest
+
+from infrastructure.database.models import AssetModel, ExchangeModel, ListingModel, ListingPriceModel
+from core.domain.enums import AssetClass
+
+START = date(2024, 1, 1)
+# Listing 1 doubles then halves; listing 2 moves in lockstep; listing 3 mirrors them
+CLOSES = {
+    1: [100, 110, 121, 110, 100, 90],
+    2: [50, 55, 60.5, 55, 50, 45],
+    3: [100, 90, 81, 90, 100, 110],
+}
+
+@pytest.fixture(autouse=True)
+def prices(api_sessions):
+    session = api_sessions()
+    session.add(ExchangeModel(id=1, name="NASDAQ", mic_code="XNAS", currency="USD"))
+    for listing_id, closes in CLOSES.items():
+        session.add(AssetModel(id=listing_id, name=f"Asset {listing_id}", asset_class=AssetClass.EQUITY))
+        session.add(ListingModel(id=listing_id, asset_id=listing_id, exchange_id=1, ticker=f"T{listing_id}", currency="USD"))
+        for i, close in enumerate(closes):
+            # Listing 3 skips the second day, as if its venue were closed
+            if listing_id == 3 and i == 1:
+                continue
+            session.add(ListingPriceModel(
+                listing_id=listing_id, date=START + timedelta(days=i),
+                open=close, high=close, low=close, close=close
+            ))
+    session.commit()
+    session.close()
+
+def _query(*listing_ids, **params):
+    query = "&".join(f"listing_ids={i}" for i in listing_ids)
+    params.setdefault("start", "2024-01-01")
+    params.setdefault("end", "2024-01-31")
+    return query + "".join(f"&{k}={v}" for k, v in params.items())
+
+def test_returns_measure_each_listing_from_its_own_previous_close(client):
+    response = client.get(f"/analytics/returns?{_query(1, 3)}")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["dates"][0] == "2024-01-02"
+    first, third = data["series"]
+    assert first["returns"][:2] == pytest.approx([0.1, 0.1])
+    assert first["total_return"] == pytest.approx(-0.1)
+    # No bar on Jan 2, so Jan 3 is measured against Jan 1
+    assert third["returns"][0] is None
+    assert third["returns"][1] == pytest.approx(-0.19)
+
+def test_drawdowns_report_depth_and_dates(client):
+    data = client.get(f"/analytics/drawdowns?{_query(1)}").json()
+
+    [series] = data["series"]
+    assert series["max_drawdown"] == pytest.approx(90 / 121 - 1)
+    assert (series["peak_date"], series["trough_date"]) == ("2024-01-03", "2024-01-06")
+    assert series["drawdown"][:3] == [0.0, 0.0, 0.0]
+
+def test_correlation_matrix(client):
+    data = client.get(f"/analytics/correlation?{_query(1, 2, 3, min_periods=3)}").json()
+
+    assert data["listing_ids"] == [1, 2, 3]
+    matrix = data["matrix"]
+    assert matrix[0][0] == pytest.approx(1.0)
+    assert matrix[0][1] == pytest.approx(1.0)
+    assert matrix[0][2] < -0.9
+    assert matrix[2][0] == pytest.approx(matrix[0][2])
+
+def test_volatility_needs_enough_returns_in_the_window(client):
+    data = client.get(f"/analytics/volatility?{_query(1, window=3)}").json()
+
+    [series] = data["series"]
+    assert series["volatility"][:1] == [None]
+    assert series["volatility"][2] > 0
+
+def test_unknown_listings_are_reported(client):
+    response = client.get(f"/analytics/returns?{_query(1, 42, 43)}")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Listings not found: [42, 43]"
+
+def test_start_after_end_is_rejected(client):
+    response = client.get(f"/analytics/correlation?{_query(1, start='2024-02-01', end='2024-01-01')}")
+
+    assert response.status_code == 400
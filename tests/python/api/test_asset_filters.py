@@ -0,0 +1,53 @@
+import pytest
+
+from api.pagination import encode_cursor
+from infrastructure.database.models import AssetModel, ExchangeModel, ListingModel
+from core.domain.enums import AssetClass
+
+@pytest.fixture(autouse=True)
+def catalog(api_sessions):
+    session = api_sessions()
+    session.add_all([
+        ExchangeModel(id=1, name="NASDAQ", mic_code="XNAS", currency="USD"),
+        ExchangeModel(id=2, name="Xetra", mic_code="XETR", currency="EUR"),
+        AssetModel(id=1, name="Apple Inc.", asset_class=AssetClass.EQUITY),
+        AssetModel(id=2, name="Applied Materials Inc.", asset_class=AssetClass.EQUITY),
+        AssetModel(id=3, name="Apple Bond 2030", asset_class=AssetClass.FIXED_INCOME),
+        AssetModel(id=4, name="Microsoft Corporation", asset_class=AssetClass.EQUITY, is_active=False),
+        ListingModel(id=1, asset_id=1, exchange_id=1, ticker="AAPL", currency="USD"),
+        ListingModel(id=2, asset_id=1, exchange_id=2, ticker="APC", currency="EUR"),
+        ListingModel(id=3, asset_id=2, exchange_id=1, ticker="AMAT", currency="USD"),
+        ListingModel(id=4, asset_id=3, exchange_id=2, ticker="APLB", currency="EUR"),
+        ListingModel(id=5, asset_id=4, exchange_id=1, ticker="MSFT", currency="USD"),
+    ])
+    session.commit()
+    session.close()
+
+def _ids(response):
+    assert response.status_code == 200
+    return [a["id"] for a in response.json()["items"]]
+
+def test_list_filters_combine(client):
+    assert _ids(client.get("/assets/?asset_class=EQUITY")) == [1, 2, 4]
+    assert _ids(client.get("/assets/?asset_class=EQUITY&is_active=true")) == [1, 2]
+    assert _ids(client.get("/assets/?mic_code=XETR")) == [1, 3]
+    assert _ids(client.get("/assets/?mic_code=XNAS&currency=USD&asset_class=EQUITY&limit=2")) == [1, 2]
+    assert client.get("/assets/?asset_class=STOCK").status_code == 422
+
+def test_search_ranks_exact_tickers_first_and_pages(client):
+    first = client.get("/assets/search?q=aapl").json()
+    assert [(a["id"], a["score"]) for a in first["items"]] == [(1, 1.0)]
+
+    response = client.get("/assets/search?q=appl&limit=2")
+    page = response.json()
+    assert _ids(response) == [1, 2]
+    rest = client.get(f"/assets/search?q=appl&limit=2&cursor={page['next_cursor']}")
+    assert _ids(rest) == [3]
+    assert rest.json()["next_cursor"] is None
+
+def test_search_applies_filters(client):
+    assert _ids(client.get("/assets/search?q=apple&asset_class=FIXED_INCOME")) == [3]
+
+def test_search_rejects_a_list_cursor_and_short_queries(client):
+    assert client.get(f"/assets/search?q=apple&cursor={encode_cursor(1)}").status_code == 400
+    assert client.get("/assets/search?q=a").status_code == 422
@@ -92,4 +92,47 @@ def test_list_assets():
     response = client.get("/assets/")
     assert response.status_code == 200
     data = response.json()
-    assert len(data) >= 2
+    assert len(data["items"]) >= 2
+    assert data["next_cursor"] is None
+
+def test_list_assets_pages_through_every_asset():
+    for i in range(5):
+        client.post("/assets/", json={"name": f"Page Asset {i}", "asset_class": "EQUITY"})
+    expected = [a["id"] for a in client.get("/assets/?limit=1000").json()["items"]]
+
+    seen, cursor = [], None
+    while True:
+        response = client.get("/assets/?limit=2" + (f"&cursor={cursor}" if cursor else ""))
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) <= 2
+        seen.extend(a["id"] for a in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == expected == sorted(expected)
+
+def test_list_assets_rejects_bad_cursor_and_limit():
+    assert client.get("/assets/?cursor=not-a-cursor").status_code == 400
+    assert client.get("/assets/?limit=0").status_code == 422
+    assert client.get("/assets/?limit=1001").status_code == 422
+
+def test_batch_get_assets_reports_missing_ids():
+    ids = [client.post("/assets/", json={"name": f"Batch Asset {i}", "asset_class": "EQUITY"}).json()["id"] for i in range(3)]
+
+    response = client.post("/assets/batch-get", json={"ids": [ids[2], 999_999, ids[0], ids[2]]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [a["id"] for a in data["items"]] == [ids[2], ids[0]]
+    assert data["items"][1]["name"] == "Batch Asset 0"
+    assert data["missing"] == [999_999]
+
+def test_batch_get_assets_limits_the_number_of_ids():
+    assert client.post("/assets/batch-get", json={"ids": []}).status_code == 422
+    assert client.post("/assets/batch-get", json={"ids": list(range(1, 5002))}).status_code == 422
+
+def test_batch_get_assets_rejects_ids_outside_the_integer_range():
+    assert client.post("/assets/batch-get", json={"ids": [1, 3_000_000_000]}).status_code == 422
+    assert client.post("/assets/batch-get", json={"ids": [0]}).status_code == 422
@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+
+import pytest
+
+from api.routers import exports
+from infrastructure.database.models import AssetModel, ExchangeModel, ListingModel
+from core.domain.enums import AssetClass
+
+@pytest.fixture(autouse=True)
+def catalog(api_sessions, monkeypatch):
+    session = api_sessions()
+    session.add_all([
+        ExchangeModel(id=1, name="NASDAQ", mic_code="XNAS", currency="USD"),
+        ExchangeModel(id=2, name="London Stock Exchange", mic_code="XLON", currency="GBP"),
+        AssetModel(id=1, name="Apple Inc.", asset_class=AssetClass.EQUITY, isin="US0378331005"),
+        AssetModel(id=2, name="Gilt, \"2030\"", asset_class=AssetClass.FIXED_INCOME),
+        ListingModel(id=1, asset_id=1, exchange_id=1, ticker="AAPL", currency="USD"),
+        ListingModel(id=2, asset_id=1, exchange_id=2, ticker="0R2V", currency="GBP", is_active=False),
+        ListingModel(id=3, asset_id=2, exchange_id=2, ticker="TN30", currency="GBP"),
+    ])
+    session.commit()
+    session.close()
+
+    # Small enough that three listings span several chunks
+    monkeypatch.setattr(exports, "EXPORT_BATCH_SIZE", 2)
+
+def test_ndjson_export_has_one_object_per_listing(client):
+    response = client.get("/exports/catalog")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["listing_id"] for r in rows] == [1, 2, 3]
+    assert rows[1] == {
+        "listing_id": 2, "ticker": "0R2V", "currency": "GBP", "listing_is_active": False,
+        "asset_id": 1, "asset_name": "Apple Inc.", "asset_class": "EQUITY", "isin": "US0378331005",
+        "asset_is_active": True, "exchange_id": 2, "mic_code": "XLON", "exchange_name": "London Stock Exchange",
+    }
+
+def test_csv_export_has_header_and_quotes_values(client):
+    response = client.get("/exports/catalog?format=csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="catalog.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [r["ticker"] for r in rows] == ["AAPL", "0R2V", "TN30"]
+    assert rows[2]["asset_name"] == 'Gilt, "2030"'
+    assert rows[2]["isin"] == ""
+
+def test_unknown_format_is_rejected(client):
+    assert client.get("/exports/catalog?format=xml").status_code == 422
@@ -0,0 +1,100 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from infrastructure.database.models import AssetModel, ExchangeModel, ListingLatestPriceModel, ListingModel
+from core.domain.enums import AssetClass
+
+@pytest.fixture(autouse=True)
+def catalog(api_sessions):
+    session = api_sessions()
+    session.add_all([
+        ExchangeModel(id=1, name="NASDAQ", mic_code="XNAS", currency="USD"),
+        AssetModel(id=1, name="Apple Inc.", asset_class=AssetClass.EQUITY),
+        ListingModel(id=1, asset_id=1, exchange_id=1, ticker="AAPL", currency="USD"),
+        ListingModel(id=2, asset_id=1, exchange_id=1, ticker="AAPL.W", currency="USD"),
+        ListingLatestPriceModel(listing_id=1, date=date(2024, 6, 28), close=Decimal("210.62")),
+    ])
+    session.commit()
+    session.close()
+
+def test_read_listing_includes_last_price(client):
+    data = client.get("/listings/1").json()
+
+    assert (Decimal(data["last_price"]), data["last_price_date"]) == (Decimal("210.62"), "2024-06-28")
+
+def test_listing_without_prices_has_no_last_price(client):
+    listings = {l["id"]: l for l in client.get("/listings/asset/1").json()}
+
+    assert listings[2]["last_price"] is None and listings[2]["last_price_date"] is None
+    assert Decimal(listings[1]["last_price"]) == Decimal("210.62")
+
+def test_list_listings_is_paginated(client):
+    first = client.get("/listings/?limit=1").json()
+    assert [l["id"] for l in first["items"]] == [1]
+    assert Decimal(first["items"][0]["last_price"]) == Decimal("210.62")
+
+    second = client.get(f"/listings/?limit=1&cursor={first['next_cursor']}").json()
+    assert [l["id"] for l in second["items"]] == [2]
+    assert second["next_cursor"] is None
+
+def test_resolve_ticker_to_listing_and_asset(client):
+    response = client.get("/listings/resolve?ticker=AAPL")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["listing_id"], data["mic_code"], data["currency"]) == (1, "XNAS", "USD")
+    assert (data["asset"]["id"], data["asset"]["name"]) == (1, "Apple Inc.")
+
+def test_resolve_needs_mic_for_a_ticker_on_several_exchanges(client, api_sessions):
+    session = api_sessions()
+    session.add_all([
+        ExchangeModel(id=2, name="Xetra", mic_code="XETR", currency="EUR"),
+        AssetModel(id=2, name="SAP SE", asset_class=AssetClass.EQUITY),
+        ListingModel(id=3, asset_id=2, exchange_id=2, ticker="SAP", currency="EUR"),
+        ListingModel(id=4, asset_id=2, exchange_id=1, ticker="SAP", currency="USD"),
+    ])
+    session.commit()
+    session.close()
+
+    response = client.get("/listings/resolve?ticker=SAP")
+    assert response.status_code == 409
+    assert "XETR" in response.json()["detail"]
+
+    assert client.get("/listings/resolve?ticker=SAP&mic=XETR").json()["listing_id"] == 3
+    assert client.get("/listings/resolve?ticker=SAP&mic=XLON").status_code == 404
+    assert client.get("/listings/resolve?ticker=NOPE").status_code == 404
+
+def test_resolve_cache_hit_does_not_query_the_database(client, api_engine):
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    client.get("/listings/resolve?ticker=AAPL&mic=XNAS")
+    event.listen(api_engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/listings/resolve?ticker=AAPL&mic=XNAS")
+    finally:
+        event.remove(api_engine, "before_cursor_execute", record)
+
+    assert response.json()["listing_id"] == 1
+    assert statements == []
+
+def test_creating_a_listing_invalidates_its_resolution(client):
+    assert client.get("/listings/resolve?ticker=MSFT").status_code == 404
+
+    client.post("/listings/", json={"asset_id": 1, "exchange_id": 1, "ticker": "MSFT", "currency": "USD"})
+
+    assert client.get("/listings/resolve?ticker=MSFT").json()["mic_code"] == "XNAS"
+
+def test_batch_get_listings_and_exchanges(client):
+    listings = client.post("/listings/batch-get", json={"ids": [2, 1, 3]}).json()
+    assert [l["id"] for l in listings["items"]] == [2, 1]
+    assert Decimal(listings["items"][1]["last_price"]) == Decimal("210.62")
+    assert listings["missing"] == [3]
+
+    exchanges = client.post("/exchanges/batch-get", json={"ids": [1, 2]}).json()
+    assert [e["mic_code"] for e in exchanges["items"]] == ["XNAS"]
+    assert exchanges["missing"] == [2]
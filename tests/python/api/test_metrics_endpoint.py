@@ -0,0 +1,20 @@
+from fastapi.testclient import TestClient
+
+from api.main import app
+
+client = TestClient(app)
+
+def test_metrics_expose_request_latency_by_route():
+    assert client.get("/health").status_code == 200
+    assert client.get("/no-such-route/123").status_code == 404
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in body
+    assert 'route="<unmatched>",status="404"' in body
+    assert "/no-such-route/123" not in body
+    assert "# TYPE sync_stage_duration_seconds histogram" in body
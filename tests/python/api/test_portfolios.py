@@ -0,0 +1,86 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from infrastructure.database.models import AssetModel, ExchangeModel, ListingLatestPriceModel, ListingModel
+from core.domain.enums import AssetClass
+
+@pytest.fixture(autouse=True)
+def catalog(api_sessions):
+    session = api_sessions()
+    session.add_all([
+        ExchangeModel(id=1, name="NASDAQ", mic_code="XNAS", currency="USD"),
+        ExchangeModel(id=2, name="London Stock Exchange", mic_code="XLON", currency="GBP"),
+        AssetModel(id=1, name="Stock Corp", asset_class=AssetClass.EQUITY),
+        AssetModel(id=2, name="Bond Fund", asset_class=AssetClass.FIXED_INCOME),
+        ListingModel(id=1, asset_id=1, exchange_id=1, ticker="STK", currency="USD"),
+        ListingModel(id=2, asset_id=2, exchange_id=1, ticker="BND", currency="USD"),
+        ListingModel(id=3, asset_id=1, exchange_id=2, ticker="STK.L", currency="GBP"),
+    ])
+    for listing_id, close in [(1, 10), (2, 50), (3, 8)]:
+        session.add(ListingLatestPriceModel(listing_id=listing_id, date=date(2024, 6, 28), close=close))
+    session.commit()
+    session.close()
+
+def _portfolio(client, holdings):
+    portfolio_id = client.post("/portfolios/", json={"name": "Core"}).json()["id"]
+    response = client.put(f"/portfolios/{portfolio_id}/holdings", json={"holdings": holdings})
+    assert response.status_code == 200
+    return portfolio_id
+
+def test_create_and_read_portfolio(client):
+    response = client.post("/portfolios/", json={"name": "Retirement", "description": "Long term"})
+    assert response.status_code == 201
+    portfolio_id = response.json()["id"]
+
+    assert client.get(f"/portfolios/{portfolio_id}").json()["name"] == "Retirement"
+    assert [p["id"] for p in client.get("/portfolios/").json()] == [portfolio_id]
+    assert client.get("/portfolios/999").status_code == 404
+
+def test_valuation_totals_weights_and_breakdowns(client):
+    portfolio_id = _portfolio(client, [
+        {"listing_id": 1, "quantity": 30},
+        {"listing_id": 2, "quantity": 14},
+        {"listing_id": 3, "quantity": 100},
+    ])
+
+    data = client.get(f"/portfolios/{portfolio_id}/valuation").json()
+
+    # Decimals are serialised as strings, so no precision is lost in JSON
+    assert {currency: Decimal(total) for currency, total in data["totals"].items()} == {"GBP": 800, "USD": 1000}
+    assert {(b["currency"], b["key"]): b["weight"] for b in data["by_asset_class"]} == {
+        ("GBP", "EQUITY"): 1.0, ("USD", "EQUITY"): 0.3, ("USD", "FIXED_INCOME"): 0.7,
+    }
+    first = data["positions"][0]
+    assert (Decimal(first["price"]), first["price_date"], Decimal(first["market_value"])) == (10, "2024-06-28", 300)
+
+    summary = client.get(f"/portfolios/{portfolio_id}/valuation?include_positions=false").json()
+    assert summary["positions"] == [] and summary["totals"] == data["totals"]
+
+def test_replacing_holdings_validates_listings(client):
+    portfolio_id = client.post("/portfolios/", json={"name": "Core"}).json()["id"]
+
+    response = client.put(f"/portfolios/{portfolio_id}/holdings", json={"holdings": [{"listing_id": 77, "quantity": 1}]})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Listings not found: [77]"
+
+    response = client.put(f"/portfolios/{portfolio_id}/holdings", json={"holdings": [{"listing_id": 1, "quantity": 0}]})
+    assert response.status_code == 400
+
+    response = client.put(
+        f"/portfolios/{portfolio_id}/holdings",
+        json={"holdings": [{"listing_id": 1, "quantity": 1}, {"listing_id": 1, "quantity": 2}]}
+    )
+    assert response.status_code == 400
+    assert client.get(f"/portfolios/{portfolio_id}/holdings").json() == []
+
+def test_holding_quantities_keep_their_precision(client):
+    portfolio_id = _portfolio(client, [{"listing_id": 1, "quantity": "0.1234567891"}])
+
+    holdings = client.get(f"/portfolios/{portfolio_id}/holdings").json()
+    assert Decimal(holdings[0]["quantity"]) == Decimal("0.1234567891")
+
+    # More places than the column stores would be silently rounded
+    response = client.put(f"/portfolios/{portfolio_id}/holdings", json={"holdings": [{"listing_id": 1, "quantity": "0.12345678912"}]})
+    assert response.status_code == 422
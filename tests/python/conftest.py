@@ -1,6 +1,74 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 PROJECT_SRC = Path(__file__).resolve().parents[2] / "src" / "python"
 if str(PROJECT_SRC) not in sys.path:
     sys.path.insert(0, str(PROJECT_SRC))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.main import app
+from infrastructure.database.base import Base, get_db_url
+from infrastructure.database.session import get_session
+from infrastructure.services.listing_resolve_cache import RESOLVE_CACHE
+
+# Postgres, for repository tests. Every module starts from a freshly created
+# schema; modules empty the tables they write to between tests.
+
+@pytest.fixture(scope="module")
+def db_engine():
+    engine = create_engine(get_db_url())
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+
+@pytest.fixture
+def db_session(db_engine):
+    session = sessionmaker(bind=db_engine)()
+    yield session
+    session.rollback()
+    session.close()
+
+# In-memory SQLite, for API tests. Modules seed their data through
+# `api_sessions` before making requests with `client`.
+
+@pytest.fixture
+def api_engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        # One connection, so every session sees the same in-memory database
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def api_sessions(api_engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=api_engine)
+
+@pytest.fixture
+def client(api_sessions):
+    def override_get_session():
+        db = api_sessions()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    # Process-wide, so it would otherwise carry rows over from an earlier database
+    RESOLVE_CACHE.clear()
+    previous = app.dependency_overrides.get(get_session)
+    app.dependency_overrides[get_session] = override_get_session
+    yield TestClient(app)
+    if previous is None:
+        app.dependency_overrides.pop(get_session, None)
+    else:
+        app.dependency_overrides[get_session] = previous
@@ -1,32 +1,13 @@
 import pytest
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import select
 
 from core.domain.asset import Asset
 from core.domain.enums import AssetClass
 from core.domain.listing import Listing
-from infrastructure.database.base import get_db_url
-from infrastructure.database.models import Base, ExchangeModel, ListingModel
+from infrastructure.database.models import ExchangeModel
 from infrastructure.repositories.asset_repository import SqlAlchemyAssetRepository
 from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
 
-@pytest.fixture(scope="module")
-def db_engine():
-    url = get_db_url()
-    engine = create_engine(url)
-    # Drop and recreate tables
-    Base.metadata.drop_all(engine)
-    Base.metadata.create_all(engine)
-    yield engine
-    Base.metadata.drop_all(engine)
-
-@pytest.fixture(scope="function")
-def db_session(db_engine):
-    Session = sessionmaker(bind=db_engine)
-    session = Session()
-    yield session
-    session.close()
-
 @pytest.fixture
 def exchange(db_session):
     stmt = select(ExchangeModel).where(ExchangeModel.mic_code == "XNAS")
@@ -149,3 +130,47 @@ def test_unique_ticker_per_exchange(asset_repo, listing_repo, exchange):
 
     with pytest.raises(Exception):
         listing_repo.create(listing2)
+
+def test_upsert_many_assets_and_listings(asset_repo, listing_repo, exchange):
+    assets = [
+        Asset(name="Bulk One", asset_class=AssetClass.EQUITY, isin="US0000000011"),
+        Asset(name="Bulk Crypto", asset_class=AssetClass.CRYPTOCURRENCY),
+        Asset(name="Bulk One Renamed", asset_class=AssetClass.EQUITY, isin="US0000000011"),
+    ]
+    saved = asset_repo.upsert_many(assets)
+
+    assert len(saved) == 3
+    # Duplicate ISINs collapse onto one row, last write wins
+    assert saved[0].id == saved[2].id
+    assert saved[2].name == "Bulk One Renamed"
+    assert saved[1].isin is None
+
+    # Re-running updates in place instead of duplicating
+    again = asset_repo.upsert_many([Asset(name="Bulk Crypto", asset_class=AssetClass.CRYPTOCURRENCY)])
+    assert again[0].id == saved[1].id
+
+    listings = listing_repo.upsert_many([
+        Listing(asset_id=saved[0].id, exchange_id=exchange.id, ticker="BULK1", currency="USD"),
+        Listing(asset_id=saved[1].id, exchange_id=exchange.id, ticker="BULKC", currency="USD"),
+    ])
+    assert [l.ticker for l in listings] == ["BULK1", "BULKC"]
+
+    updated = listing_repo.upsert_many([
+        Listing(asset_id=saved[0].id, exchange_id=exchange.id, ticker="BULK1", currency="EUR"),
+    ])
+    assert updated[0].id == listings[0].id
+    assert updated[0].currency == "EUR"
+
+def test_mark_synced_does_not_touch_updated_at(asset_repo, listing_repo, exchange):
+    asset = asset_repo.create(Asset(name="Sync State Corp", asset_class=AssetClass.EQUITY))
+    listing = listing_repo.upsert(Listing(
+        asset_id=asset.id, exchange_id=exchange.id, ticker="SYNC", currency="USD", content_hash="abc"
+    ))
+    assert listing.synced_at is not None
+
+    listing_repo.mark_synced([listing.id])
+
+    [reloaded] = listing_repo.get_by_tickers(["SYNC", "MISSING"])
+    assert reloaded.content_hash == "abc"
+    assert reloaded.updated_at == listing.updated_at
+    assert reloaded.synced_at >= listing.synced_at
@@ -0,0 +1,105 @@
+import pytest
+from sqlalchemy import text
+
+from core.domain.asset import Asset, AssetFilter
+from core.domain.enums import AssetClass
+from core.domain.listing import Listing
+from infrastructure.database.models import ExchangeModel
+from infrastructure.repositories.asset_repository import SqlAlchemyAssetRepository
+from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
+
+@pytest.fixture(autouse=True)
+def empty_tables(db_session):
+    yield
+    db_session.rollback()
+    db_session.execute(text("TRUNCATE listings, assets, exchanges CASCADE"))
+    db_session.commit()
+
+@pytest.fixture
+def trigram(db_session):
+    installed = db_session.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first()
+    if installed is None:
+        pytest.skip("pg_trgm is not available on this server")
+
+@pytest.fixture
+def catalog(db_session):
+    nasdaq = ExchangeModel(name="NASDAQ", mic_code="XNAS", currency="USD")
+    xetra = ExchangeModel(name="Xetra", mic_code="XETR", currency="EUR")
+    db_session.add_all([nasdaq, xetra])
+    db_session.commit()
+    assets = {
+        a.name: a for a in SqlAlchemyAssetRepository(db_session).upsert_many([
+            Asset(name="Apple Inc.", asset_class=AssetClass.EQUITY, isin="US0378331005"),
+            Asset(name="Applied Materials Inc.", asset_class=AssetClass.EQUITY, isin="US0382221051"),
+            Asset(name="Microsoft Corporation", asset_class=AssetClass.EQUITY, isin="US5949181045"),
+            Asset(name="iShares Core Apple Bond", asset_class=AssetClass.FIXED_INCOME, isin="IE00APPLBOND"),
+            Asset(name="Snapple Holdings", asset_class=AssetClass.EQUITY, isin="US0000SNAPPL", is_active=False),
+        ])
+    }
+    SqlAlchemyListingRepository(db_session).upsert_many([
+        Listing(asset_id=assets["Apple Inc."].id, exchange_id=nasdaq.id, ticker="AAPL", currency="USD"),
+        Listing(asset_id=assets["Apple Inc."].id, exchange_id=xetra.id, ticker="APC", currency="EUR"),
+        Listing(asset_id=assets["Applied Materials Inc."].id, exchange_id=nasdaq.id, ticker="AMAT", currency="USD"),
+        Listing(asset_id=assets["Microsoft Corporation"].id, exchange_id=nasdaq.id, ticker="MSFT", currency="USD"),
+        Listing(asset_id=assets["iShares Core Apple Bond"].id, exchange_id=xetra.id, ticker="APLB", currency="EUR"),
+    ])
+    return assets
+
+def test_list_page_applies_filters(db_session, catalog):
+    repo = SqlAlchemyAssetRepository(db_session)
+
+    def names(filters):
+        page = repo.list_page(None, 10, filters)
+        assert [a.id for a in page] == sorted(a.id for a in page)
+        return {a.name for a in page}
+
+    assert names(AssetFilter(asset_class=AssetClass.FIXED_INCOME)) == {"iShares Core Apple Bond"}
+    assert names(AssetFilter(mic_code="XETR")) == {"Apple Inc.", "iShares Core Apple Bond"}
+    assert names(AssetFilter(mic_code="XNAS", currency="USD", asset_class=AssetClass.EQUITY)) == {
+        "Apple Inc.", "Applied Materials Inc.", "Microsoft Corporation"
+    }
+    assert names(AssetFilter(is_active=False)) == {"Snapple Holdings"}
+
+def test_search_tolerates_typos_and_ranks_exact_tickers_first(db_session, catalog, trigram):
+    repo = SqlAlchemyAssetRepository(db_session)
+
+    assert repo.search("Microsfot", 5)[0].asset.name == "Microsoft Corporation"
+    assert "Apple Inc." in [m.asset.name for m in repo.search("aple", 5)]
+
+    matches = repo.search("aapl", 5)
+    assert matches[0].asset.name == "Apple Inc."
+    assert matches[0].score == 1.0
+
+    # A ticker prefix
+    assert [m.asset.name for m in repo.search("MSF", 5)] == ["Microsoft Corporation"]
+
+    scores = [m.score for m in repo.search("apple", 10)]
+    assert scores == sorted(scores, reverse=True)
+
+def test_search_applies_filters(db_session, catalog, trigram):
+    repo = SqlAlchemyAssetRepository(db_session)
+
+    matches = repo.search("apple", 10, AssetFilter(asset_class=AssetClass.EQUITY, is_active=True))
+
+    assert "Apple Inc." in [m.asset.name for m in matches]
+    assert all(m.asset.asset_class == AssetClass.EQUITY and m.asset.is_active for m in matches)
+
+def test_search_pages_continue_after_the_last_match(db_session, catalog, trigram):
+    repo = SqlAlchemyAssetRepository(db_session)
+    everything = repo.search("apple", 10)
+    assert len(everything) >= 3
+
+    first = repo.search("apple", 2)
+    rest = repo.search("apple", 10, after=(first[-1].score, first[-1].asset.id))
+
+    assert [m.asset.id for m in first + rest] == [m.asset.id for m in everything]
+
+def test_search_is_served_by_the_trigram_indexes(db_session, catalog, trigram):
+    # Tables this small would be scanned anyway, so rule that out to see the indexes are usable
+    db_session.execute(text("SET LOCAL enable_seqscan = off"))
+
+    def plan(sql):
+        return "\n".join(db_session.execute(text("EXPLAIN " + sql)).scalars())
+
+    assert "ix_assets_name_trgm" in plan("SELECT id FROM assets WHERE name %> 'aple'")
+    assert "ix_listings_ticker_trgm" in plan("SELECT asset_id FROM listings WHERE ticker % 'aple' OR ticker ILIKE 'aple%'")
@@ -0,0 +1,16 @@
+from core.domain.enums import ExchangeCodeKind
+from core.domain.exchange_mapping import ExchangeMapping
+from infrastructure.repositories.exchange_repository import SqlAlchemyExchangeRepository
+
+def test_upsert_exchange_mapping(db_session):
+    repo = SqlAlchemyExchangeRepository(db_session)
+
+    repo.upsert_mapping(ExchangeMapping(provider="yfinance", kind="TICKER_SUFFIX", code=".L", mic_code="XLON"))
+    updated = repo.upsert_mapping(ExchangeMapping(provider="yfinance", kind="TICKER_SUFFIX", code=".L", mic_code="XLSE"))
+    repo.upsert_mapping(ExchangeMapping(provider="other", kind="TICKER_SUFFIX", code=".L", mic_code="XLON"))
+
+    mappings = repo.list_mappings("yfinance")
+    assert len(mappings) == 1
+    assert mappings[0].id == updated.id
+    assert mappings[0].kind == ExchangeCodeKind.TICKER_SUFFIX
+    assert mappings[0].mic_code == "XLSE"
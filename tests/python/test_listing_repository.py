@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import event, text
+
+from core.domain.asset import Asset
+from core.domain.enums import AssetClass
+from core.domain.listing import Listing
+from infrastructure.database.models import ExchangeModel
+from infrastructure.repositories.asset_repository import SqlAlchemyAssetRepository
+from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
+from infrastructure.services.listing_resolve_cache import ListingResolveCache
+
+@pytest.fixture(autouse=True)
+def empty_tables(db_session):
+    yield
+    db_session.rollback()
+    db_session.execute(text("TRUNCATE listings, assets, exchanges CASCADE"))
+    db_session.commit()
+
+@pytest.fixture
+def listings(db_session):
+    exchange = ExchangeModel(name="NASDAQ", mic_code="XNAS", currency="USD")
+    db_session.add(exchange)
+    db_session.commit()
+    asset = SqlAlchemyAssetRepository(db_session).create(Asset(name="Stream Corp", asset_class=AssetClass.EQUITY))
+    return SqlAlchemyListingRepository(db_session).upsert_many([
+        Listing(asset_id=asset.id, exchange_id=exchange.id, ticker=f"S{i}", currency="USD") for i in range(5)
+    ])
+
+def test_stream_catalog_reads_batches_from_a_server_side_cursor(db_session, listings):
+    repo = SqlAlchemyListingRepository(db_session)
+
+    batches = repo.stream_catalog(batch_size=2)
+    first = next(batches)
+    open_cursors = db_session.execute(text("SELECT count(*) FROM pg_cursors")).scalar()
+    rest = list(batches)
+
+    assert open_cursors == 1
+    assert [len(b) for b in [first] + rest] == [2, 2, 1]
+    entries = [e for b in [first] + rest for e in b]
+    assert [e.listing_id for e in entries] == sorted(l.id for l in listings)
+    assert (entries[0].asset_name, entries[0].asset_class, entries[0].mic_code) == ("Stream Corp", "EQUITY", "XNAS")
+    assert db_session.execute(text("SELECT count(*) FROM pg_cursors")).scalar() == 0
+
+def test_stream_catalog_closes_its_cursor_when_abandoned(db_session, listings):
+    batches = SqlAlchemyListingRepository(db_session).stream_catalog(batch_size=2)
+    next(batches)
+    batches.close()
+
+    assert db_session.execute(text("SELECT count(*) FROM pg_cursors")).scalar() == 0
+
+def test_upserts_invalidate_cached_resolutions(db_session, listings):
+    repo = SqlAlchemyListingRepository(db_session, resolve_cache=ListingResolveCache())
+    listing = listings[0]
+    assert [r.listing.currency for r in repo.resolve(listing.ticker, "XNAS")] == ["USD"]
+
+    listing.currency = "EUR"
+    repo.upsert(listing)
+    assert [r.listing.currency for r in repo.resolve(listing.ticker, "XNAS")] == ["EUR"]
+
+    listing.currency = "GBP"
+    repo.upsert_many([listing])
+    assert [r.listing.currency for r in repo.resolve(listing.ticker, None)] == ["GBP"]
+
+def test_get_by_ids_binds_every_id_as_one_array(db_engine, db_session, listings):
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    # Including one past the integer range, which must count as not found
+    ids = [l.id for l in listings] + list(range(10_000_000, 10_003_000)) + [3_000_000_000]
+    event.listen(db_engine, "before_cursor_execute", record)
+    try:
+        found = SqlAlchemyListingRepository(db_session).get_by_ids(ids)
+    finally:
+        event.remove(db_engine, "before_cursor_execute", record)
+
+    assert sorted(l.id for l in found) == sorted(l.id for l in listings)
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+    assert "= ANY (" in statement and len(parameters) == 1
+
+def test_asset_upserts_invalidate_cached_resolutions(db_session, listings):
+    cache = ListingResolveCache()
+    repo = SqlAlchemyListingRepository(db_session, resolve_cache=cache)
+    assert [r.asset.is_active for r in repo.resolve(listings[0].ticker)] == [True]
+
+    SqlAlchemyAssetRepository(db_session, resolve_cache=cache).upsert(
+        Asset(name="Stream Corp", asset_class=AssetClass.EQUITY, is_active=False)
+    )
+
+    assert [r.asset.is_active for r in repo.resolve(listings[0].ticker)] == [False]
@@ -0,0 +1,75 @@
+from datetime import date
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+
+from core.domain.asset import Asset
+from core.domain.enums import AssetClass
+from core.domain.listing import Listing
+from core.domain.portfolio import Holding, Portfolio
+from core.domain.price_bar import PriceBar
+from infrastructure.database.models import ExchangeModel
+from infrastructure.repositories.asset_repository import SqlAlchemyAssetRepository
+from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
+from infrastructure.repositories.portfolio_repository import SqlAlchemyPortfolioRepository
+from infrastructure.repositories.price_repository import SqlAlchemyPriceRepository
+
+@pytest.fixture(autouse=True)
+def empty_tables(db_session):
+    yield
+    db_session.rollback()
+    db_session.execute(text("TRUNCATE portfolios, portfolio_holdings, listing_prices, listings, assets, exchanges CASCADE"))
+    db_session.commit()
+
+@pytest.fixture
+def listings(db_session):
+    nasdaq = ExchangeModel(name="NASDAQ", mic_code="XNAS", currency="USD")
+    lse = ExchangeModel(name="London Stock Exchange", mic_code="XLON", currency="GBP")
+    db_session.add_all([nasdaq, lse])
+    db_session.commit()
+    assets = SqlAlchemyAssetRepository(db_session)
+    stock = assets.create(Asset(name="Stock Corp", asset_class=AssetClass.EQUITY))
+    bond = assets.create(Asset(name="Bond Fund", asset_class=AssetClass.FIXED_INCOME))
+    repo = SqlAlchemyListingRepository(db_session)
+    return [
+        repo.create(Listing(asset_id=stock.id, exchange_id=nasdaq.id, ticker="STK", currency="USD")),
+        repo.create(Listing(asset_id=stock.id, exchange_id=lse.id, ticker="STK.L", currency="GBP")),
+        repo.create(Listing(asset_id=bond.id, exchange_id=nasdaq.id, ticker="BND", currency="USD")),
+    ]
+
+def test_replace_holdings_swaps_the_whole_set(db_session, listings):
+    repo = SqlAlchemyPortfolioRepository(db_session)
+    portfolio = repo.create(Portfolio(name="Core"))
+
+    repo.replace_holdings(portfolio.id, [Holding(portfolio.id, listings[0].id, 10), Holding(portfolio.id, listings[1].id, 5)])
+    holdings = repo.replace_holdings(portfolio.id, [Holding(portfolio.id, listings[1].id, -2.5)])
+
+    assert [(h.listing_id, h.quantity) for h in holdings] == [(listings[1].id, -2.5)]
+    assert repo.get_holdings(portfolio.id) == holdings
+
+def test_load_positions_joins_the_latest_close(db_session, listings):
+    prices = SqlAlchemyPriceRepository(db_session)
+    prices.bulk_load([
+        PriceBar(listing_id=listings[0].id, date=date(2024, 6, 27), open=1, high=12, low=1, close=11),
+        PriceBar(listing_id=listings[0].id, date=date(2024, 6, 28), open=1, high=12, low=1, close=12),
+        PriceBar(listing_id=listings[2].id, date=date(2023, 12, 29), open=1, high=99, low=1, close=98),
+    ])
+    repo = SqlAlchemyPortfolioRepository(db_session)
+    portfolio = repo.create(Portfolio(name="Core"))
+    repo.replace_holdings(portfolio.id, [Holding(portfolio.id, listing.id, 10) for listing in listings])
+
+    positions = repo.load_positions(portfolio.id)
+
+    assert positions.listing_ids.tolist() == [listing.id for listing in listings]
+    assert positions.prices.tolist() == [12, None, 98]
+    assert positions.price_dates.astype(str).tolist() == ["2024-06-28", "NaT", "2023-12-29"]
+    assert positions.currencies.tolist() == ["USD", "GBP", "USD"]
+    assert positions.asset_classes.tolist() == ["EQUITY", "EQUITY", "FIXED_INCOME"]
+    assert positions.mic_codes.tolist() == ["XNAS", "XLON", "XNAS"]
+
+def test_load_positions_of_empty_portfolio(db_session):
+    repo = SqlAlchemyPortfolioRepository(db_session)
+    portfolio = repo.create(Portfolio(name="Empty"))
+
+    assert len(repo.load_positions(portfolio.id)) == 0
@@ -0,0 +1,225 @@
+import itertools
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+
+from core.domain.asset import Asset
+from core.domain.enums import AssetClass
+from core.domain.listing import Listing
+from core.domain.price_bar import PriceBar
+from infrastructure.database.models import ExchangeModel
+from infrastructure.repositories.asset_repository import SqlAlchemyAssetRepository
+from infrastructure.repositories.listing_repository import SqlAlchemyListingRepository
+from infrastructure.repositories.price_repository import (
+    _INT4_ELEMENT,
+    _INT4_OID,
+    SqlAlchemyPriceRepository,
+    _decode_array,
+)
+
+@pytest.fixture(autouse=True)
+def empty_tables(db_session):
+    yield
+    db_session.rollback()
+    db_session.execute(text("TRUNCATE listing_prices, listing_latest_prices"))
+    db_session.commit()
+
+_mic_codes = itertools.count()
+
+@pytest.fixture
+def listing(db_session):
+    exchange = ExchangeModel(name="NASDAQ", mic_code=f"X{next(_mic_codes):03d}", currency="USD")
+    db_session.add(exchange)
+    db_session.commit()
+    asset = SqlAlchemyAssetRepository(db_session).create(Asset(name="Price Corp", asset_class=AssetClass.EQUITY))
+    return SqlAlchemyListingRepository(db_session).create(
+        Listing(asset_id=asset.id, exchange_id=exchange.id, ticker=f"PRC{exchange.id}", currency="USD")
+    )
+
+def _bars(listing_id, start, days, close=Decimal("100.0")):
+    return [
+        PriceBar(listing_id=listing_id, date=start + timedelta(days=i), open=close, high=close + 1,
+                 low=close - 1, close=close + i * Decimal("0.5"), adj_close=close + i * Decimal("0.5"), volume=1000 + i)
+        for i in range(days)
+    ]
+
+def test_bulk_load_and_read_range(db_session, listing):
+    repo = SqlAlchemyPriceRepository(db_session)
+
+    written = repo.bulk_load(iter(_bars(listing.id, date(2024, 1, 1), 30)))
+
+    assert written == 30
+    bars = repo.get_range(listing.id, date(2024, 1, 10), date(2024, 1, 12))
+    assert [b.date for b in bars] == [date(2024, 1, 10), date(2024, 1, 11), date(2024, 1, 12)]
+    assert bars[0].close == Decimal("104.5")
+    assert bars[0].volume == 1009
+
+def test_prices_round_trip_without_float_error(db_session, listing):
+    repo = SqlAlchemyPriceRepository(db_session)
+    repo.bulk_load([PriceBar(listing.id, date(2024, 5, 2), Decimal("0.1"), Decimal("0.3"), Decimal("0.1"), Decimal("0.3"))])
+
+    [bar] = repo.get_range(listing.id, date(2024, 5, 2), date(2024, 5, 2))
+    assert (bar.open, bar.close) == (Decimal("0.1"), Decimal("0.3"))
+    assert bar.adj_close is None
+
+def test_bulk_load_keeps_the_latest_price_current(db_session, listing):
+    repo = SqlAlchemyPriceRepository(db_session)
+    listings = SqlAlchemyListingRepository(db_session)
+    history = _bars(listing.id, date(2024, 1, 1), 30)
+
+    repo.bulk_load(history[10:20])
+    assert (listings.get_by_id(listing.id).last_price, listings.get_by_id(listing.id).last_price_date) == (Decimal("109.5"), date(2024, 1, 20))
+
+    # Backfilling older bars does not move it
+    repo.bulk_load(history[:10])
+    assert listings.get_by_id(listing.id).last_price_date == date(2024, 1, 20)
+
+    # A correction of the last bar does
+    corrected = history[19]
+    corrected.close = Decimal("42")
+    repo.bulk_load([corrected])
+    assert listings.get_by_id(listing.id).last_price == Decimal("42")
+
+    repo.bulk_load(history[20:])
+    latest = listings.get_by_id(listing.id)
+    assert (latest.last_price, latest.last_price_date) == (Decimal("114.5"), date(2024, 1, 30))
+
+def test_reingesting_overlapping_range_is_idempotent(db_session, listing):
+    repo = SqlAlchemyPriceRepository(db_session)
+    history = _bars(listing.id, date(2024, 1, 1), 25)
+    repo.bulk_load(history[:20])
+
+    # Same ten days again, unchanged: nothing is rewritten
+    assert repo.bulk_load(history[10:20]) == 0
+
+    # An overlapping range with a correction and new days
+    overlap = history[15:]
+    overlap[0].close = Decimal("42")
+    assert repo.bulk_load(overlap) == 1 + 5
+
+    bars = repo.get_range(listing.id, date(2024, 1, 1), date(2024, 12, 31))
+    assert len(bars) == 25
+    assert bars[15].close == 42.0
+
+def test_duplicate_bars_in_one_load_keep_the_last(db_session, listing):
+    repo = SqlAlchemyPriceRepository(db_session)
+    first, second = _bars(listing.id, date(2024, 3, 1), 1), _bars(listing.id, date(2024, 3, 1), 1, close=Decimal("50"))
+
+    assert repo.bulk_load(first + second) == 1
+    [bar] = repo.get_range(listing.id, date(2024, 3, 1), date(2024, 3, 1))
+    assert bar.close == 50.0
+
+def test_failed_load_writes_nothing(db_session, listing):
+    repo = SqlAlchemyPriceRepository(db_session)
+    bars = _bars(listing.id, date(2024, 4, 1), 3)
+    bars.append(PriceBar(listing_id=999_999, date=date(2024, 4, 5), open=1, high=1, low=1, close=1))
+
+    with pytest.raises(Exception):
+        repo.bulk_load(bars)
+
+    assert repo.get_range(listing.id, date(2024, 4, 1), date(2024, 4, 30)) == []
+
+def _rows_per_partition(session):
+    return dict(session.execute(text(
+        "SELECT tableoid::regclass::text, count(*) FROM listing_prices GROUP BY 1"
+    )).all())
+
+def test_ensure_partitions_moves_bars_out_of_the_default_partition(db_session, listing):
+    repo = SqlAlchemyPriceRepository(db_session)
+    repo.bulk_load(_bars(listing.id, date(2010, 12, 30), 4))
+    assert _rows_per_partition(db_session) == {"listing_prices_default": 4}
+
+    assert repo.ensure_partitions(date(2010, 6, 1), date(2011, 3, 1)) == ["listing_prices_y2010", "listing_prices_y2011"]
+    assert repo.ensure_partitions(date(2010, 1, 1), date(2011, 12, 31)) == []
+
+    assert _rows_per_partition(db_session) == {"listing_prices_y2010": 2, "listing_prices_y2011": 2}
+    assert len(repo.get_range(listing.id, date(2010, 1, 1), date(2011, 12, 31))) == 4
+
+def test_range_query_only_scans_covered_partitions(db_session, listing):
+    repo = SqlAlchemyPriceRepository(db_session)
+    repo.ensure_partitions(date(2015, 1, 1), date(2020, 12, 31))
+    for year in range(2015, 2021):
+        repo.bulk_load(_bars(listing.id, date(year, 3, 1), 5))
+
+    plan = "\n".join(db_session.execute(
+        text("EXPLAIN SELECT * FROM listing_prices WHERE listing_id = :id AND date >= :start AND date <= :end"),
+        {"id": listing.id, "start": date(2018, 6, 1), "end": date(2020, 12, 31)}
+    ).scalars())
+
+    assert all(f"listing_prices_y{year}" in plan for year in (2018, 2019, 2020))
+    assert not any(f"listing_prices_y{year}" in plan for year in (2015, 2016, 2017))
+    assert "listing_prices_default" not in plan
+
+def test_detach_partitions_before_keeps_the_data_aside(db_session, listing):
+    repo = SqlAlchemyPriceRepository(db_session)
+    repo.ensure_partitions(date(2000, 1, 1), date(2001, 12, 31))
+    repo.bulk_load(_bars(listing.id, date(2000, 12, 30), 4))
+
+    try:
+        assert repo.detach_partitions_before(date(2001, 6, 1)) == ["listing_prices_y2000"]
+
+        assert [b.date for b in repo.get_range(listing.id, date(2000, 1, 1), date(2001, 12, 31))] == [
+            date(2001, 1, 1), date(2001, 1, 2)
+        ]
+        assert db_session.execute(text("SELECT count(*) FROM listing_prices_y2000")).scalar() == 2
+    finally:
+        db_session.execute(text("DROP TABLE IF EXISTS listing_prices_y2000"))
+        db_session.commit()
+
+def test_ensure_partitions_reattaches_a_detached_year(db_session, listing):
+    repo = SqlAlchemyPriceRepository(db_session)
+    repo.ensure_partitions(date(2000, 1, 1), date(2000, 12, 31))
+    repo.bulk_load(_bars(listing.id, date(2000, 12, 28), 2))
+    repo.detach_partitions_before(date(2001, 1, 1))
+    # Re-ingesting the old year: these land in the default partition, one of
+    # them a corrected bar for a day the detached table still holds
+    repo.bulk_load(_bars(listing.id, date(2000, 12, 29), 2, close=Decimal("200")))
+
+    try:
+        assert repo.ensure_partitions(date(2000, 6, 1), date(2000, 12, 31)) == ["listing_prices_y2000"]
+
+        assert _rows_per_partition(db_session) == {"listing_prices_y2000": 3}
+        assert [(b.date, b.close) for b in repo.get_range(listing.id, date(2000, 1, 1), date(2000, 12, 31))] == [
+            (date(2000, 12, 28), 100.0), (date(2000, 12, 29), 200.0), (date(2000, 12, 30), 200.5)
+        ]
+    finally:
+        db_session.rollback()
+        db_session.execute(text("DROP TABLE IF EXISTS listing_prices_y2000"))
+        db_session.commit()
+
+def test_close_matrix_aligns_listings_on_a_shared_calendar(db_session, listing):
+    repo = SqlAlchemyPriceRepository(db_session)
+    other = SqlAlchemyListingRepository(db_session).create(
+        Listing(asset_id=listing.asset_id, exchange_id=listing.exchange_id, ticker=f"{listing.ticker}.X", currency="USD")
+    )
+    repo.bulk_load(_bars(listing.id, date(2024, 5, 1), 3))
+    # Trades a day later, with an unadjusted bar
+    bars = _bars(other.id, date(2024, 5, 2), 3, close=Decimal("10"))
+    bars[0].adj_close = None
+    repo.bulk_load(bars)
+
+    matrix = repo.get_close_matrix([other.id, listing.id, 999_999], date(2024, 5, 1), date(2024, 5, 3))
+
+    assert matrix.listing_ids == [other.id, listing.id, 999_999]
+    assert [str(d) for d in matrix.dates] == ["2024-05-01", "2024-05-02", "2024-05-03"]
+    np.testing.assert_allclose(matrix.closes, [
+        [np.nan, 100.0, np.nan],
+        [10.0, 100.5, np.nan],
+        [10.5, 101.0, np.nan],
+    ], equal_nan=True)
+
+def test_decode_array_checks_the_binary_header(db_session):
+    def send(array):
+        return db_session.execute(text(f"SELECT array_send({array})")).scalar_one()
+
+    assert _decode_array(send("ARRAY[3, 1, 2]::int4[]"), _INT4_ELEMENT, _INT4_OID).tolist() == [3, 1, 2]
+    assert _decode_array(send("ARRAY[]::int4[]"), _INT4_ELEMENT, _INT4_OID).tolist() == []
+    with pytest.raises(ValueError, match="type OID"):
+        _decode_array(send("ARRAY[1.5]::float8[]"), _INT4_ELEMENT, _INT4_OID)
+    with pytest.raises(ValueError, match="NULLs"):
+        _decode_array(send("ARRAY[1, NULL]::int4[]"), _INT4_ELEMENT, _INT4_OID)
+    with pytest.raises(ValueError, match="one-dimensional"):
+        _decode_array(send("ARRAY[[1, 2], [3, 4]]::int4[]"), _INT4_ELEMENT, _INT4_OID)
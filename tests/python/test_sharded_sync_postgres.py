@@ -0,0 +1,55 @@
+import multiprocessing
+from typing import Dict, List, Optional
+
+import pytest
+from sqlalchemy import select
+
+from core.interfaces.market_data import MarketDataProvider, MarketDataAsset, MarketDataExchange
+from infrastructure.database.models import AssetModel, ExchangeModel, ListingModel
+from infrastructure.services.sharded_sync import ShardedAssetSync, shard_tickers
+
+# MSFT / MSFT.MX share an ISIN and ACME / ACME.L share a name, and each pair is
+# split across the two shards, so the shards race on the same asset rows.
+MARKET_DATA = {
+    "MSFT": MarketDataAsset("MSFT", "Microsoft", "USD", "EQUITY", "US5949181045", "XNAS"),
+    "MSFT.MX": MarketDataAsset("MSFT.MX", "Microsoft", "MXN", "EQUITY", "US5949181045", "XNAS"),
+    "ACME": MarketDataAsset("ACME", "Acme Corp", "USD", "EQUITY", None, "XNAS"),
+    "ACME.L": MarketDataAsset("ACME.L", "Acme Corp", "GBP", "EQUITY", None, "XNAS"),
+    "FOO": MarketDataAsset("FOO", "Foo Inc", "USD", "EQUITY", None, "XXXX"),
+}
+
+class FakeProvider(MarketDataProvider):
+    def get_asset_details(self, ticker: str) -> Optional[MarketDataAsset]:
+        return MARKET_DATA.get(ticker)
+
+    def get_exchange_details(self, mic_code: str) -> Optional[MarketDataExchange]:
+        return None
+
+    def get_assets_bulk(self, tickers: List[str]) -> Dict[str, Optional[MarketDataAsset]]:
+        return {t: MARKET_DATA.get(t) for t in tickers}
+
+def fake_provider_factory(shards: int) -> MarketDataProvider:
+    return FakeProvider()
+
+@pytest.fixture(autouse=True)
+def exchange(db_session):
+    db_session.add(ExchangeModel(name="NASDAQ", mic_code="XNAS", currency="USD"))
+    db_session.commit()
+
+def test_sharded_sync_merges_shards_without_duplicate_assets(db_session):
+    tickers = list(MARKET_DATA) + ["MISSING"]
+    assert all(shard_tickers(["MSFT", "MSFT.MX", "ACME", "ACME.L"], 2))
+
+    sync = ShardedAssetSync(2, provider_factory=fake_provider_factory, mp_context=multiprocessing.get_context("fork"))
+    summary = sync.sync_assets(tickers, batch_size=10)
+
+    assert summary.requested == 6
+    assert summary.synced == 4
+    assert summary.unknown_exchanges == {"XXXX": 1}
+    assert summary.skipped["MISSING"] == "No market data"
+    assert summary.failed == {}
+
+    assets = db_session.execute(select(AssetModel)).scalars().all()
+    assert sorted(a.name for a in assets) == ["Acme Corp", "Microsoft"]
+    listings = db_session.execute(select(ListingModel)).scalars().all()
+    assert sorted(l.ticker for l in listings) == ["ACME", "ACME.L", "MSFT", "MSFT.MX"]
@@ -0,0 +1,74 @@
+import threading
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from core.domain.enums import SyncJobStatus
+from core.domain.sync_job import SyncJob
+from infrastructure.database.models import SyncJobModel
+from infrastructure.repositories.sync_job_repository import SqlAlchemySyncJobRepository
+
+def test_concurrent_workers_claim_different_sync_jobs(db_engine, db_session):
+    Session = sessionmaker(bind=db_engine)
+    first_repo = SqlAlchemySyncJobRepository(db_session)
+    first = first_repo.enqueue(SyncJob(tickers=["AAPL"])).job
+    second = first_repo.enqueue(SyncJob(tickers=["MSFT"])).job
+
+    other_session = Session()
+    try:
+        # Hold the lock on the first job while the second worker polls
+        locked = db_session.execute(
+            select(SyncJobModel).where(SyncJobModel.id == first.id).with_for_update()
+        ).scalar_one()
+        claimed = SqlAlchemySyncJobRepository(other_session).claim_next("worker-2")
+        assert claimed.id == second.id
+        assert claimed.status == SyncJobStatus.RUNNING
+        assert [i.ticker for i in claimed.items] == ["MSFT"]
+        db_session.rollback()
+
+        claimed = first_repo.claim_next("worker-1")
+        assert claimed.id == locked.id
+        assert first_repo.claim_next("worker-1") is None
+    finally:
+        other_session.close()
+
+def test_concurrent_enqueues_schedule_each_ticker_once(db_engine):
+    Session = sessionmaker(bind=db_engine)
+    tickers = [f"T{i}" for i in range(50)]
+    barrier = threading.Barrier(4)
+    results = []
+
+    def enqueue(offset):
+        session = Session()
+        try:
+            barrier.wait()
+            # Overlapping, differently ordered windows of the same universe
+            window = tickers[offset:] + tickers[:offset]
+            results.append(SqlAlchemySyncJobRepository(session).enqueue(SyncJob(tickers=window[:30])))
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=enqueue, args=(i * 10,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    scheduled = [t for r in results if r.job for t in r.job.tickers]
+    assert sorted(scheduled) == sorted(set(scheduled))
+    assert len(scheduled) + sum(len(r.coalesced) for r in results) == 4 * 30
+    job_ids = {r.job.id for r in results if r.job}
+    assert all(job_id in job_ids for r in results for job_id in r.coalesced.values())
+
+def test_enqueue_more_tickers_than_one_statement_can_bind(db_session):
+    repo = SqlAlchemySyncJobRepository(db_session)
+    # Three parameters per ticker would pass Postgres' 65535 limit in one insert
+    tickers = [f"U{i}" for i in range(25_000)]
+
+    result = repo.enqueue(SyncJob(tickers=tickers))
+    assert len(result.job.tickers) == 25_000
+
+    again = repo.enqueue(SyncJob(tickers=tickers + ["NEW"]))
+    assert again.job.tickers == ["NEW"]
+    assert set(again.coalesced.values()) == {result.job.id}